@@ -1,6 +1,6 @@
 import struct
-from utils import set_bits
-from typing import Union
+from array import array
+from typing import Any, Sequence, Tuple, Union
 
 COMMAND_SUBMISSION_MODE_INCREASING_OLD = 0
 COMMAND_SUBMISSION_MODE_INCREASING = 1
@@ -16,19 +16,29 @@ SUBCHANNEL_ID_2D = 3
 SUBCHANNEL_ID_DMA = 4
 
 # Internal utils
+# Method header layout, the same as the NVB06F_DMA_* fields of the host class.
 _METHOD_OFFSET = 0
 _METHOD_SIZE = 12
 
 _SUBCHANNEL_OFFSET = 13
-_SUBCHANNEL_SIZE = 4
+_SUBCHANNEL_SIZE = 3
 
 _ARGUMENT_OFFSET = 16
-_ARGUMENT_SIZE = 11
-
-# FIXME: bit 28 is probably related to interruption modeling
+_ARGUMENT_SIZE = 13
 
 _SUBMISSION_MODE_OFFSET = 29
-_SUBMISSION_MODE_SIZE = 2
+_SUBMISSION_MODE_SIZE = 3
+
+_METHOD_MASK = (1 << _METHOD_SIZE) - 1
+_SUBCHANNEL_MASK = (1 << _SUBCHANNEL_SIZE) - 1
+_ARGUMENT_MASK = (1 << _ARGUMENT_SIZE) - 1
+_SUBMISSION_MODE_MASK = (1 << _SUBMISSION_MODE_SIZE) - 1
+
+# Immediate data shares the count field.
+_INLINE_ARGUMENT_MAX = _ARGUMENT_MASK
+
+# Largest number of arguments following a single method header.
+MAX_COMMAND_ARGUMENT_COUNT = _ARGUMENT_MASK
 
 def InlineCommand(method: int, subchannel: int, argument: int, is_raw_method: bool = False) -> int:
     return Command(method, subchannel, argument, COMMAND_SUBMISSION_MODE_INLINE, is_raw_method)
@@ -41,15 +51,45 @@ def NonIncrCommand(method: int, subchannel: int, argument: int, is_raw_method: b
 
 def Command(method: int, subchannel: int, argument: int, submission_mode: int, is_raw_method: bool = False) -> int:
     if not is_raw_method:
-        method //= 4
+        method >>= 2
+
+    # Out of range values would silently spill into or get cut from the neighbouring fields.
+    assert method <= _METHOD_MASK and argument <= _ARGUMENT_MASK
 
-    value = 0
-    value |= set_bits(_METHOD_OFFSET, _METHOD_SIZE, method)
-    value |= set_bits(_SUBCHANNEL_OFFSET, _SUBCHANNEL_SIZE, subchannel)
-    value |= set_bits(_ARGUMENT_OFFSET, _ARGUMENT_SIZE, argument)
-    value |= set_bits(_SUBMISSION_MODE_OFFSET, _SUBMISSION_MODE_SIZE, submission_mode)
+    return (
+        ((method & _METHOD_MASK) << _METHOD_OFFSET)
+        | ((subchannel & _SUBCHANNEL_MASK) << _SUBCHANNEL_OFFSET)
+        | ((argument & _ARGUMENT_MASK) << _ARGUMENT_OFFSET)
+        | ((submission_mode & _SUBMISSION_MODE_MASK) << _SUBMISSION_MODE_OFFSET)
+    )
 
-    return value
+def DecodeCommand(value: int) -> Tuple[int, int, int, int]:
+    method = (value >> _METHOD_OFFSET) & _METHOD_MASK
+    subchannel = (value >> _SUBCHANNEL_OFFSET) & _SUBCHANNEL_MASK
+    argument = (value >> _ARGUMENT_OFFSET) & _ARGUMENT_MASK
+    submission_mode = (value >> _SUBMISSION_MODE_OFFSET) & _SUBMISSION_MODE_MASK
+
+    return (method << 2, subchannel, argument, submission_mode)
+
+def EncodeCommands(methods: Any, subchannels: Any, arguments: Any, submission_modes: Any, is_raw_method: bool = False) -> Any:
+    # NOTE: numpy is only needed by this helper.
+    import numpy
+
+    methods = numpy.asarray(methods, dtype=numpy.uint32)
+
+    if not is_raw_method:
+        methods = methods >> 2
+
+    arguments = numpy.asarray(arguments, dtype=numpy.uint32)
+
+    assert methods.size == 0 or (methods.max() <= _METHOD_MASK and arguments.max() <= _ARGUMENT_MASK)
+
+    return (
+        ((methods & _METHOD_MASK) << _METHOD_OFFSET)
+        | ((numpy.asarray(subchannels, dtype=numpy.uint32) & _SUBCHANNEL_MASK) << _SUBCHANNEL_OFFSET)
+        | ((arguments & _ARGUMENT_MASK) << _ARGUMENT_OFFSET)
+        | ((numpy.asarray(submission_modes, dtype=numpy.uint32) & _SUBMISSION_MODE_MASK) << _SUBMISSION_MODE_OFFSET)
+    ).astype(numpy.uint32)
 
 # Setup utils
 BIND_CHANNEL_3D = IncrCommand(0x0, SUBCHANNEL_ID_3D, 1)
@@ -59,18 +99,108 @@ BIND_CHANNEL_2D = IncrCommand(0x0, SUBCHANNEL_ID_2D, 1)
 BIND_CHANNEL_DMA = IncrCommand(0x0, SUBCHANNEL_ID_DMA, 1)
 
 
+_U32 = struct.Struct("I")
+_U32_PAIR = struct.Struct("II")
+
+
 class CommandBuffer(object):
-    buffer: bytearray
+    DEFAULT_CAPACITY: int = 0x1000
+
+    _storage: bytearray
+    size: int
+
+    def __init__(self, capacity: int = DEFAULT_CAPACITY) -> None:
+        self._storage = bytearray(max(capacity, 4))
+        self.size = 0
+
+    def __len__(self) -> int:
+        return self.size
+
+    @property
+    def buffer(self) -> memoryview:
+        return memoryview(self._storage)[: self.size]
 
-    def __init__(self) -> None:
-        self.buffer = bytearray()
+    @property
+    def capacity(self) -> int:
+        return len(self._storage)
+
+    def clear(self) -> None:
+        self.size = 0
+
+    def reserve(self, word_count: int) -> None:
+        required_size = self.size + word_count * 4
+
+        if required_size > len(self._storage):
+            self._grow(required_size)
+
+    def _grow(self, required_size: int) -> None:
+        # NOTE: We never resize in place as views returned by buffer may still be alive.
+        new_capacity = len(self._storage) * 2
+
+        while new_capacity < required_size:
+            new_capacity *= 2
+
+        storage = bytearray(new_capacity)
+        storage[: self.size] = memoryview(self._storage)[: self.size]
+        self._storage = storage
 
     def write_u32(self, data: int) -> None:
-        self.write_bytes(struct.pack("I", data))
+        offset = self.size
+
+        if offset + 4 > len(self._storage):
+            self._grow(offset + 4)
+
+        _U32.pack_into(self._storage, offset, data)
+        self.size = offset + 4
 
     def write_u64(self, data: int) -> None:
-        self.write_u32((data >> 32) & 0xFFFFFFFF)
-        self.write_u32(data & 0xFFFFFFFF)
+        offset = self.size
+
+        if offset + 8 > len(self._storage):
+            self._grow(offset + 8)
+
+        _U32_PAIR.pack_into(
+            self._storage, offset, (data >> 32) & 0xFFFFFFFF, data & 0xFFFFFFFF
+        )
+        self.size = offset + 8
+
+    def write_bytes(self, data: Union[bytes, bytearray, memoryview]) -> None:
+        data = memoryview(data).cast("B")
+        offset = self.size
+        end_offset = offset + len(data)
+
+        if end_offset > len(self._storage):
+            self._grow(end_offset)
+
+        self._storage[offset:end_offset] = data
+        self.size = end_offset
+
+    def write_method(
+        self,
+        method: int,
+        subchannel: int,
+        values: Union[Sequence[int], bytes, bytearray, memoryview, array],
+        is_raw_method: bool = False,
+    ) -> None:
+        if isinstance(values, (list, tuple)):
+            values = array("I", values)
+
+        data = memoryview(values).cast("B")
+        word_count = len(data) // 4
+
+        assert word_count != 0 and len(data) % 4 == 0
+
+        if word_count == 1:
+            value = data.cast("I")[0]
+
+            if value <= _INLINE_ARGUMENT_MAX:
+                self.write_u32(InlineCommand(method, subchannel, value, is_raw_method))
+                return
+
+        self.reserve(word_count + 1)
+        self.write_u32(IncrCommand(method, subchannel, word_count, is_raw_method))
 
-    def write_bytes(self, data: Union[bytes, bytearray]) -> None:
-        self.buffer += bytearray(data)
+        offset = self.size
+        end_offset = offset + len(data)
+        self._storage[offset:end_offset] = data
+        self.size = end_offset
@@ -0,0 +1,139 @@
+from concurrent.futures import Future
+from nvgpu import SubmittedCommandBuffer, SyncFence
+from select import EPOLLIN, EPOLLOUT, epoll
+from typing import Callable, Dict, List, Optional
+
+FenceCallback = Callable[[SyncFence], None]
+FenceErrorCallback = Callable[[Exception], None]
+
+
+class _PendingFence(object):
+    fence: SyncFence
+    # The fence fd is reset when it gets closed, keep the registered one around.
+    fd: int
+    callbacks: List[FenceCallback]
+    error_callbacks: List[FenceErrorCallback]
+
+    def __init__(self, fence: SyncFence) -> None:
+        self.fence = fence
+        self.fd = fence.fd
+        self.callbacks = list()
+        self.error_callbacks = list()
+
+
+class FenceReactor(object):
+    """Wait on many sync fences at once with a single epoll set"""
+
+    MAX_EVENTS: int = 64
+
+    _epoll: epoll
+    # Keyed by fd, entries are only valid while their fence still owns that fd.
+    _pending: Dict[int, _PendingFence]
+
+    def __init__(self) -> None:
+        self._epoll = epoll()
+        self._pending = dict()
+
+    @property
+    def pending_count(self) -> int:
+        return len(self._pending)
+
+    def _discard(self, pending: _PendingFence) -> None:
+        del self._pending[pending.fd]
+
+        # Closing the fd already removed it from the epoll set unless it got duplicated.
+        try:
+            self._epoll.unregister(pending.fd)
+        except OSError:
+            pass
+
+        error = Exception("Sync fence closed while registered in a FenceReactor")
+
+        for error_callback in pending.error_callbacks:
+            error_callback(error)
+
+    def _discard_closed(self) -> None:
+        for pending in list(self._pending.values()):
+            if pending.fence.fd != pending.fd:
+                self._discard(pending)
+
+    def register(
+        self,
+        fence: SyncFence,
+        callback: FenceCallback,
+        error_callback: Optional[FenceErrorCallback] = None,
+    ) -> None:
+        # Already signaled (or closed) fences complete right away.
+        if fence.is_signaled or fence.fd == -1:
+            callback(fence)
+            return
+
+        pending = self._pending.get(fence.fd)
+
+        # The fd of a fence closed while registered got reused by this one.
+        if pending is not None and pending.fence is not fence:
+            self._discard(pending)
+            pending = None
+
+        if pending is None:
+            pending = _PendingFence(fence)
+            self._pending[fence.fd] = pending
+            self._epoll.register(fence.fd, EPOLLIN | EPOLLOUT)
+
+        pending.callbacks.append(callback)
+
+        if error_callback is not None:
+            pending.error_callbacks.append(error_callback)
+
+    def watch(
+        self,
+        submitted: SubmittedCommandBuffer,
+        callback: Optional[Callable[[SubmittedCommandBuffer], None]] = None,
+    ) -> "Future[SubmittedCommandBuffer]":
+        future: "Future[SubmittedCommandBuffer]" = Future()
+
+        def on_signaled(_: SyncFence) -> None:
+            # Recycle the command buffer memory as soon as the GPU is done with it.
+            submitted.close()
+
+            if callback is not None:
+                callback(submitted)
+
+            future.set_result(submitted)
+
+        self.register(submitted.fence, on_signaled, future.set_exception)
+
+        return future
+
+    def poll(self, timeout: Optional[float] = None) -> int:
+        self._discard_closed()
+
+        if len(self._pending) == 0:
+            return 0
+
+        # NOTE: timeout is in milliseconds like SyncFence.wait.
+        events = self._epoll.poll(
+            -1 if timeout is None else timeout / 1000, self.MAX_EVENTS
+        )
+
+        for (fd, _) in events:
+            pending = self._pending.pop(fd)
+            self._epoll.unregister(fd)
+
+            pending.fence.is_signaled = True
+
+            for callback in pending.callbacks:
+                callback(pending.fence)
+
+        return len(events)
+
+    def wait_all(self, timeout: Optional[float] = None) -> bool:
+        while len(self._pending) != 0:
+            if self.poll(timeout) == 0 and timeout is not None:
+                return False
+
+        return True
+
+    def close(self) -> None:
+        self._epoll.close()
+        self._pending.clear()
@@ -438,975 +438,975 @@ NV902D_MME_DMA_WRITE_METHOD_BARRIER: int = 0xDEC
 
 
 def NV902D_SET_OBJECT_CLASS_ID(value: int) -> int:
-    return set_bits(0, 15, value)
+    return set_bits(0, 16, value)
 
 
 def NV902D_SET_OBJECT_ENGINE_ID(value: int) -> int:
-    return set_bits(16, 4, value)
+    return set_bits(16, 5, value)
 
 
 def NV902D_NO_OPERATION_V(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NV902D_SET_NOTIFY_A_ADDRESS_UPPER(value: int) -> int:
-    return set_bits(0, 24, value)
+    return set_bits(0, 25, value)
 
 
 def NV902D_SET_NOTIFY_B_ADDRESS_LOWER(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NV902D_NOTIFY_TYPE(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NV902D_WAIT_FOR_IDLE_V(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NV902D_LOAD_MME_INSTRUCTION_RAM_POINTER_V(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NV902D_LOAD_MME_INSTRUCTION_RAM_V(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NV902D_LOAD_MME_START_ADDRESS_RAM_POINTER_V(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NV902D_LOAD_MME_START_ADDRESS_RAM_V(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NV902D_SET_MME_SHADOW_RAM_CONTROL_MODE(value: int) -> int:
-    return set_bits(0, 1, value)
+    return set_bits(0, 2, value)
 
 
 def NV902D_SET_GLOBAL_RENDER_ENABLE_A_OFFSET_UPPER(value: int) -> int:
-    return set_bits(0, 7, value)
+    return set_bits(0, 8, value)
 
 
 def NV902D_SET_GLOBAL_RENDER_ENABLE_B_OFFSET_LOWER(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NV902D_SET_GLOBAL_RENDER_ENABLE_C_MODE(value: int) -> int:
-    return set_bits(0, 2, value)
+    return set_bits(0, 3, value)
 
 
 def NV902D_SEND_GO_IDLE_V(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NV902D_PM_TRIGGER_V(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NV902D_SET_INSTRUMENTATION_METHOD_HEADER_V(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NV902D_SET_INSTRUMENTATION_METHOD_DATA_V(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NV902D_SET_MME_SWITCH_STATE_VALID(value: int) -> int:
-    return set_bits(0, 0, value)
+    return set_bits(0, 1, value)
 
 
 def NV902D_SET_MME_SWITCH_STATE_SAVE_MACRO(value: int) -> int:
-    return set_bits(4, 7, value)
+    return set_bits(4, 8, value)
 
 
 def NV902D_SET_MME_SWITCH_STATE_RESTORE_MACRO(value: int) -> int:
-    return set_bits(12, 7, value)
+    return set_bits(12, 8, value)
 
 
 def NV902D_SET_DST_FORMAT_V(value: int) -> int:
-    return set_bits(0, 7, value)
+    return set_bits(0, 8, value)
 
 
 def NV902D_SET_DST_MEMORY_LAYOUT_V(value: int) -> int:
-    return set_bits(0, 0, value)
+    return set_bits(0, 1, value)
 
 
 def NV902D_SET_DST_BLOCK_SIZE_HEIGHT(value: int) -> int:
-    return set_bits(4, 2, value)
+    return set_bits(4, 3, value)
 
 
 def NV902D_SET_DST_BLOCK_SIZE_DEPTH(value: int) -> int:
-    return set_bits(8, 2, value)
+    return set_bits(8, 3, value)
 
 
 def NV902D_SET_DST_DEPTH_V(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NV902D_SET_DST_LAYER_V(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NV902D_SET_DST_PITCH_V(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NV902D_SET_DST_WIDTH_V(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NV902D_SET_DST_HEIGHT_V(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NV902D_SET_DST_OFFSET_UPPER_V(value: int) -> int:
-    return set_bits(0, 7, value)
+    return set_bits(0, 8, value)
 
 
 def NV902D_SET_DST_OFFSET_LOWER_V(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NV902D_FLUSH_AND_INVALIDATE_ROP_MINI_CACHE_V(value: int) -> int:
-    return set_bits(0, 0, value)
+    return set_bits(0, 1, value)
 
 
 def NV902D_SET_SPARE_NOOP06_V(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NV902D_SET_SRC_FORMAT_V(value: int) -> int:
-    return set_bits(0, 7, value)
+    return set_bits(0, 8, value)
 
 
 def NV902D_SET_SRC_MEMORY_LAYOUT_V(value: int) -> int:
-    return set_bits(0, 0, value)
+    return set_bits(0, 1, value)
 
 
 def NV902D_SET_SRC_BLOCK_SIZE_HEIGHT(value: int) -> int:
-    return set_bits(4, 2, value)
+    return set_bits(4, 3, value)
 
 
 def NV902D_SET_SRC_BLOCK_SIZE_DEPTH(value: int) -> int:
-    return set_bits(8, 2, value)
+    return set_bits(8, 3, value)
 
 
 def NV902D_SET_SRC_DEPTH_V(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NV902D_TWOD_INVALIDATE_TEXTURE_DATA_CACHE_V(value: int) -> int:
-    return set_bits(0, 1, value)
+    return set_bits(0, 2, value)
 
 
 def NV902D_SET_SRC_PITCH_V(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NV902D_SET_SRC_WIDTH_V(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NV902D_SET_SRC_HEIGHT_V(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NV902D_SET_SRC_OFFSET_UPPER_V(value: int) -> int:
-    return set_bits(0, 7, value)
+    return set_bits(0, 8, value)
 
 
 def NV902D_SET_SRC_OFFSET_LOWER_V(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NV902D_SET_PIXELS_FROM_MEMORY_SECTOR_PROMOTION_V(value: int) -> int:
-    return set_bits(0, 1, value)
+    return set_bits(0, 2, value)
 
 
 def NV902D_SET_SPARE_NOOP12_V(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NV902D_SET_NUM_PROCESSING_CLUSTERS_V(value: int) -> int:
-    return set_bits(0, 0, value)
+    return set_bits(0, 1, value)
 
 
 def NV902D_SET_RENDER_ENABLE_A_OFFSET_UPPER(value: int) -> int:
-    return set_bits(0, 7, value)
+    return set_bits(0, 8, value)
 
 
 def NV902D_SET_RENDER_ENABLE_B_OFFSET_LOWER(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NV902D_SET_RENDER_ENABLE_C_MODE(value: int) -> int:
-    return set_bits(0, 2, value)
+    return set_bits(0, 3, value)
 
 
 def NV902D_SET_SPARE_NOOP08_V(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NV902D_SET_SPARE_NOOP01_V(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NV902D_SET_SPARE_NOOP11_V(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NV902D_SET_SPARE_NOOP07_V(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NV902D_SET_CLIP_X0_V(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NV902D_SET_CLIP_Y0_V(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NV902D_SET_CLIP_WIDTH_V(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NV902D_SET_CLIP_HEIGHT_V(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NV902D_SET_CLIP_ENABLE_V(value: int) -> int:
-    return set_bits(0, 0, value)
+    return set_bits(0, 1, value)
 
 
 def NV902D_SET_COLOR_KEY_FORMAT_V(value: int) -> int:
-    return set_bits(0, 2, value)
+    return set_bits(0, 3, value)
 
 
 def NV902D_SET_COLOR_KEY_V(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NV902D_SET_COLOR_KEY_ENABLE_V(value: int) -> int:
-    return set_bits(0, 0, value)
+    return set_bits(0, 1, value)
 
 
 def NV902D_SET_ROP_V(value: int) -> int:
-    return set_bits(0, 7, value)
+    return set_bits(0, 8, value)
 
 
 def NV902D_SET_BETA1_V(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NV902D_SET_BETA4_B(value: int) -> int:
-    return set_bits(0, 7, value)
+    return set_bits(0, 8, value)
 
 
 def NV902D_SET_BETA4_G(value: int) -> int:
-    return set_bits(8, 7, value)
+    return set_bits(8, 8, value)
 
 
 def NV902D_SET_BETA4_R(value: int) -> int:
-    return set_bits(16, 7, value)
+    return set_bits(16, 8, value)
 
 
 def NV902D_SET_BETA4_A(value: int) -> int:
-    return set_bits(24, 7, value)
+    return set_bits(24, 8, value)
 
 
 def NV902D_SET_OPERATION_V(value: int) -> int:
-    return set_bits(0, 2, value)
+    return set_bits(0, 3, value)
 
 
 def NV902D_SET_PATTERN_OFFSET_X(value: int) -> int:
-    return set_bits(0, 5, value)
+    return set_bits(0, 6, value)
 
 
 def NV902D_SET_PATTERN_OFFSET_Y(value: int) -> int:
-    return set_bits(8, 5, value)
+    return set_bits(8, 6, value)
 
 
 def NV902D_SET_PATTERN_SELECT_V(value: int) -> int:
-    return set_bits(0, 1, value)
+    return set_bits(0, 2, value)
 
 
 def NV902D_SET_DST_COLOR_RENDER_TO_ZETA_SURFACE_V(value: int) -> int:
-    return set_bits(0, 0, value)
+    return set_bits(0, 1, value)
 
 
 def NV902D_SET_SPARE_NOOP04_V(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NV902D_SET_SPARE_NOOP15_V(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NV902D_SET_SPARE_NOOP13_V(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NV902D_SET_SPARE_NOOP03_V(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NV902D_SET_SPARE_NOOP14_V(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NV902D_SET_SPARE_NOOP02_V(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NV902D_SET_COMPRESSION_ENABLE(value: int) -> int:
-    return set_bits(0, 0, value)
+    return set_bits(0, 1, value)
 
 
 def NV902D_SET_SPARE_NOOP09_V(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NV902D_SET_RENDER_ENABLE_OVERRIDE_MODE(value: int) -> int:
-    return set_bits(0, 1, value)
+    return set_bits(0, 2, value)
 
 
 def NV902D_SET_PIXELS_FROM_MEMORY_DIRECTION_HORIZONTAL(value: int) -> int:
-    return set_bits(0, 1, value)
+    return set_bits(0, 2, value)
 
 
 def NV902D_SET_PIXELS_FROM_MEMORY_DIRECTION_VERTICAL(value: int) -> int:
-    return set_bits(4, 1, value)
+    return set_bits(4, 2, value)
 
 
 def NV902D_SET_SPARE_NOOP10_V(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NV902D_SET_MONOCHROME_PATTERN_COLOR_FORMAT_V(value: int) -> int:
-    return set_bits(0, 2, value)
+    return set_bits(0, 3, value)
 
 
 def NV902D_SET_MONOCHROME_PATTERN_FORMAT_V(value: int) -> int:
-    return set_bits(0, 0, value)
+    return set_bits(0, 1, value)
 
 
 def NV902D_SET_MONOCHROME_PATTERN_COLOR0_V(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NV902D_SET_MONOCHROME_PATTERN_COLOR1_V(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NV902D_SET_MONOCHROME_PATTERN0_V(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NV902D_SET_MONOCHROME_PATTERN1_V(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NV902D_COLOR_PATTERN_X8R8G8B8_B0(value: int) -> int:
-    return set_bits(0, 7, value)
+    return set_bits(0, 8, value)
 
 
 def NV902D_COLOR_PATTERN_X8R8G8B8_G0(value: int) -> int:
-    return set_bits(8, 7, value)
+    return set_bits(8, 8, value)
 
 
 def NV902D_COLOR_PATTERN_X8R8G8B8_R0(value: int) -> int:
-    return set_bits(16, 7, value)
+    return set_bits(16, 8, value)
 
 
 def NV902D_COLOR_PATTERN_X8R8G8B8_IGNORE0(value: int) -> int:
-    return set_bits(24, 7, value)
+    return set_bits(24, 8, value)
 
 
 def NV902D_COLOR_PATTERN_R5G6B5_B0(value: int) -> int:
-    return set_bits(0, 4, value)
+    return set_bits(0, 5, value)
 
 
 def NV902D_COLOR_PATTERN_R5G6B5_G0(value: int) -> int:
-    return set_bits(5, 5, value)
+    return set_bits(5, 6, value)
 
 
 def NV902D_COLOR_PATTERN_R5G6B5_R0(value: int) -> int:
-    return set_bits(11, 4, value)
+    return set_bits(11, 5, value)
 
 
 def NV902D_COLOR_PATTERN_R5G6B5_B1(value: int) -> int:
-    return set_bits(16, 4, value)
+    return set_bits(16, 5, value)
 
 
 def NV902D_COLOR_PATTERN_R5G6B5_G1(value: int) -> int:
-    return set_bits(21, 5, value)
+    return set_bits(21, 6, value)
 
 
 def NV902D_COLOR_PATTERN_R5G6B5_R1(value: int) -> int:
-    return set_bits(27, 4, value)
+    return set_bits(27, 5, value)
 
 
 def NV902D_COLOR_PATTERN_X1R5G5B5_B0(value: int) -> int:
-    return set_bits(0, 4, value)
+    return set_bits(0, 5, value)
 
 
 def NV902D_COLOR_PATTERN_X1R5G5B5_G0(value: int) -> int:
-    return set_bits(5, 4, value)
+    return set_bits(5, 5, value)
 
 
 def NV902D_COLOR_PATTERN_X1R5G5B5_R0(value: int) -> int:
-    return set_bits(10, 4, value)
+    return set_bits(10, 5, value)
 
 
 def NV902D_COLOR_PATTERN_X1R5G5B5_IGNORE0(value: int) -> int:
-    return set_bits(15, 0, value)
+    return set_bits(15, 1, value)
 
 
 def NV902D_COLOR_PATTERN_X1R5G5B5_B1(value: int) -> int:
-    return set_bits(16, 4, value)
+    return set_bits(16, 5, value)
 
 
 def NV902D_COLOR_PATTERN_X1R5G5B5_G1(value: int) -> int:
-    return set_bits(21, 4, value)
+    return set_bits(21, 5, value)
 
 
 def NV902D_COLOR_PATTERN_X1R5G5B5_R1(value: int) -> int:
-    return set_bits(26, 4, value)
+    return set_bits(26, 5, value)
 
 
 def NV902D_COLOR_PATTERN_X1R5G5B5_IGNORE1(value: int) -> int:
-    return set_bits(31, 0, value)
+    return set_bits(31, 1, value)
 
 
 def NV902D_COLOR_PATTERN_Y8_Y0(value: int) -> int:
-    return set_bits(0, 7, value)
+    return set_bits(0, 8, value)
 
 
 def NV902D_COLOR_PATTERN_Y8_Y1(value: int) -> int:
-    return set_bits(8, 7, value)
+    return set_bits(8, 8, value)
 
 
 def NV902D_COLOR_PATTERN_Y8_Y2(value: int) -> int:
-    return set_bits(16, 7, value)
+    return set_bits(16, 8, value)
 
 
 def NV902D_COLOR_PATTERN_Y8_Y3(value: int) -> int:
-    return set_bits(24, 7, value)
+    return set_bits(24, 8, value)
 
 
 def NV902D_SET_RENDER_SOLID_PRIM_COLOR0_V(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NV902D_SET_RENDER_SOLID_PRIM_COLOR1_V(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NV902D_SET_RENDER_SOLID_PRIM_COLOR2_V(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NV902D_SET_RENDER_SOLID_PRIM_COLOR3_V(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NV902D_SET_MME_MEM_ADDRESS_A_UPPER(value: int) -> int:
-    return set_bits(0, 24, value)
+    return set_bits(0, 25, value)
 
 
 def NV902D_SET_MME_MEM_ADDRESS_B_LOWER(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NV902D_SET_MME_DATA_RAM_ADDRESS_WORD(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NV902D_MME_DMA_READ_LENGTH(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NV902D_MME_DMA_READ_FIFOED_LENGTH(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NV902D_MME_DMA_WRITE_LENGTH(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NV902D_MME_DMA_REDUCTION_REDUCTION_OP(value: int) -> int:
-    return set_bits(0, 2, value)
+    return set_bits(0, 3, value)
 
 
 def NV902D_MME_DMA_REDUCTION_REDUCTION_FORMAT(value: int) -> int:
-    return set_bits(4, 1, value)
+    return set_bits(4, 2, value)
 
 
 def NV902D_MME_DMA_REDUCTION_REDUCTION_SIZE(value: int) -> int:
-    return set_bits(8, 0, value)
+    return set_bits(8, 1, value)
 
 
 def NV902D_MME_DMA_SYSMEMBAR_V(value: int) -> int:
-    return set_bits(0, 0, value)
+    return set_bits(0, 1, value)
 
 
 def NV902D_MME_DMA_SYNC_VALUE(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NV902D_SET_MME_DATA_FIFO_CONFIG_FIFO_SIZE(value: int) -> int:
-    return set_bits(0, 2, value)
+    return set_bits(0, 3, value)
 
 
 def NV902D_RENDER_SOLID_PRIM_MODE_V(value: int) -> int:
-    return set_bits(0, 2, value)
+    return set_bits(0, 3, value)
 
 
 def NV902D_SET_RENDER_SOLID_PRIM_COLOR_FORMAT_V(value: int) -> int:
-    return set_bits(0, 7, value)
+    return set_bits(0, 8, value)
 
 
 def NV902D_SET_RENDER_SOLID_PRIM_COLOR_V(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NV902D_SET_RENDER_SOLID_LINE_TIE_BREAK_BITS_XMAJ__XINC__YINC(value: int) -> int:
-    return set_bits(0, 0, value)
+    return set_bits(0, 1, value)
 
 
 def NV902D_SET_RENDER_SOLID_LINE_TIE_BREAK_BITS_XMAJ__XDEC__YINC(value: int) -> int:
-    return set_bits(4, 0, value)
+    return set_bits(4, 1, value)
 
 
 def NV902D_SET_RENDER_SOLID_LINE_TIE_BREAK_BITS_YMAJ__XINC__YINC(value: int) -> int:
-    return set_bits(8, 0, value)
+    return set_bits(8, 1, value)
 
 
 def NV902D_SET_RENDER_SOLID_LINE_TIE_BREAK_BITS_YMAJ__XDEC__YINC(value: int) -> int:
-    return set_bits(12, 0, value)
+    return set_bits(12, 1, value)
 
 
 def NV902D_RENDER_SOLID_PRIM_POINT_X_Y_X(value: int) -> int:
-    return set_bits(0, 15, value)
+    return set_bits(0, 16, value)
 
 
 def NV902D_RENDER_SOLID_PRIM_POINT_X_Y_Y(value: int) -> int:
-    return set_bits(16, 15, value)
+    return set_bits(16, 16, value)
 
 
 def NV902D_RENDER_SOLID_PRIM_POINT_SET_X_V(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NV902D_RENDER_SOLID_PRIM_POINT_Y_V(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NV902D_SET_PIXELS_FROM_CPU_DATA_TYPE_V(value: int) -> int:
-    return set_bits(0, 0, value)
+    return set_bits(0, 1, value)
 
 
 def NV902D_SET_PIXELS_FROM_CPU_COLOR_FORMAT_V(value: int) -> int:
-    return set_bits(0, 7, value)
+    return set_bits(0, 8, value)
 
 
 def NV902D_SET_PIXELS_FROM_CPU_INDEX_FORMAT_V(value: int) -> int:
-    return set_bits(0, 1, value)
+    return set_bits(0, 2, value)
 
 
 def NV902D_SET_PIXELS_FROM_CPU_MONO_FORMAT_V(value: int) -> int:
-    return set_bits(0, 0, value)
+    return set_bits(0, 1, value)
 
 
 def NV902D_SET_PIXELS_FROM_CPU_WRAP_V(value: int) -> int:
-    return set_bits(0, 1, value)
+    return set_bits(0, 2, value)
 
 
 def NV902D_SET_PIXELS_FROM_CPU_COLOR0_V(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NV902D_SET_PIXELS_FROM_CPU_COLOR1_V(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NV902D_SET_PIXELS_FROM_CPU_MONO_OPACITY_V(value: int) -> int:
-    return set_bits(0, 0, value)
+    return set_bits(0, 1, value)
 
 
 def NV902D_SET_PIXELS_FROM_CPU_SRC_WIDTH_V(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NV902D_SET_PIXELS_FROM_CPU_SRC_HEIGHT_V(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NV902D_SET_PIXELS_FROM_CPU_DX_DU_FRAC_V(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NV902D_SET_PIXELS_FROM_CPU_DX_DU_INT_V(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NV902D_SET_PIXELS_FROM_CPU_DY_DV_FRAC_V(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NV902D_SET_PIXELS_FROM_CPU_DY_DV_INT_V(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NV902D_SET_PIXELS_FROM_CPU_DST_X0_FRAC_V(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NV902D_SET_PIXELS_FROM_CPU_DST_X0_INT_V(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NV902D_SET_PIXELS_FROM_CPU_DST_Y0_FRAC_V(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NV902D_SET_PIXELS_FROM_CPU_DST_Y0_INT_V(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NV902D_PIXELS_FROM_CPU_DATA_V(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NV902D_SET_BIG_ENDIAN_CONTROL_X32_SWAP_1(value: int) -> int:
-    return set_bits(0, 0, value)
+    return set_bits(0, 1, value)
 
 
 def NV902D_SET_BIG_ENDIAN_CONTROL_X32_SWAP_4(value: int) -> int:
-    return set_bits(1, 0, value)
+    return set_bits(1, 1, value)
 
 
 def NV902D_SET_BIG_ENDIAN_CONTROL_X32_SWAP_8(value: int) -> int:
-    return set_bits(2, 0, value)
+    return set_bits(2, 1, value)
 
 
 def NV902D_SET_BIG_ENDIAN_CONTROL_X32_SWAP_16(value: int) -> int:
-    return set_bits(3, 0, value)
+    return set_bits(3, 1, value)
 
 
 def NV902D_SET_BIG_ENDIAN_CONTROL_X16_SWAP_1(value: int) -> int:
-    return set_bits(4, 0, value)
+    return set_bits(4, 1, value)
 
 
 def NV902D_SET_BIG_ENDIAN_CONTROL_X16_SWAP_4(value: int) -> int:
-    return set_bits(5, 0, value)
+    return set_bits(5, 1, value)
 
 
 def NV902D_SET_BIG_ENDIAN_CONTROL_X16_SWAP_8(value: int) -> int:
-    return set_bits(6, 0, value)
+    return set_bits(6, 1, value)
 
 
 def NV902D_SET_BIG_ENDIAN_CONTROL_X16_SWAP_16(value: int) -> int:
-    return set_bits(7, 0, value)
+    return set_bits(7, 1, value)
 
 
 def NV902D_SET_BIG_ENDIAN_CONTROL_X8_SWAP_1(value: int) -> int:
-    return set_bits(8, 0, value)
+    return set_bits(8, 1, value)
 
 
 def NV902D_SET_BIG_ENDIAN_CONTROL_X8_SWAP_4(value: int) -> int:
-    return set_bits(9, 0, value)
+    return set_bits(9, 1, value)
 
 
 def NV902D_SET_BIG_ENDIAN_CONTROL_X8_SWAP_8(value: int) -> int:
-    return set_bits(10, 0, value)
+    return set_bits(10, 1, value)
 
 
 def NV902D_SET_BIG_ENDIAN_CONTROL_X8_SWAP_16(value: int) -> int:
-    return set_bits(11, 0, value)
+    return set_bits(11, 1, value)
 
 
 def NV902D_SET_BIG_ENDIAN_CONTROL_I1_X8_CGA6_SWAP_1(value: int) -> int:
-    return set_bits(12, 0, value)
+    return set_bits(12, 1, value)
 
 
 def NV902D_SET_BIG_ENDIAN_CONTROL_I1_X8_CGA6_SWAP_4(value: int) -> int:
-    return set_bits(13, 0, value)
+    return set_bits(13, 1, value)
 
 
 def NV902D_SET_BIG_ENDIAN_CONTROL_I1_X8_CGA6_SWAP_8(value: int) -> int:
-    return set_bits(14, 0, value)
+    return set_bits(14, 1, value)
 
 
 def NV902D_SET_BIG_ENDIAN_CONTROL_I1_X8_CGA6_SWAP_16(value: int) -> int:
-    return set_bits(15, 0, value)
+    return set_bits(15, 1, value)
 
 
 def NV902D_SET_BIG_ENDIAN_CONTROL_I1_X8_LE_SWAP_1(value: int) -> int:
-    return set_bits(16, 0, value)
+    return set_bits(16, 1, value)
 
 
 def NV902D_SET_BIG_ENDIAN_CONTROL_I1_X8_LE_SWAP_4(value: int) -> int:
-    return set_bits(17, 0, value)
+    return set_bits(17, 1, value)
 
 
 def NV902D_SET_BIG_ENDIAN_CONTROL_I1_X8_LE_SWAP_8(value: int) -> int:
-    return set_bits(18, 0, value)
+    return set_bits(18, 1, value)
 
 
 def NV902D_SET_BIG_ENDIAN_CONTROL_I1_X8_LE_SWAP_16(value: int) -> int:
-    return set_bits(19, 0, value)
+    return set_bits(19, 1, value)
 
 
 def NV902D_SET_BIG_ENDIAN_CONTROL_I4_SWAP_1(value: int) -> int:
-    return set_bits(20, 0, value)
+    return set_bits(20, 1, value)
 
 
 def NV902D_SET_BIG_ENDIAN_CONTROL_I4_SWAP_4(value: int) -> int:
-    return set_bits(21, 0, value)
+    return set_bits(21, 1, value)
 
 
 def NV902D_SET_BIG_ENDIAN_CONTROL_I4_SWAP_8(value: int) -> int:
-    return set_bits(22, 0, value)
+    return set_bits(22, 1, value)
 
 
 def NV902D_SET_BIG_ENDIAN_CONTROL_I4_SWAP_16(value: int) -> int:
-    return set_bits(23, 0, value)
+    return set_bits(23, 1, value)
 
 
 def NV902D_SET_BIG_ENDIAN_CONTROL_I8_SWAP_1(value: int) -> int:
-    return set_bits(24, 0, value)
+    return set_bits(24, 1, value)
 
 
 def NV902D_SET_BIG_ENDIAN_CONTROL_I8_SWAP_4(value: int) -> int:
-    return set_bits(25, 0, value)
+    return set_bits(25, 1, value)
 
 
 def NV902D_SET_BIG_ENDIAN_CONTROL_I8_SWAP_8(value: int) -> int:
-    return set_bits(26, 0, value)
+    return set_bits(26, 1, value)
 
 
 def NV902D_SET_BIG_ENDIAN_CONTROL_I8_SWAP_16(value: int) -> int:
-    return set_bits(27, 0, value)
+    return set_bits(27, 1, value)
 
 
 def NV902D_SET_BIG_ENDIAN_CONTROL_OVERRIDE(value: int) -> int:
-    return set_bits(28, 0, value)
+    return set_bits(28, 1, value)
 
 
 def NV902D_SET_PIXELS_FROM_MEMORY_BLOCK_SHAPE_V(value: int) -> int:
-    return set_bits(0, 2, value)
+    return set_bits(0, 3, value)
 
 
 def NV902D_SET_PIXELS_FROM_MEMORY_CORRAL_SIZE_V(value: int) -> int:
-    return set_bits(0, 9, value)
+    return set_bits(0, 10, value)
 
 
 def NV902D_SET_PIXELS_FROM_MEMORY_SAFE_OVERLAP_V(value: int) -> int:
-    return set_bits(0, 0, value)
+    return set_bits(0, 1, value)
 
 
 def NV902D_SET_PIXELS_FROM_MEMORY_SAMPLE_MODE_ORIGIN(value: int) -> int:
-    return set_bits(0, 0, value)
+    return set_bits(0, 1, value)
 
 
 def NV902D_SET_PIXELS_FROM_MEMORY_SAMPLE_MODE_FILTER(value: int) -> int:
-    return set_bits(4, 0, value)
+    return set_bits(4, 1, value)
 
 
 def NV902D_SET_PIXELS_FROM_MEMORY_DST_X0_V(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NV902D_SET_PIXELS_FROM_MEMORY_DST_Y0_V(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NV902D_SET_PIXELS_FROM_MEMORY_DST_WIDTH_V(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NV902D_SET_PIXELS_FROM_MEMORY_DST_HEIGHT_V(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NV902D_SET_PIXELS_FROM_MEMORY_DU_DX_FRAC_V(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NV902D_SET_PIXELS_FROM_MEMORY_DU_DX_INT_V(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NV902D_SET_PIXELS_FROM_MEMORY_DV_DY_FRAC_V(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NV902D_SET_PIXELS_FROM_MEMORY_DV_DY_INT_V(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NV902D_SET_PIXELS_FROM_MEMORY_SRC_X0_FRAC_V(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NV902D_SET_PIXELS_FROM_MEMORY_SRC_X0_INT_V(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NV902D_SET_PIXELS_FROM_MEMORY_SRC_Y0_FRAC_V(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NV902D_PIXELS_FROM_MEMORY_SRC_Y0_INT_V(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NV902D_SET_FALCON00_V(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NV902D_SET_FALCON01_V(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NV902D_SET_FALCON02_V(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NV902D_SET_FALCON03_V(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NV902D_SET_FALCON04_V(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NV902D_SET_FALCON05_V(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NV902D_SET_FALCON06_V(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NV902D_SET_FALCON07_V(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NV902D_SET_FALCON08_V(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NV902D_SET_FALCON09_V(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NV902D_SET_FALCON10_V(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NV902D_SET_FALCON11_V(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NV902D_SET_FALCON12_V(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NV902D_SET_FALCON13_V(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NV902D_SET_FALCON14_V(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NV902D_SET_FALCON15_V(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NV902D_SET_FALCON16_V(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NV902D_SET_FALCON17_V(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NV902D_SET_FALCON18_V(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NV902D_SET_FALCON19_V(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NV902D_SET_FALCON20_V(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NV902D_SET_FALCON21_V(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NV902D_SET_FALCON22_V(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NV902D_SET_FALCON23_V(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NV902D_SET_FALCON24_V(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NV902D_SET_FALCON25_V(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NV902D_SET_FALCON26_V(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NV902D_SET_FALCON27_V(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NV902D_SET_FALCON28_V(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NV902D_SET_FALCON29_V(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NV902D_SET_FALCON30_V(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NV902D_SET_FALCON31_V(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NV902D_MME_DMA_WRITE_METHOD_BARRIER_V(value: int) -> int:
-    return set_bits(0, 0, value)
+    return set_bits(0, 1, value)
 
 
 def NV902D_SET_MME_SHADOW_SCRATCH_V(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NV902D_CALL_MME_MACRO_V(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NV902D_CALL_MME_DATA_V(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 
@@ -0,0 +1,340 @@
+from nvgpu import GpuMemory, TegraGpuChannel
+from typing import Dict, List, Optional, Set, Tuple
+
+
+def _next_power_of_two(value: int) -> int:
+    return 1 << max(value - 1, 0).bit_length()
+
+
+class GpuMemoryView(object):
+    memory: GpuMemory
+    offset: int
+    user_size: int
+    gpu_address: int
+    gpu_memory_size: int
+
+    allocator: Optional["GpuMemoryAllocator"]
+
+    def __init__(
+        self,
+        memory: GpuMemory,
+        offset: int,
+        user_size: int,
+        gpu_memory_size: int,
+        allocator: Optional["GpuMemoryAllocator"] = None,
+    ) -> None:
+        self.memory = memory
+        self.offset = offset
+        self.user_size = user_size
+        self.gpu_address = memory.gpu_address + offset
+        self.gpu_memory_size = gpu_memory_size
+        self.allocator = allocator
+
+    def _translate(self, index: slice) -> slice:
+        (start, stop, step) = index.indices(self.gpu_memory_size)
+
+        assert step == 1
+
+        return slice(self.offset + start, self.offset + stop)
+
+    def __getitem__(self, index: slice) -> bytes:
+        return self.memory[self._translate(index)]
+
+    def __setitem__(self, index: slice, object: bytes) -> None:
+        self.memory[self._translate(index)] = object
+
+    def close(self):
+        if self.allocator is not None:
+            self.allocator.free(self)
+
+    def __repr__(self) -> str:
+        return f"GpuMemoryView(memory={self.memory}, offset=0x{self.offset:x}, user_size=0x{self.user_size:x}, gpu_address=0x{self.gpu_address:x}, gpu_memory_size=0x{self.gpu_memory_size:x})"
+
+
+class GpuMemoryAllocatorStatistics(object):
+    reserved_size: int
+    used_size: int
+    requested_size: int
+    free_size: int
+    largest_free_size: int
+    allocation_count: int
+
+    def __init__(
+        self,
+        reserved_size: int,
+        used_size: int,
+        requested_size: int,
+        largest_free_size: int,
+        allocation_count: int,
+    ) -> None:
+        self.reserved_size = reserved_size
+        self.used_size = used_size
+        self.requested_size = requested_size
+        self.free_size = reserved_size - used_size
+        self.largest_free_size = largest_free_size
+        self.allocation_count = allocation_count
+
+    @property
+    def utilisation(self) -> float:
+        if self.reserved_size == 0:
+            return 0.0
+
+        return self.requested_size / self.reserved_size
+
+    @property
+    def fragmentation(self) -> float:
+        if self.free_size == 0:
+            return 0.0
+
+        return 1.0 - self.largest_free_size / self.free_size
+
+    def __repr__(self) -> str:
+        return f"GpuMemoryAllocatorStatistics(reserved_size=0x{self.reserved_size:x}, used_size=0x{self.used_size:x}, requested_size=0x{self.requested_size:x}, free_size=0x{self.free_size:x}, largest_free_size=0x{self.largest_free_size:x}, allocation_count={self.allocation_count}, utilisation={self.utilisation:.2f}, fragmentation={self.fragmentation:.2f})"
+
+
+class _Slab(object):
+    memory: GpuMemory
+    offset: int
+    free_offsets: List[int]
+    used_count: int
+
+    def __init__(self, memory: GpuMemory, offset: int, object_size: int) -> None:
+        self.memory = memory
+        self.offset = offset
+        self.free_offsets = list(
+            range(
+                offset + GpuMemoryAllocator.SLAB_SIZE - object_size,
+                offset - 1,
+                -object_size,
+            )
+        )
+        self.used_count = 0
+
+
+class GpuMemoryAllocator(object):
+    # Objects up to this size are carved from slab pages, bigger ones use the buddy allocator.
+    SLAB_SIZE: int = TegraGpuChannel.PAGE_SIZE
+    SLAB_MAX_OBJECT_SIZE: int = 0x800
+    MIN_OBJECT_SIZE: int = 0x20
+    BUDDY_MIN_SIZE: int = TegraGpuChannel.PAGE_SIZE
+
+    channel: TegraGpuChannel
+    block_size: int
+    is_cpu_cached: bool
+    is_gpu_cached: bool
+
+    blocks: List[GpuMemory]
+    dedicated: List[GpuMemory]
+
+    # Per block free lists indexed by buddy order.
+    _free_lists: Dict[int, List[Set[int]]]
+    _slabs: Dict[int, List[_Slab]]
+    _slab_by_offset: Dict[Tuple[int, int], _Slab]
+    _requested_size: int
+    _allocation_count: int
+
+    def __init__(
+        self,
+        channel: TegraGpuChannel,
+        block_size: int = 0x100000,
+        is_cpu_cached: bool = True,
+        is_gpu_cached: bool = False,
+    ) -> None:
+        assert block_size == _next_power_of_two(block_size)
+        assert block_size >= self.BUDDY_MIN_SIZE
+
+        self.channel = channel
+        self.block_size = block_size
+        self.is_cpu_cached = is_cpu_cached
+        self.is_gpu_cached = is_gpu_cached
+
+        self.blocks = list()
+        self.dedicated = list()
+        self._free_lists = dict()
+        self._slabs = dict()
+        self._slab_by_offset = dict()
+        self._requested_size = 0
+        self._allocation_count = 0
+
+    @property
+    def _max_order(self) -> int:
+        return (self.block_size // self.BUDDY_MIN_SIZE).bit_length() - 1
+
+    def _get_order(self, size: int) -> int:
+        return (size // self.BUDDY_MIN_SIZE).bit_length() - 1
+
+    def _create_block(self) -> GpuMemory:
+        memory = self.channel.create_gpu_memory(
+            self.block_size, self.is_cpu_cached, self.is_gpu_cached
+        )
+
+        free_lists: List[Set[int]] = [set() for _ in range(self._max_order + 1)]
+        free_lists[self._max_order].add(0)
+
+        self.blocks.append(memory)
+        self._free_lists[memory.nvmap_handle] = free_lists
+
+        return memory
+
+    def _allocate_buddy(self, size: int) -> Tuple[GpuMemory, int]:
+        order = self._get_order(size)
+
+        for memory in self.blocks:
+            free_lists = self._free_lists[memory.nvmap_handle]
+
+            for current_order in range(order, self._max_order + 1):
+                if len(free_lists[current_order]) == 0:
+                    continue
+
+                offset = free_lists[current_order].pop()
+
+                # Split until we reach the requested order.
+                while current_order > order:
+                    current_order -= 1
+                    free_lists[current_order].add(
+                        offset + (self.BUDDY_MIN_SIZE << current_order)
+                    )
+
+                return (memory, offset)
+
+        self._create_block()
+
+        return self._allocate_buddy(size)
+
+    def _free_buddy(self, memory: GpuMemory, offset: int, size: int) -> None:
+        free_lists = self._free_lists[memory.nvmap_handle]
+        order = self._get_order(size)
+
+        # A chunk containing this one being free means it was already freed.
+        for (current_order, offsets) in enumerate(free_lists):
+            chunk_size = self.BUDDY_MIN_SIZE << current_order
+            assert (offset & ~(chunk_size - 1)) not in offsets
+
+        while order < self._max_order:
+            buddy_offset = offset ^ (self.BUDDY_MIN_SIZE << order)
+
+            if buddy_offset not in free_lists[order]:
+                break
+
+            free_lists[order].remove(buddy_offset)
+            offset = min(offset, buddy_offset)
+            order += 1
+
+        free_lists[order].add(offset)
+
+    def _allocate_slab_object(self, object_size: int) -> Tuple[GpuMemory, int]:
+        slabs = self._slabs.setdefault(object_size, list())
+
+        for slab in slabs:
+            if len(slab.free_offsets) != 0:
+                break
+        else:
+            (memory, offset) = self._allocate_buddy(self.SLAB_SIZE)
+            slab = _Slab(memory, offset, object_size)
+            slabs.append(slab)
+            self._slab_by_offset[(memory.nvmap_handle, offset)] = slab
+
+        slab.used_count += 1
+
+        return (slab.memory, slab.free_offsets.pop())
+
+    def _free_slab_object(self, memory: GpuMemory, offset: int, object_size: int) -> None:
+        slab_offset = offset - offset % self.SLAB_SIZE
+        slab = self._slab_by_offset.get((memory.nvmap_handle, slab_offset))
+
+        assert slab is not None
+        assert offset not in slab.free_offsets
+
+        slab.free_offsets.append(offset)
+        slab.used_count -= 1
+
+        # Give empty slabs back to the buddy allocator but keep one around per size class.
+        slabs = self._slabs[object_size]
+
+        if slab.used_count == 0 and len(slabs) > 1:
+            slabs.remove(slab)
+            del self._slab_by_offset[(memory.nvmap_handle, slab_offset)]
+            self._free_buddy(memory, slab_offset, self.SLAB_SIZE)
+
+    def allocate(self, size: int, alignment: int = 0x10) -> GpuMemoryView:
+        assert size > 0
+        assert alignment == _next_power_of_two(alignment)
+        assert alignment <= TegraGpuChannel.PAGE_SIZE
+
+        object_size = _next_power_of_two(max(size, alignment, self.MIN_OBJECT_SIZE))
+
+        if object_size <= self.SLAB_MAX_OBJECT_SIZE:
+            (memory, offset) = self._allocate_slab_object(object_size)
+        elif object_size <= self.block_size:
+            object_size = max(object_size, self.BUDDY_MIN_SIZE)
+            (memory, offset) = self._allocate_buddy(object_size)
+        else:
+            memory = self.channel.create_gpu_memory(
+                size, self.is_cpu_cached, self.is_gpu_cached
+            )
+            offset = 0
+            object_size = memory.gpu_memory_size
+            self.dedicated.append(memory)
+
+        self._requested_size += size
+        self._allocation_count += 1
+
+        return GpuMemoryView(memory, offset, size, object_size, self)
+
+    def free(self, view: GpuMemoryView) -> None:
+        assert view.allocator is self
+
+        view.allocator = None
+
+        if view.gpu_memory_size <= self.SLAB_MAX_OBJECT_SIZE:
+            self._free_slab_object(view.memory, view.offset, view.gpu_memory_size)
+        elif view.gpu_memory_size > self.block_size:
+            assert view.memory in self.dedicated
+
+            self.dedicated.remove(view.memory)
+            view.memory.close()
+        else:
+            self._free_buddy(view.memory, view.offset, view.gpu_memory_size)
+
+        self._requested_size -= view.user_size
+        self._allocation_count -= 1
+
+    def get_statistics(self) -> GpuMemoryAllocatorStatistics:
+        reserved_size = len(self.blocks) * self.block_size
+        free_size = 0
+        largest_free_size = 0
+
+        for free_lists in self._free_lists.values():
+            for (order, offsets) in enumerate(free_lists):
+                if len(offsets) != 0:
+                    chunk_size = self.BUDDY_MIN_SIZE << order
+                    free_size += chunk_size * len(offsets)
+                    largest_free_size = max(largest_free_size, chunk_size)
+
+        # Free slab objects are free memory too, but never bigger than a slab.
+        for (object_size, slabs) in self._slabs.items():
+            for slab in slabs:
+                if len(slab.free_offsets) != 0:
+                    free_size += object_size * len(slab.free_offsets)
+                    largest_free_size = max(largest_free_size, object_size)
+
+        for memory in self.dedicated:
+            reserved_size += memory.gpu_memory_size
+
+        return GpuMemoryAllocatorStatistics(
+            reserved_size,
+            reserved_size - free_size,
+            self._requested_size,
+            largest_free_size,
+            self._allocation_count,
+        )
+
+    def close(self) -> None:
+        for memory in self.blocks + self.dedicated:
+            memory.close()
+
+        self.blocks.clear()
+        self.dedicated.clear()
+        self._free_lists.clear()
+        self._slabs.clear()
+        self._slab_by_offset.clear()
@@ -0,0 +1,183 @@
+from maxwell.dma_copy_engine import ImageInfo
+from maxwell.hw.dma_copy_a import (
+    NVB0B5_SET_DST_BLOCK_SIZE_DEPTH,
+    NVB0B5_SET_DST_BLOCK_SIZE_HEIGHT,
+)
+from nvgpu import GpuMemory
+
+import numpy as np
+import typing
+
+GOB_WIDTH = 64
+GOB_HEIGHT = 8
+GOB_SIZE = GOB_WIDTH * GOB_HEIGHT
+
+# Smallest contiguous run of bytes inside a GOB.
+SECTOR_WIDTH = 16
+
+_BLOCK_HEIGHT_MASK = NVB0B5_SET_DST_BLOCK_SIZE_HEIGHT(0xFFFFFFFF)
+_BLOCK_DEPTH_MASK = NVB0B5_SET_DST_BLOCK_SIZE_DEPTH(0xFFFFFFFF)
+
+
+def _get_shift(mask: int) -> int:
+    return (mask & -mask).bit_length() - 1
+
+
+def get_block_linear_size(
+    width: int, height: int, depth: int, block_height_log2: int, block_depth_log2: int
+) -> int:
+    """Size of a block linear surface (width is in bytes)"""
+
+    block_height = GOB_HEIGHT << block_height_log2
+    block_depth = 1 << block_depth_log2
+
+    width_in_gobs = (width + GOB_WIDTH - 1) // GOB_WIDTH
+    height_in_blocks = (height + block_height - 1) // block_height
+    depth_in_blocks = (depth + block_depth - 1) // block_depth
+
+    return (
+        width_in_gobs
+        * height_in_blocks
+        * depth_in_blocks
+        * (GOB_SIZE << (block_height_log2 + block_depth_log2))
+    )
+
+
+def get_block_linear_offsets(
+    width: int,
+    height: int,
+    block_height_log2: int,
+    block_depth_log2: int,
+    x: np.ndarray,
+    y: np.ndarray,
+    z: int,
+) -> np.ndarray:
+    """Byte offsets of the (y, x) grid of a block linear surface (x and width are in bytes)"""
+
+    block_height = GOB_HEIGHT << block_height_log2
+    block_depth = 1 << block_depth_log2
+    block_size = GOB_SIZE << (block_height_log2 + block_depth_log2)
+
+    width_in_gobs = (width + GOB_WIDTH - 1) // GOB_WIDTH
+    height_in_blocks = (height + block_height - 1) // block_height
+    row_of_blocks_size = width_in_gobs * block_size
+
+    x = x.astype(np.int64)
+    y = y.astype(np.int64)
+
+    # The layout is separable, compute the x and y terms once and broadcast them.
+    # NOTE: GOBs are 64 bytes by 8 rows, made of 16x2 sectors.
+    x_offsets = (
+        (x // GOB_WIDTH) * block_size
+        + ((x % 64) // 32) * 256
+        + ((x % 32) // 16) * 32
+        + (x % 16)
+    )
+    y_offsets = (
+        (y // block_height) * row_of_blocks_size
+        + ((y % block_height) // GOB_HEIGHT) * GOB_SIZE
+        + ((y % 8) // 2) * 64
+        + (y % 2) * 16
+    )
+    z_offset = (z // block_depth) * height_in_blocks * row_of_blocks_size + (
+        z % block_depth
+    ) * (GOB_SIZE << block_height_log2)
+
+    return y_offsets[:, np.newaxis] + x_offsets[np.newaxis, :] + z_offset
+
+
+def get_image_block_size(image: ImageInfo) -> typing.Tuple[int, int]:
+    """Block height and depth (log2, in GOBs) of the tile mode of an image"""
+
+    return (
+        (image.tile_mode & _BLOCK_HEIGHT_MASK) >> _get_shift(_BLOCK_HEIGHT_MASK),
+        (image.tile_mode & _BLOCK_DEPTH_MASK) >> _get_shift(_BLOCK_DEPTH_MASK),
+    )
+
+
+def get_image_size(image: ImageInfo) -> int:
+    """Size of one layer of a block linear image"""
+
+    (block_height_log2, block_depth_log2) = get_image_block_size(image)
+
+    return get_block_linear_size(
+        image.horizontal * image.bytes_per_block,
+        image.vertical,
+        image.depth,
+        block_height_log2,
+        block_depth_log2,
+    )
+
+
+def _get_image_view(
+    image: ImageInfo, memory: GpuMemory, layer: int
+) -> typing.Tuple[np.ndarray, typing.List[np.ndarray], int]:
+    assert not image.is_linear
+
+    offset = image.gpu_address - memory.gpu_address
+
+    if image.is_layered:
+        offset += layer * image.layer_stride
+
+    size = get_image_size(image)
+
+    assert offset >= 0 and offset + size <= memory.gpu_memory_size
+
+    (block_height_log2, block_depth_log2) = get_image_block_size(image)
+    row_size = image.horizontal * image.bytes_per_block
+    buffer = np.frombuffer(memory.mmap_instance, dtype=np.uint8, count=size, offset=offset)
+
+    # Move whole sectors when rows and base are aligned on them, this is most images.
+    unit = 1
+
+    if row_size % SECTOR_WIDTH == 0 and offset % SECTOR_WIDTH == 0:
+        unit = SECTOR_WIDTH
+        buffer = buffer.reshape(-1, SECTOR_WIDTH)
+
+    x = np.arange(0, row_size, unit)
+    y = np.arange(image.vertical)
+    offsets = [
+        get_block_linear_offsets(
+            row_size, image.vertical, block_height_log2, block_depth_log2, x, y, z
+        )
+        // unit
+        for z in range(image.depth)
+    ]
+
+    return (buffer, offsets, unit)
+
+
+def swizzle_image(
+    image: ImageInfo,
+    memory: GpuMemory,
+    data: typing.Union[bytes, bytearray, memoryview, np.ndarray],
+    layer: int = 0,
+) -> None:
+    """Write tightly packed linear data (depth slices of vertical rows) to a block linear image in memory"""
+
+    (buffer, offsets, unit) = _get_image_view(image, memory, layer)
+    row_size = image.horizontal * image.bytes_per_block
+    source = np.frombuffer(data, dtype=np.uint8).reshape(
+        image.depth, image.vertical, row_size // unit, unit
+    )
+
+    if unit == 1:
+        source = source.reshape(image.depth, image.vertical, row_size)
+
+    for z in range(image.depth):
+        buffer[offsets[z]] = source[z]
+
+
+def deswizzle_image(
+    image: ImageInfo, memory: GpuMemory, layer: int = 0
+) -> np.ndarray:
+    """Read a block linear image from memory as tightly packed linear data"""
+
+    (buffer, offsets, unit) = _get_image_view(image, memory, layer)
+    row_size = image.horizontal * image.bytes_per_block
+    result = np.empty((image.depth, image.vertical, row_size), dtype=np.uint8)
+
+    for z in range(image.depth):
+        result[z] = buffer[offsets[z]].reshape(image.vertical, row_size)
+
+    return result
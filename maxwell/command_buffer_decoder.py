@@ -0,0 +1,179 @@
+from command_buffer import *
+from command_buffer import (
+    _ARGUMENT_MASK,
+    _ARGUMENT_OFFSET,
+    _METHOD_MASK,
+    _METHOD_OFFSET,
+    _SUBCHANNEL_MASK,
+    _SUBCHANNEL_OFFSET,
+    _SUBMISSION_MODE_MASK,
+    _SUBMISSION_MODE_OFFSET,
+)
+from nvgpu import GpuMemory
+from maxwell.hw import channel_gpfifo, compute_b, dma_copy_a
+from fermi.hw import twod_a
+
+from types import ModuleType
+import typing
+
+# Methods below this offset are handled by the host (channel) class on every subchannel.
+HOST_METHOD_LIMIT = 0x100
+
+# Submission modes followed by a count of arguments, the others (GRP0/GRP2_USE_TERT) use the count
+# bits differently.
+_COUNTED_SUBMISSION_MODES = (
+    COMMAND_SUBMISSION_MODE_INCREASING,
+    COMMAND_SUBMISSION_MODE_NON_INCREASING,
+    COMMAND_SUBMISSION_MODE_INCREASING_ONCE,
+)
+
+# Constants of the host class that share values with real methods but aren't methods.
+_HOST_NON_METHOD_NAMES = [
+    "NVB06F_NUMBER_OF_SUBCHANNELS",
+    "NVB06F_GP_ENTRY__SIZE",
+    "NVB06F_DMA_NOP",
+]
+
+
+def _create_method_name_index(
+    module: ModuleType, prefix: str, ignored_names: typing.List[str] = []
+) -> typing.Dict[int, str]:
+    bitfield_prefixes = tuple(
+        f"{name}_"
+        for (name, value) in vars(module).items()
+        if name.startswith(prefix) and callable(value)
+    )
+
+    result: typing.Dict[int, str] = dict()
+
+    for (name, value) in vars(module).items():
+        if not name.startswith(prefix) or not isinstance(value, int):
+            continue
+
+        # Method offsets are dword aligned and encoded on 12 bits.
+        if value % 4 != 0 or value > (_METHOD_MASK << 2):
+            continue
+
+        # Skip field values (FOO_FIELD_VALUE where FOO_FIELD is a bitfield helper)
+        if name.startswith(bitfield_prefixes) or name in ignored_names:
+            continue
+
+        if value not in result:
+            result[value] = name
+
+    return result
+
+
+_HOST_METHOD_NAMES = _create_method_name_index(
+    channel_gpfifo, "NVB06F_", _HOST_NON_METHOD_NAMES
+)
+
+_SUBCHANNEL_METHOD_NAMES: typing.Dict[int, typing.Dict[int, str]] = {
+    SUBCHANNEL_ID_COMPUTE: _create_method_name_index(compute_b, "NVB1C0_"),
+    SUBCHANNEL_ID_2D: _create_method_name_index(twod_a, "NV902D_"),
+    SUBCHANNEL_ID_DMA: _create_method_name_index(dma_copy_a, "NVB0B5_"),
+}
+
+
+def get_method_name(subchannel: int, method: int) -> str:
+    if method < HOST_METHOD_LIMIT:
+        name = _HOST_METHOD_NAMES.get(method)
+    else:
+        name = _SUBCHANNEL_METHOD_NAMES.get(subchannel, {}).get(method)
+
+    if name is None:
+        return f"UNKNOWN_0x{method:X}"
+
+    return name
+
+
+class DecodedCommand(typing.NamedTuple):
+    subchannel: int
+    method: int
+    method_name: str
+    submission_mode: int
+    arguments: typing.Sequence[int]
+
+    def method_writes(self) -> typing.Iterator[typing.Tuple[int, int]]:
+        if self.submission_mode in [
+            COMMAND_SUBMISSION_MODE_INCREASING,
+            COMMAND_SUBMISSION_MODE_INCREASING_OLD,
+        ]:
+            for (index, argument) in enumerate(self.arguments):
+                yield (self.method + index * 4, argument)
+        elif self.submission_mode == COMMAND_SUBMISSION_MODE_INCREASING_ONCE:
+            for (index, argument) in enumerate(self.arguments):
+                yield (self.method + min(index, 1) * 4, argument)
+        else:
+            for argument in self.arguments:
+                yield (self.method, argument)
+
+    def __repr__(self) -> str:
+        arguments = ", ".join(f"0x{argument:x}" for argument in self.arguments)
+
+        return f"DecodedCommand(subchannel={self.subchannel}, method={self.method_name}, submission_mode={self.submission_mode}, arguments=[{arguments}])"
+
+
+def decode_command_buffer(
+    data: typing.Union[CommandBuffer, GpuMemory, bytes, bytearray, memoryview],
+    size: typing.Optional[int] = None,
+) -> typing.Iterator[DecodedCommand]:
+    if isinstance(data, CommandBuffer):
+        view = data.buffer
+    elif isinstance(data, GpuMemory):
+        view = memoryview(data.mmap_instance)[: data.user_size]
+    else:
+        view = memoryview(data).cast("B")
+
+    if size is not None:
+        view = view[:size]
+
+    assert len(view) % 4 == 0
+
+    words = view.cast("I")
+    word_count = len(words)
+    method_names = {
+        subchannel: _SUBCHANNEL_METHOD_NAMES.get(subchannel, {})
+        for subchannel in range(8)
+    }
+    index = 0
+
+    while index < word_count:
+        # NOTE: DecodeCommand inlined as this is the hot loop.
+        header = words[index]
+        method = ((header >> _METHOD_OFFSET) & _METHOD_MASK) << 2
+        subchannel = (header >> _SUBCHANNEL_OFFSET) & _SUBCHANNEL_MASK
+        argument = (header >> _ARGUMENT_OFFSET) & _ARGUMENT_MASK
+        submission_mode = (header >> _SUBMISSION_MODE_OFFSET) & _SUBMISSION_MODE_MASK
+        index += 1
+
+        if method < HOST_METHOD_LIMIT:
+            method_name = _HOST_METHOD_NAMES.get(method)
+        else:
+            method_name = method_names[subchannel].get(method)
+
+        if method_name is None:
+            method_name = f"UNKNOWN_0x{method:X}"
+
+        if submission_mode == COMMAND_SUBMISSION_MODE_INLINE:
+            yield DecodedCommand(
+                subchannel, method, method_name, submission_mode, (argument,)
+            )
+        elif submission_mode in _COUNTED_SUBMISSION_MODES:
+            if index + argument > word_count:
+                raise ValueError(
+                    f"Truncated command buffer: {method_name} expects {argument} arguments"
+                )
+
+            yield DecodedCommand(
+                subchannel,
+                method,
+                method_name,
+                submission_mode,
+                words[index : index + argument],
+            )
+            index += argument
+        else:
+            raise ValueError(
+                f"Unsupported submission mode {submission_mode} at offset 0x{(index - 1) * 4:x}"
+            )
@@ -1,13 +1,19 @@
+from array import array
 from command_buffer import *
-from nvgpu import GpuMemory, align_up
+from nvgpu import CommandBufferRing, GpuMemory, SyncFence, align_up
+from maxwell.dma_copy_engine import memcpy_device_to_device, release_semaphore
 from maxwell.hw import *
+from maxwell.hw.channel_gpfifo import *
 from maxwell.hw.compute_b import *
 from maxwell.hw.compute_b_qmd import *
+from maxwell.qmd_codec import get_qmd_codec
 
 import typing
 
 CONSTANT_BUFFER_MAX_SIZE = 0x10000
 CONSTANT_BUFFER_ALIGN_REQUIREMENT = 0x100
+QMD_SIZE = 0x100
+QMD_ALIGN_REQUIREMENT = 0x100
 
 
 def initialize_compute_engine(
@@ -29,20 +35,22 @@ def initialize_compute_engine(
         )
     )
 
-    command_buffer.write_u32(
-        IncrCommand(NVB1C0_SET_SHADER_LOCAL_MEMORY_WINDOW, SUBCHANNEL_ID_COMPUTE, 1)
+    command_buffer.write_method(
+        NVB1C0_SET_SHADER_LOCAL_MEMORY_WINDOW, SUBCHANNEL_ID_COMPUTE, [0x1000000]
     )
-    command_buffer.write_u32(0x1000000)
 
-    command_buffer.write_u32(
-        IncrCommand(NVB1C0_SET_SHADER_SHARED_MEMORY_WINDOW, SUBCHANNEL_ID_COMPUTE, 1)
+    command_buffer.write_method(
+        NVB1C0_SET_SHADER_SHARED_MEMORY_WINDOW, SUBCHANNEL_ID_COMPUTE, [0x3000000]
     )
-    command_buffer.write_u32(0x3000000)
 
-    command_buffer.write_u32(
-        IncrCommand(NVB1C0_SET_PROGRAM_REGION_A, SUBCHANNEL_ID_COMPUTE, 2)
+    command_buffer.write_method(
+        NVB1C0_SET_PROGRAM_REGION_A,
+        SUBCHANNEL_ID_COMPUTE,
+        [
+            (shader_program_memory.gpu_address >> 32) & 0xFFFFFFFF,
+            shader_program_memory.gpu_address & 0xFFFFFFFF,
+        ],
     )
-    command_buffer.write_u64(shader_program_memory.gpu_address)
 
     command_buffer.write_u32(
         InlineCommand(
@@ -52,23 +60,21 @@ def initialize_compute_engine(
         )
     )
 
-    command_buffer.write_u32(
-        IncrCommand(NVB1C0_SET_SHADER_LOCAL_MEMORY_A, SUBCHANNEL_ID_COMPUTE, 2)
+    command_buffer.write_method(
+        NVB1C0_SET_SHADER_LOCAL_MEMORY_A,
+        SUBCHANNEL_ID_COMPUTE,
+        [
+            (scratch_memory.gpu_address >> 32) & 0xFFFFFFFF,
+            scratch_memory.gpu_address & 0xFFFFFFFF,
+        ],
     )
-    command_buffer.write_u64(scratch_memory.gpu_address)
 
     scratch_memory_per_sm = scratch_memory.gpu_memory_size // sm_count
-    command_buffer.write_u32(
-        IncrCommand(
-            NVB1C0_SET_SHADER_LOCAL_MEMORY_NON_THROTTLED_A, SUBCHANNEL_ID_COMPUTE, 6
-        )
+    command_buffer.write_method(
+        NVB1C0_SET_SHADER_LOCAL_MEMORY_NON_THROTTLED_A,
+        SUBCHANNEL_ID_COMPUTE,
+        [0, scratch_memory_per_sm, 0x100, 0, scratch_memory_per_sm, 0x100],
     )
-    command_buffer.write_u32(0)
-    command_buffer.write_u32(scratch_memory_per_sm)
-    command_buffer.write_u32(0x100)
-    command_buffer.write_u32(0)
-    command_buffer.write_u32(scratch_memory_per_sm)
-    command_buffer.write_u32(0x100)
 
 
 def memcpy_inline_host_to_device(
@@ -81,25 +87,69 @@ def memcpy_inline_host_to_device(
     while len(buffer) % 4 != 0:
         buffer += bytearray(b"\x00")
 
-    command_buffer.write_u32(
-        IncrCommand(NVB1C0_LINE_LENGTH_IN, SUBCHANNEL_ID_COMPUTE, 4)
-    )
-    command_buffer.write_u32(len(data))
-    command_buffer.write_u32(1)
-    command_buffer.write_u64(dest_address)
-
-    command_buffer.write_u32(IncrCommand(NVB1C0_LAUNCH_DMA, SUBCHANNEL_ID_COMPUTE, 1))
-
     launch_dma_value = NVB1C0_LAUNCH_DMA_DST_MEMORY_LAYOUT(
         NVB1C0_LAUNCH_DMA_DST_MEMORY_LAYOUT_PITCH
     ) | NVB1C0_LAUNCH_DMA_COMPLETION_TYPE(NVB1C0_LAUNCH_DMA_COMPLETION_TYPE_FLUSH_ONLY)
 
-    command_buffer.write_u32(launch_dma_value)
+    # The inline data of a transfer must fit the argument count of a single method header.
+    max_chunk_size = MAX_COMMAND_ARGUMENT_COUNT * 4
+
+    for offset in range(0, len(data), max_chunk_size):
+        chunk_size = min(len(data) - offset, max_chunk_size)
+        chunk = buffer[offset : offset + align_up(chunk_size, 4)]
+        chunk_address = dest_address + offset
+
+        command_buffer.write_method(
+            NVB1C0_LINE_LENGTH_IN,
+            SUBCHANNEL_ID_COMPUTE,
+            [
+                chunk_size,
+                1,
+                (chunk_address >> 32) & 0xFFFFFFFF,
+                chunk_address & 0xFFFFFFFF,
+            ],
+        )
+
+        command_buffer.write_u32(IncrCommand(NVB1C0_LAUNCH_DMA, SUBCHANNEL_ID_COMPUTE, 1))
+        command_buffer.write_u32(launch_dma_value)
+
+        command_buffer.write_u32(
+            NonIncrCommand(NVB1C0_LOAD_INLINE_DATA, SUBCHANNEL_ID_COMPUTE, len(chunk) // 4)
+        )
+        command_buffer.write_bytes(chunk)
+
 
+def invalidate_constant_buffer_cache(command_buffer: CommandBuffer):
     command_buffer.write_u32(
-        NonIncrCommand(NVB1C0_LOAD_INLINE_DATA, SUBCHANNEL_ID_COMPUTE, len(buffer) // 4)
+        InlineCommand(
+            NVB1C0_INVALIDATE_SHADER_CACHES_NO_WFI,
+            SUBCHANNEL_ID_COMPUTE,
+            NVB1C0_INVALIDATE_SHADER_CACHES_NO_WFI_CONSTANT(
+                NVB1C0_INVALIDATE_SHADER_CACHES_NO_WFI_CONSTANT_TRUE
+            ),
+        )
     )
-    command_buffer.write_bytes(buffer)
+
+
+def upload_constant_buffer(
+    command_buffer: CommandBuffer,
+    memory: GpuMemory,
+    offset: int,
+    data: typing.Union[bytes, bytearray, memoryview, array],
+) -> int:
+    """
+    Write a constant buffer through the CPU mapping instead of inline pushbuffer data.
+
+    Only the constant cache invalidation goes through the pushbuffer, returns the GPU address.
+    """
+
+    assert align_up(offset, CONSTANT_BUFFER_ALIGN_REQUIREMENT) == offset
+    assert memoryview(data).nbytes <= CONSTANT_BUFFER_MAX_SIZE
+
+    memory.write(offset, data)
+    invalidate_constant_buffer_cache(command_buffer)
+
+    return memory.gpu_address + offset
 
 
 def _init_qmd_common(
@@ -145,8 +195,244 @@ def qmd_bind_constant_buffer(
         setattr(job, f"constant_buffer_size_{index}", size)
 
 
-def execute_job(command_buffer: CommandBuffer, job_address: int, job: bytearray):
-    memcpy_inline_host_to_device(command_buffer, job_address, job)
+class ConstantBufferRing(CommandBufferRing):
+    """
+    Bump allocator for per-dispatch constant buffers in a single CPU mapped GpuMemory.
+
+    Slices are written through the mapping and reclaimed once a fence attached after them signals.
+    """
+
+    ALIGNMENT: int = CONSTANT_BUFFER_ALIGN_REQUIREMENT
+
+    # End of the highest slice of the current pass over the ring.
+    high_water: int
+
+    def __init__(self, gpu_memory: GpuMemory) -> None:
+        super().__init__(gpu_memory)
+
+        self.high_water = 0
+
+    def push(
+        self,
+        command_buffer: CommandBuffer,
+        data: typing.Union[bytes, bytearray, memoryview, array],
+    ) -> typing.Tuple[int, int]:
+        """Copy data in a new slice, returns its GPU address and aligned size"""
+
+        size = align_up(memoryview(data).nbytes, self.ALIGNMENT)
+
+        assert size <= CONSTANT_BUFFER_MAX_SIZE
+
+        offset = self.allocate(size)
+        self.gpu_memory.write(offset, data)
+
+        # Slices only move forward until the ring wraps, the first slice of a new pass reuses
+        # addresses of the previous one that might still be cached. Invalidate once per pass.
+        if offset < self.high_water:
+            invalidate_constant_buffer_cache(command_buffer)
+            self.high_water = 0
+
+        self.high_water = max(self.high_water, offset + size)
+        self.commit(offset, size, None)
+
+        return (self.gpu_memory.gpu_address + offset, size)
+
+    def bind(
+        self,
+        command_buffer: CommandBuffer,
+        job: typing.Union[qmdv0006, qmdv0107],
+        index: int,
+        data: typing.Union[bytes, bytearray, memoryview, array],
+    ) -> int:
+        (address, size) = self.push(command_buffer, data)
+        qmd_bind_constant_buffer(job, index, address, size)
+
+        return address
+
+    def attach_fence(self, fence: SyncFence) -> None:
+        """Mark every slice pushed since the last call as done once fence signals"""
+
+        start = self.head
+
+        # Merge the unfenced slices ending at the head in a single fenced region, older ones
+        # (before a wrap) are reclaimed with it anyway.
+        while (
+            len(self.in_flight) != 0
+            and self.in_flight[-1][2] is None
+            and self.in_flight[-1][1] == start
+        ):
+            start = self.in_flight.pop()[0]
+
+        if start != self.head:
+            self.in_flight.append((start, self.head, fence))
+
+
+class QmdField(typing.NamedTuple):
+    word: int
+    mask: int
+    shift: int
+
+
+_QMD_FIELDS: typing.Dict[typing.Tuple[type, str], QmdField] = dict()
+
+
+def get_qmd_field(qmd_type: typing.Type[typing.Union[qmdv0006, qmdv0107]], name: str) -> QmdField:
+    key = (qmd_type, name)
+    result = _QMD_FIELDS.get(key)
+
+    if result is None:
+        parts = get_qmd_codec(qmd_type).get_parts(name)
+
+        assert len(parts) == 1
+
+        (word, shift, mask, _) = parts[0]
+        result = QmdField(word, mask, shift)
+        _QMD_FIELDS[key] = result
+
+    return result
+
+
+class QmdTemplate(object):
+    """
+    A QMD serialized once, dispatches copy it and only patch the fields that differ.
+
+    Patching goes through precomputed (word, mask, shift) fields instead of ctypes bitfields.
+    """
+
+    qmd_type: typing.Type[typing.Union[qmdv0006, qmdv0107]]
+
+    _words: array
+    _fields: typing.Dict[str, QmdField]
+
+    # (width word, height and depth word, height shift, depth shift, kept bits)
+    _cta_raster_patch: typing.Tuple[int, int, int, int, int]
+    # (valid word, valid bit, address lower word, address upper and size word, upper shift, size shift, kept bits)
+    _constant_buffer_patches: typing.List[typing.Tuple[int, int, int, int, int, int, int]]
+
+    def __init__(self, job: typing.Union[qmdv0006, qmdv0107]) -> None:
+        self.qmd_type = type(job)
+        self._words = array("I", bytes(job))
+        self._fields = dict()
+
+        # Fields that change per dispatch are grouped per word so a patch is a few stores.
+        width = self.get_field("cta_raster_width")
+        height = self.get_field("cta_raster_height")
+        depth = self.get_field("cta_raster_depth")
+
+        assert width.mask == 0xFFFFFFFF and height.word == depth.word
+
+        self._cta_raster_patch = (
+            width.word,
+            height.word,
+            height.shift,
+            depth.shift,
+            ~((height.mask << height.shift) | (depth.mask << depth.shift)) & 0xFFFFFFFF,
+        )
+        self._constant_buffer_patches = list()
+
+        for index in range(8):
+            valid = self.get_field(f"constant_buffer_valid_{index}")
+            address_lower = self.get_field(f"constant_buffer_addr_lower_{index}")
+            address_upper = self.get_field(f"constant_buffer_addr_upper_{index}")
+            size = self.get_field(f"constant_buffer_size_{index}")
+
+            assert address_lower.mask == 0xFFFFFFFF and address_upper.word == size.word
+
+            self._constant_buffer_patches.append(
+                (
+                    valid.word,
+                    1 << valid.shift,
+                    address_lower.word,
+                    size.word,
+                    address_upper.shift,
+                    size.shift,
+                    ~(
+                        (address_upper.mask << address_upper.shift)
+                        | (size.mask << size.shift)
+                    )
+                    & 0xFFFFFFFF,
+                )
+            )
+
+    @property
+    def data(self) -> bytes:
+        return self._words.tobytes()
+
+    def get_field(self, name: str) -> QmdField:
+        result = self._fields.get(name)
+
+        if result is None:
+            result = get_qmd_field(self.qmd_type, name)
+            self._fields[name] = result
+
+        return result
+
+    def create(self) -> array:
+        return self._words[:]
+
+    def patch(self, qmd: array, name: str, value: int) -> None:
+        (word, mask, shift) = self.get_field(name)
+        qmd[word] = (qmd[word] & ~(mask << shift)) | ((value & mask) << shift)
+
+    def set_cta_raster_size(
+        self, qmd: array, width: int, height: int = 1, depth: int = 1
+    ) -> None:
+        (width_word, word, height_shift, depth_shift, kept_bits) = self._cta_raster_patch
+
+        qmd[width_word] = width & 0xFFFFFFFF
+        qmd[word] = (
+            (qmd[word] & kept_bits)
+            | ((height & 0xFFFF) << height_shift)
+            | ((depth & 0xFFFF) << depth_shift)
+        )
+
+    def bind_constant_buffer(
+        self, qmd: array, index: int, address: int, size: int
+    ) -> None:
+        (
+            valid_word,
+            valid_bit,
+            address_lower_word,
+            word,
+            address_upper_shift,
+            size_shift,
+            kept_bits,
+        ) = self._constant_buffer_patches[index]
+
+        if address == 0 or size == 0:
+            qmd[valid_word] &= ~valid_bit
+            return
+
+        assert address % CONSTANT_BUFFER_ALIGN_REQUIREMENT == 0
+        assert size % CONSTANT_BUFFER_ALIGN_REQUIREMENT == 0
+        assert size <= CONSTANT_BUFFER_MAX_SIZE
+
+        qmd[valid_word] |= valid_bit
+        qmd[address_lower_word] = address & 0xFFFFFFFF
+        qmd[word] = (
+            (qmd[word] & kept_bits)
+            | (((address >> 32) & 0xFF) << address_upper_shift)
+            | (size << size_shift)
+        )
+
+    def create_dispatch(
+        self,
+        cta_raster_size: typing.Tuple[int, int, int],
+        constant_buffers: typing.Dict[int, typing.Tuple[int, int]] = {},
+    ) -> bytearray:
+        qmd = self._words[:]
+        self.set_cta_raster_size(qmd, *cta_raster_size)
+
+        for (index, (address, size)) in constant_buffers.items():
+            self.bind_constant_buffer(qmd, index, address, size)
+
+        return bytearray(qmd)
+
+
+def _write_send_pcas(
+    command_buffer: CommandBuffer, job_address: int, invalidate: bool
+) -> None:
+    assert align_up(job_address, QMD_ALIGN_REQUIREMENT) == job_address
 
     command_buffer.write_u32(IncrCommand(NVB1C0_SEND_PCAS_A, SUBCHANNEL_ID_COMPUTE, 1))
     command_buffer.write_u32(NVB1C0_SEND_PCAS_A_QMD_ADDRESS_SHIFTED8(job_address >> 8))
@@ -157,9 +443,161 @@ def execute_job(command_buffer: CommandBuffer, job_address: int, job: bytearray)
             SUBCHANNEL_ID_COMPUTE,
             NVB1C0_SEND_SIGNALING_PCAS_B_INVALIDATE(
                 NVB1C0_SEND_SIGNALING_PCAS_B_INVALIDATE_TRUE
+                if invalidate
+                else NVB1C0_SEND_SIGNALING_PCAS_B_INVALIDATE_FALSE
             )
             | NVB1C0_SEND_SIGNALING_PCAS_B_SCHEDULE(
                 NVB1C0_SEND_SIGNALING_PCAS_B_SCHEDULE_TRUE
             ),
         )
     )
+
+
+def execute_job(command_buffer: CommandBuffer, job_address: int, job: bytearray):
+    memcpy_inline_host_to_device(command_buffer, job_address, job)
+    _write_send_pcas(command_buffer, job_address, True)
+
+
+def write_jobs(
+    memory: GpuMemory,
+    offset: int,
+    jobs: typing.Sequence[typing.Union[bytes, bytearray, array]],
+) -> int:
+    """Write QMDs contiguously in a QMD arena through its CPU mapping, returns their GPU address"""
+
+    assert align_up(offset, QMD_ALIGN_REQUIREMENT) == offset
+    assert offset + len(jobs) * QMD_SIZE <= memory.gpu_memory_size
+
+    data = b"".join(jobs)
+    assert len(data) == len(jobs) * QMD_SIZE
+
+    # NOTE: This only flushes the CPU side, QMDs previously launched from the arena may still be
+    # cached by the GPU, launch_jobs invalidates them.
+    memory.write(offset, data)
+
+    return memory.gpu_address + offset
+
+
+def launch_jobs(command_buffer: CommandBuffer, jobs_address: int, job_count: int):
+    """Launch QMDs laid out contiguously at jobs_address back to back"""
+
+    # Every launch invalidates, the arena may have been rewritten since a QMD at the same address was
+    # cached and INVALIDATE only refetches the QMD being launched.
+    for index in range(job_count):
+        _write_send_pcas(command_buffer, jobs_address + index * QMD_SIZE, True)
+
+
+def execute_jobs(
+    command_buffer: CommandBuffer,
+    jobs_address: int,
+    jobs: typing.Sequence[typing.Union[bytes, bytearray, array]],
+):
+    """Upload QMDs contiguously with a single inline transfer and launch all of them"""
+
+    data = b"".join(jobs)
+    assert len(data) == len(jobs) * QMD_SIZE
+
+    memcpy_inline_host_to_device(command_buffer, jobs_address, data)
+    launch_jobs(command_buffer, jobs_address, len(jobs))
+
+
+def pack_cta_raster_size(width: int, height: int = 1, depth: int = 1) -> bytes:
+    """Raster size as laid out in the QMD, also the record format read by indirect updates"""
+
+    return array("I", [width & 0xFFFFFFFF, (height & 0xFFFF) | ((depth & 0xFFFF) << 16)]).tobytes()
+
+
+class ResidentQmd(object):
+    """
+    A QMD kept in GPU memory and launched again without being rebuilt or uploaded.
+
+    The raster size can be patched with a tiny inline transfer, or copied from a record in GPU
+    memory (see pack_cta_raster_size) for GPU driven dispatches. Indirect copies are ordered with a
+    semaphore stored right after the QMD, a ResidentQmd takes SIZE bytes.
+    """
+
+    SEMAPHORE_OFFSET: int = QMD_SIZE
+    SIZE: int = QMD_SIZE + 0x10
+
+    memory: GpuMemory
+    offset: int
+    gpu_address: int
+    qmd_type: typing.Type[typing.Union[qmdv0006, qmdv0107]]
+
+    _cta_raster_offset: int
+    # Set when the QMD changed since the last launch and its cached copy must be invalidated.
+    _is_dirty: bool
+    # Last payload released by an indirect copy.
+    _semaphore_payload: int
+
+    def __init__(
+        self,
+        memory: GpuMemory,
+        offset: int,
+        job: typing.Union[qmdv0006, qmdv0107],
+    ) -> None:
+        assert align_up(offset, QMD_ALIGN_REQUIREMENT) == offset
+        assert offset + self.SIZE <= memory.gpu_memory_size
+
+        self.memory = memory
+        self.offset = offset
+        self.gpu_address = memory.gpu_address + offset
+        self.qmd_type = type(job)
+
+        width = get_qmd_field(self.qmd_type, "cta_raster_width")
+        height = get_qmd_field(self.qmd_type, "cta_raster_height")
+        depth = get_qmd_field(self.qmd_type, "cta_raster_depth")
+
+        assert width.shift == 0 and height.shift == 0 and depth.shift == 16
+        assert height.word == width.word + 1 and depth.word == height.word
+
+        self._cta_raster_offset = width.word * 4
+
+        memory.write(offset, bytes(job) + bytes(self.SIZE - QMD_SIZE))
+        self._is_dirty = True
+        self._semaphore_payload = 0
+
+    def launch(self, command_buffer: CommandBuffer):
+        _write_send_pcas(command_buffer, self.gpu_address, self._is_dirty)
+        self._is_dirty = False
+
+    def set_cta_raster_size(
+        self, command_buffer: CommandBuffer, width: int, height: int = 1, depth: int = 1
+    ):
+        memcpy_inline_host_to_device(
+            command_buffer,
+            self.gpu_address + self._cta_raster_offset,
+            pack_cta_raster_size(width, height, depth),
+        )
+        self._is_dirty = True
+
+    def set_cta_raster_size_indirect(self, command_buffer: CommandBuffer, address: int):
+        memcpy_device_to_device(
+            command_buffer,
+            self.gpu_address + self._cta_raster_offset,
+            address,
+            len(pack_cta_raster_size(0)),
+        )
+
+        # The copy engine runs asynchronously from the compute engine, the copy releases a new
+        # payload once done and the host holds the next methods (the launch) until it sees it.
+        semaphore_address = self.gpu_address + self.SEMAPHORE_OFFSET
+        self._semaphore_payload = (self._semaphore_payload + 1) & 0xFFFFFFFF
+
+        release_semaphore(command_buffer, semaphore_address, self._semaphore_payload)
+        command_buffer.write_method(
+            NVB06F_SEMAPHOREA,
+            SUBCHANNEL_ID_COMPUTE,
+            [
+                NVB06F_SEMAPHOREA_OFFSET_UPPER((semaphore_address >> 32) & 0xFF),
+                NVB06F_SEMAPHOREB_OFFSET_LOWER((semaphore_address & 0xFFFFFFFF) >> 2),
+                NVB06F_SEMAPHOREC_PAYLOAD(self._semaphore_payload),
+                NVB06F_SEMAPHORED_OPERATION(NVB06F_SEMAPHORED_OPERATION_ACQUIRE)
+                | NVB06F_SEMAPHORED_ACQUIRE_SWITCH(
+                    NVB06F_SEMAPHORED_ACQUIRE_SWITCH_DISABLED
+                ),
+            ],
+        )
+
+        # The QMD changed behind the cached copy, the next launch must fetch it again.
+        self._is_dirty = True
@@ -0,0 +1,139 @@
+from array import array
+from maxwell.compute_engine import QmdTemplate
+from maxwell.hw.compute_b_qmd import *
+from nvgpu import GpuMemory
+
+import time
+import typing
+
+# Polling starts by spinning for short kernels, then backs off up to this interval.
+_POLL_SPIN_COUNT = 64
+_POLL_MAX_INTERVAL = 0.001
+
+
+class DispatchSemaphore(object):
+    """Completion of a single dispatch, released by the GPU through the QMD release semaphore"""
+
+    pool: typing.Optional["DispatchSemaphorePool"]
+    offset: int
+    gpu_address: int
+    payload: int
+
+    def __init__(
+        self, pool: "DispatchSemaphorePool", offset: int, payload: int
+    ) -> None:
+        self.pool = pool
+        self.offset = offset
+        self.gpu_address = pool.memory.gpu_address + offset
+        self.payload = payload
+
+    @property
+    def is_signaled(self) -> bool:
+        assert self.pool is not None
+
+        return self.pool.read_slot(self.offset) == self.payload
+
+    def wait(self, timeout: typing.Optional[float] = None) -> bool:
+        # NOTE: GPU writes can't wake a futex, so waiting is polling without any syscall.
+        deadline = None if timeout is None else time.monotonic() + timeout
+        spin_count = 0
+        interval = 0.00001
+
+        while not self.is_signaled:
+            if deadline is not None and time.monotonic() >= deadline:
+                return False
+
+            if spin_count < _POLL_SPIN_COUNT:
+                spin_count += 1
+            else:
+                time.sleep(interval)
+                interval = min(interval * 2, _POLL_MAX_INTERVAL)
+
+        return True
+
+    def close(self) -> None:
+        if self.pool is not None:
+            self.pool.free(self)
+            self.pool = None
+
+
+class DispatchSemaphorePool(object):
+    """
+    Semaphore slots in a CPU mapped GpuMemory, for per dispatch completion inside one submission.
+
+    Each slot is released with a new payload, the CPU compares it with the expected one so slots
+    never need to be reset between uses.
+    """
+
+    SLOT_SIZE: int = 0x10
+
+    memory: GpuMemory
+    free_offsets: typing.List[int]
+    next_payload: int
+
+    def __init__(self, memory: GpuMemory) -> None:
+        self.memory = memory
+        self.free_offsets = list(
+            range(memory.gpu_memory_size - self.SLOT_SIZE, -1, -self.SLOT_SIZE)
+        )
+        self.next_payload = 1
+
+    def read_slot(self, offset: int) -> int:
+        return array("I", self.memory[offset : offset + 4])[0]
+
+    def allocate(self) -> DispatchSemaphore:
+        if len(self.free_offsets) == 0:
+            raise Exception("Dispatch semaphore pool exhausted")
+
+        offset = self.free_offsets.pop()
+        payload = self.next_payload
+
+        # Skip the current slot value, a stale release could match it otherwise.
+        if payload == self.read_slot(offset):
+            payload = (payload + 1) & 0xFFFFFFFF or 1
+
+        self.next_payload = (payload + 1) & 0xFFFFFFFF or 1
+
+        return DispatchSemaphore(self, offset, payload)
+
+    def free(self, semaphore: DispatchSemaphore) -> None:
+        self.free_offsets.append(semaphore.offset)
+
+    def _get_release_fields(
+        self, semaphore: DispatchSemaphore, index: int
+    ) -> typing.Dict[str, int]:
+        # NOTE: Release fields and constants are the same in all the QMD variants.
+        return {
+            f"semaphore_release_enable{index}": NVB1C0_QMDV01_07_SEMAPHORE_RELEASE_ENABLE0_TRUE,
+            f"release{index}_address_lower": semaphore.gpu_address & 0xFFFFFFFF,
+            f"release{index}_address_upper": (semaphore.gpu_address >> 32) & 0xFF,
+            f"release{index}_payload": semaphore.payload,
+            f"release{index}_structure_size": NVB1C0_QMDV01_07_RELEASE0_STRUCTURE_SIZE_ONE_WORD,
+            f"release{index}_reduction_enable": NVB1C0_QMDV01_07_RELEASE0_REDUCTION_ENABLE_FALSE,
+            # Make the results of the dispatch visible to the CPU before the release.
+            "release_membar_type": NVB1C0_QMDV01_07_RELEASE_MEMBAR_TYPE_FE_SYSMEMBAR,
+        }
+
+    def bind(
+        self, job: typing.Union[qmdv0006, qmdv0107], index: int = 0
+    ) -> DispatchSemaphore:
+        """Program the release index (0 or 1) of a QMD with a new semaphore"""
+
+        semaphore = self.allocate()
+
+        for (name, value) in self._get_release_fields(semaphore, index).items():
+            setattr(job, name, value)
+
+        return semaphore
+
+    def bind_dispatch(
+        self, template: QmdTemplate, qmd: array, index: int = 0
+    ) -> DispatchSemaphore:
+        """Same as bind for a QMD created from a QmdTemplate"""
+
+        semaphore = self.allocate()
+
+        for (name, value) in self._get_release_fields(semaphore, index).items():
+            template.patch(qmd, name, value)
+
+        return semaphore
@@ -7,6 +7,136 @@ import typing
 
 MAX_LINEAR_COPY_SIZE = 0x3FFFFF
 
+# Line length of multi-line copies, lines are contiguous so the pitch is the line length.
+COPY_LINE_LENGTH = 0x200000
+MAX_COPY_LINE_COUNT = 0xFFFFFFFF // COPY_LINE_LENGTH
+
+
+def plan_linear_copy(size: int) -> typing.List[typing.Tuple[int, int]]:
+    """
+    Split a linear copy in (line_length, line_count) launches, whole lines go in one multi-line
+    launch (up to MAX_COPY_LINE_COUNT lines) and the remainder in a single line launch.
+    """
+
+    result: typing.List[typing.Tuple[int, int]] = list()
+
+    while size > MAX_LINEAR_COPY_SIZE:
+        line_count = min(size // COPY_LINE_LENGTH, MAX_COPY_LINE_COUNT)
+        result.append((COPY_LINE_LENGTH, line_count))
+        size -= COPY_LINE_LENGTH * line_count
+
+    if size > 0:
+        result.append((size, 1))
+
+    return result
+
+
+def _get_launch_dma_ordering(is_first: bool, is_last: bool) -> int:
+    # Only the first launch waits on previous copies and only the last one flushes.
+    return NVB0B5_LAUNCH_DMA_DATA_TRANSFER_TYPE(
+        NVB0B5_LAUNCH_DMA_DATA_TRANSFER_TYPE_NON_PIPELINED
+        if is_first
+        else NVB0B5_LAUNCH_DMA_DATA_TRANSFER_TYPE_PIPELINED
+    ) | NVB0B5_LAUNCH_DMA_FLUSH_ENABLE(
+        NVB0B5_LAUNCH_DMA_FLUSH_ENABLE_TRUE
+        if is_last
+        else NVB0B5_LAUNCH_DMA_FLUSH_ENABLE_FALSE
+    )
+
+
+class CopyLaunch(object):
+    dest_address: int
+    src_address: int
+    line_length: int
+    line_count: int
+    pitch_in: int
+    pitch_out: int
+
+    def __init__(
+        self,
+        dest_address: int,
+        src_address: int,
+        line_length: int,
+        line_count: int = 1,
+        pitch_in: int = 0,
+        pitch_out: int = 0,
+    ) -> None:
+        self.dest_address = dest_address
+        self.src_address = src_address
+        self.line_length = line_length
+        self.line_count = line_count
+        self.pitch_in = pitch_in
+        self.pitch_out = pitch_out
+
+    def __repr__(self) -> str:
+        return f"CopyLaunch(dest_address=0x{self.dest_address:x}, src_address=0x{self.src_address:x}, line_length=0x{self.line_length:x}, line_count={self.line_count}, pitch_in=0x{self.pitch_in:x}, pitch_out=0x{self.pitch_out:x})"
+
+
+def _plan_linear_copy_launches(
+    dest_address: int, src_address: int, size: int
+) -> typing.List[CopyLaunch]:
+    result: typing.List[CopyLaunch] = list()
+
+    for (line_length, line_count) in plan_linear_copy(size):
+        result.append(
+            CopyLaunch(
+                dest_address,
+                src_address,
+                line_length,
+                line_count,
+                line_length,
+                line_length,
+            )
+        )
+
+        src_address += line_length * line_count
+        dest_address += line_length * line_count
+
+    return result
+
+
+def _write_copy_launch(
+    command_buffer: CommandBuffer, launch: CopyLaunch, is_first: bool, is_last: bool
+):
+    arguments = [
+        (launch.src_address >> 32) & 0xFFFFFFFF,
+        launch.src_address & 0xFFFFFFFF,
+        (launch.dest_address >> 32) & 0xFFFFFFFF,
+        launch.dest_address & 0xFFFFFFFF,
+    ]
+
+    launch_dma_value = (
+        _get_launch_dma_ordering(is_first, is_last)
+        | NVB0B5_LAUNCH_DMA_SRC_MEMORY_LAYOUT(NVB0B5_LAUNCH_DMA_SRC_MEMORY_LAYOUT_PITCH)
+        | NVB0B5_LAUNCH_DMA_SRC_TYPE(NVB0B5_LAUNCH_DMA_SRC_TYPE_VIRTUAL)
+        | NVB0B5_LAUNCH_DMA_DST_MEMORY_LAYOUT(NVB0B5_LAUNCH_DMA_DST_MEMORY_LAYOUT_PITCH)
+        | NVB0B5_LAUNCH_DMA_DST_TYPE(NVB0B5_LAUNCH_DMA_DST_TYPE_VIRTUAL)
+    )
+
+    if launch.line_count > 1:
+        launch_dma_value |= NVB0B5_LAUNCH_DMA_MULTI_LINE_ENABLE(
+            NVB0B5_LAUNCH_DMA_MULTI_LINE_ENABLE_TRUE
+        )
+
+        arguments += [
+            NVB0B5_PITCH_IN_VALUE(launch.pitch_in),
+            NVB0B5_PITCH_OUT_VALUE(launch.pitch_out),
+            NVB0B5_LINE_LENGTH_IN_VALUE(launch.line_length),
+            NVB0B5_LINE_COUNT_VALUE(launch.line_count),
+        ]
+
+        command_buffer.write_method(NVB0B5_OFFSET_IN_UPPER, SUBCHANNEL_ID_DMA, arguments)
+    else:
+        # Pitches and line count are ignored, short line lengths fit in an inline method.
+        command_buffer.write_method(NVB0B5_OFFSET_IN_UPPER, SUBCHANNEL_ID_DMA, arguments)
+        command_buffer.write_method(
+            NVB0B5_LINE_LENGTH_IN,
+            SUBCHANNEL_ID_DMA,
+            [NVB0B5_LINE_LENGTH_IN_VALUE(launch.line_length)],
+        )
+
+    command_buffer.write_method(NVB0B5_LAUNCH_DMA, SUBCHANNEL_ID_DMA, [launch_dma_value])
+
 
 def memcpy_device_to_device(
     command_buffer: CommandBuffer, dest_address: int, src_address: int, size: int
@@ -15,29 +145,261 @@ def memcpy_device_to_device(
         InlineCommand(NVB0B5_NOP, SUBCHANNEL_ID_DMA, NVB0B5_NOP_PARAMETER(0))
     )
 
-    while size > 0:
-        copy_size = min(size, MAX_LINEAR_COPY_SIZE)
+    launches = _plan_linear_copy_launches(dest_address, src_address, size)
 
-        command_buffer.write_u32(
-            IncrCommand(NVB0B5_OFFSET_IN_UPPER, SUBCHANNEL_ID_DMA, 4)
+    for (index, launch) in enumerate(launches):
+        _write_copy_launch(
+            command_buffer, launch, index == 0, index + 1 == len(launches)
         )
-        command_buffer.write_u64(src_address)
-        command_buffer.write_u64(dest_address)
 
-        command_buffer.write_u32(
-            IncrCommand(NVB0B5_LINE_LENGTH_IN, SUBCHANNEL_ID_DMA, 1)
+    command_buffer.write_u32(
+        InlineCommand(NVB0B5_NOP, SUBCHANNEL_ID_DMA, NVB0B5_NOP_PARAMETER(0))
+    )
+
+
+def plan_copy_list(
+    copies: typing.Iterable[typing.Tuple[int, int, int]]
+) -> typing.List[CopyLaunch]:
+    """
+    Coalesce (dest_address, src_address, size) copies in as few launches as possible.
+
+    Copies contiguous in both source and destination are merged, runs of same sized copies
+    with constant source and destination strides become a single multi-line launch.
+    """
+
+    regions = sorted(
+        (dest_address, src_address, size)
+        for (dest_address, src_address, size) in copies
+        if size > 0
+    )
+
+    merged: typing.List[typing.List[int]] = list()
+
+    for (dest_address, src_address, size) in regions:
+        if len(merged) != 0:
+            previous = merged[-1]
+
+            if (
+                previous[0] + previous[2] == dest_address
+                and previous[1] + previous[2] == src_address
+            ):
+                previous[2] += size
+                continue
+
+        merged.append([dest_address, src_address, size])
+
+    result: typing.List[CopyLaunch] = list()
+    index = 0
+
+    while index < len(merged):
+        (dest_address, src_address, size) = merged[index]
+
+        if size > MAX_LINEAR_COPY_SIZE:
+            result += _plan_linear_copy_launches(dest_address, src_address, size)
+            index += 1
+            continue
+
+        line_count = 1
+
+        if index + 1 < len(merged) and merged[index + 1][2] == size:
+            pitch_out = merged[index + 1][0] - dest_address
+            pitch_in = merged[index + 1][1] - src_address
+
+            # Lines must not overlap in the destination and pitches are unsigned 32 bits.
+            if size <= pitch_out <= 0xFFFFFFFF and 0 <= pitch_in <= 0xFFFFFFFF:
+                while (
+                    index + line_count < len(merged)
+                    and merged[index + line_count][2] == size
+                    and merged[index + line_count][0]
+                    == dest_address + pitch_out * line_count
+                    and merged[index + line_count][1]
+                    == src_address + pitch_in * line_count
+                ):
+                    line_count += 1
+
+        if line_count > 1:
+            result.append(
+                CopyLaunch(
+                    dest_address, src_address, size, line_count, pitch_in, pitch_out
+                )
+            )
+        else:
+            result.append(CopyLaunch(dest_address, src_address, size))
+
+        index += line_count
+
+    return result
+
+
+def memcpy_device_to_device_list(
+    command_buffer: CommandBuffer,
+    copies: typing.Iterable[typing.Tuple[int, int, int]],
+):
+    """Copy a list of (dest_address, src_address, size), the copies must not overlap each other"""
+
+    launches = plan_copy_list(copies)
+
+    for (index, launch) in enumerate(launches):
+        _write_copy_launch(
+            command_buffer, launch, index == 0, index + 1 == len(launches)
         )
-        command_buffer.write_u32(NVB0B5_LINE_LENGTH_IN_VALUE(copy_size))
 
-        command_buffer.write_u32(
-            IncrCommand(NVB0B5_SET_DST_ORIGIN, SUBCHANNEL_ID_DMA, 1)
+
+# Fills write 16 bytes elements (four 4 bytes components) taken from the remap constants.
+FILL_COMPONENT_SIZE = 4
+FILL_ELEMENT_SIZE = 16
+
+
+class _FillLaunch(object):
+    address: int
+    line_length: int
+    line_count: int
+    pitch: int
+    const_a: int
+    const_b: int
+    remap_components: int
+
+    def __init__(
+        self,
+        address: int,
+        line_length: int,
+        line_count: int,
+        pitch: int,
+        const_a: int,
+        const_b: int,
+        remap_components: int,
+    ) -> None:
+        self.address = address
+        self.line_length = line_length
+        self.line_count = line_count
+        self.pitch = pitch
+        self.const_a = const_a
+        self.const_b = const_b
+        self.remap_components = remap_components
+
+
+_REMAP_COMPONENT_ENCODERS = [
+    NVB0B5_SET_REMAP_COMPONENTS_DST_X,
+    NVB0B5_SET_REMAP_COMPONENTS_DST_Y,
+    NVB0B5_SET_REMAP_COMPONENTS_DST_Z,
+    NVB0B5_SET_REMAP_COMPONENTS_DST_W,
+]
+
+
+def _plan_fill(
+    dest_address: int, size: int, pattern: bytes
+) -> typing.List[_FillLaunch]:
+    result: typing.List[_FillLaunch] = list()
+
+    element = pattern * (FILL_ELEMENT_SIZE // len(pattern))
+    components = [
+        int.from_bytes(element[offset : offset + FILL_COMPONENT_SIZE], "little")
+        for offset in range(0, FILL_ELEMENT_SIZE, FILL_COMPONENT_SIZE)
+    ]
+    unique_components = list(dict.fromkeys(components))
+    body_size = size - size % FILL_ELEMENT_SIZE
+
+    # There are only two constants, patterns with more distinct components need extra passes
+    # that leave the other components untouched.
+    for index in range(0, len(unique_components), 2):
+        constants = unique_components[index : index + 2]
+        remap_components = NVB0B5_SET_REMAP_COMPONENTS_COMPONENT_SIZE(
+            NVB0B5_SET_REMAP_COMPONENTS_COMPONENT_SIZE_FOUR
+        ) | NVB0B5_SET_REMAP_COMPONENTS_NUM_DST_COMPONENTS(
+            NVB0B5_SET_REMAP_COMPONENTS_NUM_DST_COMPONENTS_FOUR
         )
 
-        launch_dma_value = (
-            NVB0B5_LAUNCH_DMA_DATA_TRANSFER_TYPE(
-                NVB0B5_LAUNCH_DMA_DATA_TRANSFER_TYPE_NON_PIPELINED
+        for (encoder, component) in zip(_REMAP_COMPONENT_ENCODERS, components):
+            if component not in constants:
+                selector = NVB0B5_SET_REMAP_COMPONENTS_DST_X_NO_WRITE
+            elif constants.index(component) == 0:
+                selector = NVB0B5_SET_REMAP_COMPONENTS_DST_X_CONST_A
+            else:
+                selector = NVB0B5_SET_REMAP_COMPONENTS_DST_X_CONST_B
+
+            remap_components |= encoder(selector)
+
+        address = dest_address
+
+        for (line_length, line_count) in plan_linear_copy(body_size):
+            result.append(
+                _FillLaunch(
+                    address,
+                    line_length // FILL_ELEMENT_SIZE,
+                    line_count,
+                    line_length,
+                    constants[0],
+                    constants[-1],
+                    remap_components,
+                )
             )
-            | NVB0B5_LAUNCH_DMA_FLUSH_ENABLE(NVB0B5_LAUNCH_DMA_FLUSH_ENABLE_TRUE)
+            address += line_length * line_count
+
+    # The tail is filled one (up to) 4 bytes component at a time.
+    for offset in range(body_size, size, FILL_COMPONENT_SIZE):
+        component_size = min(size - offset, FILL_COMPONENT_SIZE)
+        component = element[offset % FILL_ELEMENT_SIZE :][:component_size]
+
+        result.append(
+            _FillLaunch(
+                dest_address + offset,
+                1,
+                1,
+                component_size,
+                int.from_bytes(component, "little"),
+                0,
+                NVB0B5_SET_REMAP_COMPONENTS_DST_X(
+                    NVB0B5_SET_REMAP_COMPONENTS_DST_X_CONST_A
+                )
+                | NVB0B5_SET_REMAP_COMPONENTS_COMPONENT_SIZE(component_size - 1)
+                | NVB0B5_SET_REMAP_COMPONENTS_NUM_DST_COMPONENTS(
+                    NVB0B5_SET_REMAP_COMPONENTS_NUM_DST_COMPONENTS_ONE
+                ),
+            )
+        )
+
+    return result
+
+
+def memset_device(
+    command_buffer: CommandBuffer,
+    dest_address: int,
+    size: int,
+    pattern: typing.Union[bytes, bytearray] = b"\x00",
+):
+    assert len(pattern) in [1, 2, 4, 8, 16]
+
+    launches = _plan_fill(dest_address, size, bytes(pattern))
+
+    for (index, launch) in enumerate(launches):
+        command_buffer.write_method(
+            NVB0B5_SET_REMAP_CONST_A,
+            SUBCHANNEL_ID_DMA,
+            [
+                NVB0B5_SET_REMAP_CONST_A_V(launch.const_a),
+                NVB0B5_SET_REMAP_CONST_B_V(launch.const_b),
+                launch.remap_components,
+            ],
+        )
+
+        # NOTE: Every component comes from the constants, the source is never read.
+        command_buffer.write_method(
+            NVB0B5_OFFSET_IN_UPPER,
+            SUBCHANNEL_ID_DMA,
+            [
+                (launch.address >> 32) & 0xFFFFFFFF,
+                launch.address & 0xFFFFFFFF,
+                (launch.address >> 32) & 0xFFFFFFFF,
+                launch.address & 0xFFFFFFFF,
+                NVB0B5_PITCH_IN_VALUE(launch.pitch),
+                NVB0B5_PITCH_OUT_VALUE(launch.pitch),
+                NVB0B5_LINE_LENGTH_IN_VALUE(launch.line_length),
+                NVB0B5_LINE_COUNT_VALUE(launch.line_count),
+            ],
+        )
+
+        launch_dma_value = (
+            _get_launch_dma_ordering(index == 0, index + 1 == len(launches))
             | NVB0B5_LAUNCH_DMA_SRC_MEMORY_LAYOUT(
                 NVB0B5_LAUNCH_DMA_SRC_MEMORY_LAYOUT_PITCH
             )
@@ -46,17 +408,43 @@ def memcpy_device_to_device(
                 NVB0B5_LAUNCH_DMA_DST_MEMORY_LAYOUT_PITCH
             )
             | NVB0B5_LAUNCH_DMA_DST_TYPE(NVB0B5_LAUNCH_DMA_DST_TYPE_VIRTUAL)
+            | NVB0B5_LAUNCH_DMA_REMAP_ENABLE(NVB0B5_LAUNCH_DMA_REMAP_ENABLE_TRUE)
         )
-        command_buffer.write_u32(
-            InlineCommand(NVB0B5_LAUNCH_DMA, SUBCHANNEL_ID_DMA, launch_dma_value)
+
+        if launch.line_count > 1:
+            launch_dma_value |= NVB0B5_LAUNCH_DMA_MULTI_LINE_ENABLE(
+                NVB0B5_LAUNCH_DMA_MULTI_LINE_ENABLE_TRUE
+            )
+
+        command_buffer.write_method(
+            NVB0B5_LAUNCH_DMA, SUBCHANNEL_ID_DMA, [launch_dma_value]
         )
 
-        src_address += copy_size
-        dest_address += copy_size
-        size -= copy_size
 
-    command_buffer.write_u32(
-        InlineCommand(NVB0B5_NOP, SUBCHANNEL_ID_DMA, NVB0B5_NOP_PARAMETER(0))
+def release_semaphore(command_buffer: CommandBuffer, address: int, payload: int):
+    """Write payload at address once the previous copies of the copy engine completed"""
+
+    command_buffer.write_method(
+        NVB0B5_SET_SEMAPHORE_A,
+        SUBCHANNEL_ID_DMA,
+        [
+            NVB0B5_SET_SEMAPHORE_A_UPPER((address >> 32) & 0xFFFFFFFF),
+            NVB0B5_SET_SEMAPHORE_B_LOWER(address & 0xFFFFFFFF),
+            NVB0B5_SET_SEMAPHORE_PAYLOAD_PAYLOAD(payload),
+        ],
+    )
+
+    # NOTE: A launch without transfer, it runs after the previous launches like any other.
+    command_buffer.write_method(
+        NVB0B5_LAUNCH_DMA,
+        SUBCHANNEL_ID_DMA,
+        [
+            NVB0B5_LAUNCH_DMA_DATA_TRANSFER_TYPE(NVB0B5_LAUNCH_DMA_DATA_TRANSFER_TYPE_NONE)
+            | NVB0B5_LAUNCH_DMA_FLUSH_ENABLE(NVB0B5_LAUNCH_DMA_FLUSH_ENABLE_TRUE)
+            | NVB0B5_LAUNCH_DMA_SEMAPHORE_TYPE(
+                NVB0B5_LAUNCH_DMA_SEMAPHORE_TYPE_RELEASE_ONE_WORD_SEMAPHORE
+            )
+        ],
     )
 
 
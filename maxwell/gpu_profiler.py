@@ -0,0 +1,238 @@
+from array import array
+from command_buffer import *
+from maxwell.hw.compute_b import *
+from maxwell.hw.dma_copy_a import *
+from nvgpu import GpuMemory, NvHostGpuCtrl
+from nvgpu_header import NVGPU_GPU_GET_CPU_TIME_CORRELATION_INFO_SRC_ID_TSC
+
+import time
+import typing
+
+# Four words semaphore release: payload, reserved, then a 64 bits timestamp in nanoseconds.
+TIMESTAMP_SIZE = 0x10
+TIMESTAMP_OFFSET = 0x8
+
+
+def write_compute_timestamp(command_buffer: CommandBuffer, address: int, payload: int = 0):
+    command_buffer.write_method(
+        NVB1C0_SET_REPORT_SEMAPHORE_A,
+        SUBCHANNEL_ID_COMPUTE,
+        [
+            NVB1C0_SET_REPORT_SEMAPHORE_A_OFFSET_UPPER(address >> 32),
+            NVB1C0_SET_REPORT_SEMAPHORE_B_OFFSET_LOWER(address & 0xFFFFFFFF),
+            NVB1C0_SET_REPORT_SEMAPHORE_C_PAYLOAD(payload),
+            NVB1C0_SET_REPORT_SEMAPHORE_D_OPERATION(
+                NVB1C0_SET_REPORT_SEMAPHORE_D_OPERATION_RELEASE
+            )
+            | NVB1C0_SET_REPORT_SEMAPHORE_D_STRUCTURE_SIZE(
+                NVB1C0_SET_REPORT_SEMAPHORE_D_STRUCTURE_SIZE_FOUR_WORDS
+            ),
+        ],
+    )
+
+
+def write_copy_timestamp(command_buffer: CommandBuffer, address: int, payload: int = 0):
+    command_buffer.write_method(
+        NVB0B5_SET_SEMAPHORE_A,
+        SUBCHANNEL_ID_DMA,
+        [
+            NVB0B5_SET_SEMAPHORE_A_UPPER(address >> 32),
+            NVB0B5_SET_SEMAPHORE_B_LOWER(address & 0xFFFFFFFF),
+            NVB0B5_SET_SEMAPHORE_PAYLOAD_PAYLOAD(payload),
+        ],
+    )
+
+    # A launch without any transfer, only ordered after the previous copies.
+    command_buffer.write_method(
+        NVB0B5_LAUNCH_DMA,
+        SUBCHANNEL_ID_DMA,
+        [
+            NVB0B5_LAUNCH_DMA_DATA_TRANSFER_TYPE(NVB0B5_LAUNCH_DMA_DATA_TRANSFER_TYPE_NONE)
+            | NVB0B5_LAUNCH_DMA_FLUSH_ENABLE(NVB0B5_LAUNCH_DMA_FLUSH_ENABLE_TRUE)
+            | NVB0B5_LAUNCH_DMA_SEMAPHORE_TYPE(
+                NVB0B5_LAUNCH_DMA_SEMAPHORE_TYPE_RELEASE_FOUR_WORD_SEMAPHORE
+            )
+        ],
+    )
+
+
+class GpuClockCorrelation(object):
+    """
+    Offset from the GPU timestamps to the CPU monotonic clock.
+
+    The kernel pairs each GPU sample with a raw CPU counter (TSC) value, which can't be converted to
+    the monotonic clock from Python. Only the GPU value of a single sample is used: the ioctl is
+    bracketed with the monotonic clock, the GPU sample is assumed to be taken at the middle of the
+    bracket and half of its width is the uncertainty. The tightest of a few rounds is kept.
+    """
+
+    gpu_to_cpu_offset: int
+    uncertainty: int
+
+    def __init__(self, gpu_to_cpu_offset: int, uncertainty: int) -> None:
+        self.gpu_to_cpu_offset = gpu_to_cpu_offset
+        self.uncertainty = uncertainty
+
+    @staticmethod
+    def measure(ctrl: NvHostGpuCtrl, round_count: int = 8) -> "GpuClockCorrelation":
+        result: typing.Optional[GpuClockCorrelation] = None
+
+        for _ in range(round_count):
+            start = time.monotonic_ns()
+            # A single sample keeps the bracket as tight as possible.
+            (_, gpu_timestamp) = ctrl.get_cpu_time_correlation_info(
+                1, NVGPU_GPU_GET_CPU_TIME_CORRELATION_INFO_SRC_ID_TSC
+            )[0]
+            end = time.monotonic_ns()
+
+            uncertainty = (end - start) // 2
+
+            if result is None or uncertainty < result.uncertainty:
+                result = GpuClockCorrelation((start + end) // 2 - gpu_timestamp, uncertainty)
+
+        assert result is not None
+
+        return result
+
+    def to_cpu_time(self, gpu_timestamp: int) -> int:
+        """GPU timestamp to CPU monotonic time, in nanoseconds"""
+
+        return gpu_timestamp + self.gpu_to_cpu_offset
+
+
+class GpuTiming(object):
+    name: str
+    subchannel: int
+    start: int
+    end: int
+
+    def __init__(self, name: str, subchannel: int, start: int, end: int) -> None:
+        self.name = name
+        self.subchannel = subchannel
+        self.start = start
+        self.end = end
+
+    @property
+    def duration(self) -> int:
+        return self.end - self.start
+
+    def __repr__(self) -> str:
+        return f"GpuTiming(name={self.name}, subchannel={self.subchannel}, start={self.start}, end={self.end}, duration={self.duration})"
+
+
+class _ProfilerScope(object):
+    name: str
+    subchannel: int
+    start_slot: int
+    end_slot: typing.Optional[int]
+
+    def __init__(self, name: str, subchannel: int, start_slot: int) -> None:
+        self.name = name
+        self.subchannel = subchannel
+        self.start_slot = start_slot
+        self.end_slot = None
+
+
+class GpuProfiler(object):
+    """
+    Brackets operations with GPU timestamps written in a timestamp pool.
+
+    Compute operations (execute_job) use report semaphores, copies (blit, memcpy_device_to_device)
+    use copy engine semaphores. Results can be read once the submissions completed.
+    """
+
+    memory: GpuMemory
+    slot_count: int
+    scopes: typing.List[_ProfilerScope]
+
+    _next_slot: int
+
+    def __init__(self, memory: GpuMemory) -> None:
+        self.memory = memory
+        self.slot_count = memory.gpu_memory_size // TIMESTAMP_SIZE
+        self.scopes = list()
+        self._next_slot = 0
+
+    def _write_timestamp(self, command_buffer: CommandBuffer, subchannel: int) -> int:
+        if self._next_slot == self.slot_count:
+            raise Exception("GPU profiler timestamp pool exhausted")
+
+        slot = self._next_slot
+        self._next_slot += 1
+
+        address = self.memory.gpu_address + slot * TIMESTAMP_SIZE
+
+        if subchannel == SUBCHANNEL_ID_COMPUTE:
+            write_compute_timestamp(command_buffer, address, slot)
+        elif subchannel == SUBCHANNEL_ID_DMA:
+            write_copy_timestamp(command_buffer, address, slot)
+        else:
+            raise Exception(f"Unsupported subchannel {subchannel} for GPU timestamps")
+
+        return slot
+
+    def begin(
+        self, command_buffer: CommandBuffer, name: str, subchannel: int = SUBCHANNEL_ID_COMPUTE
+    ) -> int:
+        self.scopes.append(
+            _ProfilerScope(name, subchannel, self._write_timestamp(command_buffer, subchannel))
+        )
+
+        return len(self.scopes) - 1
+
+    def end(self, command_buffer: CommandBuffer, scope_index: int) -> None:
+        scope = self.scopes[scope_index]
+
+        assert scope.end_slot is None
+
+        scope.end_slot = self._write_timestamp(command_buffer, scope.subchannel)
+
+    def _read_timestamp(self, slot: int) -> int:
+        offset = slot * TIMESTAMP_SIZE + TIMESTAMP_OFFSET
+
+        return array("Q", self.memory[offset : offset + 8])[0]
+
+    def resolve(
+        self, correlation: typing.Optional[GpuClockCorrelation] = None
+    ) -> typing.List[GpuTiming]:
+        """Timings of the finished scopes, in CPU monotonic time if a correlation is given"""
+
+        result: typing.List[GpuTiming] = list()
+
+        for scope in self.scopes:
+            if scope.end_slot is None:
+                continue
+
+            start = self._read_timestamp(scope.start_slot)
+            end = self._read_timestamp(scope.end_slot)
+
+            if correlation is not None:
+                start = correlation.to_cpu_time(start)
+                end = correlation.to_cpu_time(end)
+
+            result.append(GpuTiming(scope.name, scope.subchannel, start, end))
+
+        return result
+
+    def reset(self) -> None:
+        self.scopes.clear()
+        self._next_slot = 0
+
+
+def format_timings(timings: typing.List[GpuTiming]) -> str:
+    """Per operation GPU durations, slowest operations in total first"""
+
+    totals: typing.Dict[str, typing.List[int]] = dict()
+
+    for timing in timings:
+        totals.setdefault(timing.name, list()).append(timing.duration)
+
+    lines = [f"{'operation':<32} {'count':>8} {'total (us)':>12} {'mean (us)':>12} {'max (us)':>12}"]
+
+    for (name, durations) in sorted(totals.items(), key=lambda item: -sum(item[1])):
+        total = sum(durations)
+        lines.append(
+            f"{name:<32} {len(durations):>8} {total / 1000:>12.3f} {total / len(durations) / 1000:>12.3f} {max(durations) / 1000:>12.3f}"
+        )
+
+    return "\n".join(lines)
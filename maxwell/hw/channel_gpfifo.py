@@ -104,307 +104,307 @@ NVB06F_DMA_OPCODE_NONINC_METHOD: int = 0x2
 
 
 def NVB06F_SET_OBJECT_NVCLASS(value: int) -> int:
-    return set_bits(0, 15, value)
+    return set_bits(0, 16, value)
 
 
 def NVB06F_SET_OBJECT_ENGINE(value: int) -> int:
-    return set_bits(16, 4, value)
+    return set_bits(16, 5, value)
 
 
 def NVB06F_ILLEGAL_HANDLE(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NVB06F_NOP_HANDLE(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NVB06F_SEMAPHOREA_OFFSET_UPPER(value: int) -> int:
-    return set_bits(0, 7, value)
+    return set_bits(0, 8, value)
 
 
 def NVB06F_SEMAPHOREB_OFFSET_LOWER(value: int) -> int:
-    return set_bits(2, 29, value)
+    return set_bits(2, 30, value)
 
 
 def NVB06F_SEMAPHOREC_PAYLOAD(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NVB06F_SEMAPHORED_OPERATION(value: int) -> int:
-    return set_bits(0, 4, value)
+    return set_bits(0, 5, value)
 
 
 def NVB06F_SEMAPHORED_ACQUIRE_SWITCH(value: int) -> int:
-    return set_bits(12, 0, value)
+    return set_bits(12, 1, value)
 
 
 def NVB06F_SEMAPHORED_RELEASE_WFI(value: int) -> int:
-    return set_bits(20, 0, value)
+    return set_bits(20, 1, value)
 
 
 def NVB06F_SEMAPHORED_RELEASE_SIZE(value: int) -> int:
-    return set_bits(24, 0, value)
+    return set_bits(24, 1, value)
 
 
 def NVB06F_SEMAPHORED_REDUCTION(value: int) -> int:
-    return set_bits(27, 3, value)
+    return set_bits(27, 4, value)
 
 
 def NVB06F_SEMAPHORED_FORMAT(value: int) -> int:
-    return set_bits(31, 0, value)
+    return set_bits(31, 1, value)
 
 
 def NVB06F_NON_STALL_INTERRUPT_HANDLE(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NVB06F_FB_FLUSH_HANDLE(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NVB06F_MEM_OP_C_OPERAND_LOW(value: int) -> int:
-    return set_bits(2, 29, value)
+    return set_bits(2, 30, value)
 
 
 def NVB06F_MEM_OP_C_TLB_INVALIDATE_PDB(value: int) -> int:
-    return set_bits(0, 0, value)
+    return set_bits(0, 1, value)
 
 
 def NVB06F_MEM_OP_C_TLB_INVALIDATE_GPC(value: int) -> int:
-    return set_bits(1, 0, value)
+    return set_bits(1, 1, value)
 
 
 def NVB06F_MEM_OP_C_TLB_INVALIDATE_TARGET(value: int) -> int:
-    return set_bits(10, 1, value)
+    return set_bits(10, 2, value)
 
 
 def NVB06F_MEM_OP_C_TLB_INVALIDATE_ADDR_LO(value: int) -> int:
-    return set_bits(12, 19, value)
+    return set_bits(12, 20, value)
 
 
 def NVB06F_MEM_OP_D_OPERAND_HIGH(value: int) -> int:
-    return set_bits(0, 7, value)
+    return set_bits(0, 8, value)
 
 
 def NVB06F_MEM_OP_D_OPERATION(value: int) -> int:
-    return set_bits(27, 4, value)
+    return set_bits(27, 5, value)
 
 
 def NVB06F_MEM_OP_D_TLB_INVALIDATE_ADDR_HI(value: int) -> int:
-    return set_bits(0, 7, value)
+    return set_bits(0, 8, value)
 
 
 def NVB06F_SET_REFERENCE_COUNT(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NVB06F_WFI_SCOPE(value: int) -> int:
-    return set_bits(0, 0, value)
+    return set_bits(0, 1, value)
 
 
 def NVB06F_CRC_CHECK_VALUE(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NVB06F_YIELD_OP(value: int) -> int:
-    return set_bits(0, 1, value)
+    return set_bits(0, 2, value)
 
 
 def NVB06F_GP_ENTRY0_FETCH(value: int) -> int:
-    return set_bits(0, 0, value)
+    return set_bits(0, 1, value)
 
 
 def NVB06F_GP_ENTRY0_GET(value: int) -> int:
-    return set_bits(2, 29, value)
+    return set_bits(2, 30, value)
 
 
 def NVB06F_GP_ENTRY0_OPERAND(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NVB06F_GP_ENTRY1_GET_HI(value: int) -> int:
-    return set_bits(0, 7, value)
+    return set_bits(0, 8, value)
 
 
 def NVB06F_GP_ENTRY1_PRIV(value: int) -> int:
-    return set_bits(8, 0, value)
+    return set_bits(8, 1, value)
 
 
 def NVB06F_GP_ENTRY1_LEVEL(value: int) -> int:
-    return set_bits(9, 0, value)
+    return set_bits(9, 1, value)
 
 
 def NVB06F_GP_ENTRY1_LENGTH(value: int) -> int:
-    return set_bits(10, 20, value)
+    return set_bits(10, 21, value)
 
 
 def NVB06F_GP_ENTRY1_SYNC(value: int) -> int:
-    return set_bits(31, 0, value)
+    return set_bits(31, 1, value)
 
 
 def NVB06F_GP_ENTRY1_OPCODE(value: int) -> int:
-    return set_bits(0, 7, value)
+    return set_bits(0, 8, value)
 
 
 def NVB06F_DMA_METHOD_ADDRESS_OLD(value: int) -> int:
-    return set_bits(2, 10, value)
+    return set_bits(2, 11, value)
 
 
 def NVB06F_DMA_METHOD_ADDRESS(value: int) -> int:
-    return set_bits(0, 11, value)
+    return set_bits(0, 12, value)
 
 
 def NVB06F_DMA_SUBDEVICE_MASK(value: int) -> int:
-    return set_bits(4, 11, value)
+    return set_bits(4, 12, value)
 
 
 def NVB06F_DMA_METHOD_SUBCHANNEL(value: int) -> int:
-    return set_bits(13, 2, value)
+    return set_bits(13, 3, value)
 
 
 def NVB06F_DMA_TERT_OP(value: int) -> int:
-    return set_bits(16, 1, value)
+    return set_bits(16, 2, value)
 
 
 def NVB06F_DMA_METHOD_COUNT_OLD(value: int) -> int:
-    return set_bits(18, 10, value)
+    return set_bits(18, 11, value)
 
 
 def NVB06F_DMA_METHOD_COUNT(value: int) -> int:
-    return set_bits(16, 12, value)
+    return set_bits(16, 13, value)
 
 
 def NVB06F_DMA_IMMD_DATA(value: int) -> int:
-    return set_bits(16, 12, value)
+    return set_bits(16, 13, value)
 
 
 def NVB06F_DMA_SEC_OP(value: int) -> int:
-    return set_bits(29, 2, value)
+    return set_bits(29, 3, value)
 
 
 def NVB06F_DMA_INCR_ADDRESS(value: int) -> int:
-    return set_bits(0, 11, value)
+    return set_bits(0, 12, value)
 
 
 def NVB06F_DMA_INCR_SUBCHANNEL(value: int) -> int:
-    return set_bits(13, 2, value)
+    return set_bits(13, 3, value)
 
 
 def NVB06F_DMA_INCR_COUNT(value: int) -> int:
-    return set_bits(16, 12, value)
+    return set_bits(16, 13, value)
 
 
 def NVB06F_DMA_INCR_OPCODE(value: int) -> int:
-    return set_bits(29, 2, value)
+    return set_bits(29, 3, value)
 
 
 def NVB06F_DMA_INCR_DATA(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NVB06F_DMA_NONINCR_ADDRESS(value: int) -> int:
-    return set_bits(0, 11, value)
+    return set_bits(0, 12, value)
 
 
 def NVB06F_DMA_NONINCR_SUBCHANNEL(value: int) -> int:
-    return set_bits(13, 2, value)
+    return set_bits(13, 3, value)
 
 
 def NVB06F_DMA_NONINCR_COUNT(value: int) -> int:
-    return set_bits(16, 12, value)
+    return set_bits(16, 13, value)
 
 
 def NVB06F_DMA_NONINCR_OPCODE(value: int) -> int:
-    return set_bits(29, 2, value)
+    return set_bits(29, 3, value)
 
 
 def NVB06F_DMA_NONINCR_DATA(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NVB06F_DMA_ONEINCR_ADDRESS(value: int) -> int:
-    return set_bits(0, 11, value)
+    return set_bits(0, 12, value)
 
 
 def NVB06F_DMA_ONEINCR_SUBCHANNEL(value: int) -> int:
-    return set_bits(13, 2, value)
+    return set_bits(13, 3, value)
 
 
 def NVB06F_DMA_ONEINCR_COUNT(value: int) -> int:
-    return set_bits(16, 12, value)
+    return set_bits(16, 13, value)
 
 
 def NVB06F_DMA_ONEINCR_OPCODE(value: int) -> int:
-    return set_bits(29, 2, value)
+    return set_bits(29, 3, value)
 
 
 def NVB06F_DMA_ONEINCR_DATA(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NVB06F_DMA_IMMD_ADDRESS(value: int) -> int:
-    return set_bits(0, 11, value)
+    return set_bits(0, 12, value)
 
 
 def NVB06F_DMA_IMMD_SUBCHANNEL(value: int) -> int:
-    return set_bits(13, 2, value)
+    return set_bits(13, 3, value)
 
 
 def NVB06F_DMA_IMMD_DATA(value: int) -> int:
-    return set_bits(16, 12, value)
+    return set_bits(16, 13, value)
 
 
 def NVB06F_DMA_IMMD_OPCODE(value: int) -> int:
-    return set_bits(29, 2, value)
+    return set_bits(29, 3, value)
 
 
 def NVB06F_DMA_SET_SUBDEVICE_MASK_VALUE(value: int) -> int:
-    return set_bits(4, 11, value)
+    return set_bits(4, 12, value)
 
 
 def NVB06F_DMA_SET_SUBDEVICE_MASK_OPCODE(value: int) -> int:
-    return set_bits(16, 15, value)
+    return set_bits(16, 16, value)
 
 
 def NVB06F_DMA_STORE_SUBDEVICE_MASK_VALUE(value: int) -> int:
-    return set_bits(4, 11, value)
+    return set_bits(4, 12, value)
 
 
 def NVB06F_DMA_STORE_SUBDEVICE_MASK_OPCODE(value: int) -> int:
-    return set_bits(16, 15, value)
+    return set_bits(16, 16, value)
 
 
 def NVB06F_DMA_USE_SUBDEVICE_MASK_OPCODE(value: int) -> int:
-    return set_bits(16, 15, value)
+    return set_bits(16, 16, value)
 
 
 def NVB06F_DMA_ENDSEG_OPCODE(value: int) -> int:
-    return set_bits(29, 2, value)
+    return set_bits(29, 3, value)
 
 
 def NVB06F_DMA_ADDRESS(value: int) -> int:
-    return set_bits(2, 10, value)
+    return set_bits(2, 11, value)
 
 
 def NVB06F_DMA_SUBCH(value: int) -> int:
-    return set_bits(13, 2, value)
+    return set_bits(13, 3, value)
 
 
 def NVB06F_DMA_OPCODE3(value: int) -> int:
-    return set_bits(16, 1, value)
+    return set_bits(16, 2, value)
 
 
 def NVB06F_DMA_COUNT(value: int) -> int:
-    return set_bits(18, 10, value)
+    return set_bits(18, 11, value)
 
 
 def NVB06F_DMA_OPCODE(value: int) -> int:
-    return set_bits(29, 2, value)
+    return set_bits(29, 3, value)
 
 
 def NVB06F_DMA_DATA(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 
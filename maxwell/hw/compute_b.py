@@ -304,935 +304,935 @@ NVB1C0_STOP_SHADER_PERFORMANCE_COUNTER: int = 0x33E4
 
 
 def NVB1C0_SET_OBJECT_CLASS_ID(value: int) -> int:
-    return set_bits(0, 15, value)
+    return set_bits(0, 16, value)
 
 
 def NVB1C0_SET_OBJECT_ENGINE_ID(value: int) -> int:
-    return set_bits(16, 4, value)
+    return set_bits(16, 5, value)
 
 
 def NVB1C0_NO_OPERATION_V(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NVB1C0_SET_NOTIFY_A_ADDRESS_UPPER(value: int) -> int:
-    return set_bits(0, 7, value)
+    return set_bits(0, 8, value)
 
 
 def NVB1C0_SET_NOTIFY_B_ADDRESS_LOWER(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NVB1C0_NOTIFY_TYPE(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NVB1C0_WAIT_FOR_IDLE_V(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NVB1C0_SET_GLOBAL_RENDER_ENABLE_A_OFFSET_UPPER(value: int) -> int:
-    return set_bits(0, 7, value)
+    return set_bits(0, 8, value)
 
 
 def NVB1C0_SET_GLOBAL_RENDER_ENABLE_B_OFFSET_LOWER(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NVB1C0_SET_GLOBAL_RENDER_ENABLE_C_MODE(value: int) -> int:
-    return set_bits(0, 2, value)
+    return set_bits(0, 3, value)
 
 
 def NVB1C0_SEND_GO_IDLE_V(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NVB1C0_PM_TRIGGER_V(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NVB1C0_PM_TRIGGER_WFI_V(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NVB1C0_SET_INSTRUMENTATION_METHOD_HEADER_V(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NVB1C0_SET_INSTRUMENTATION_METHOD_DATA_V(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NVB1C0_LINE_LENGTH_IN_VALUE(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NVB1C0_LINE_COUNT_VALUE(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NVB1C0_OFFSET_OUT_UPPER_VALUE(value: int) -> int:
-    return set_bits(0, 7, value)
+    return set_bits(0, 8, value)
 
 
 def NVB1C0_OFFSET_OUT_VALUE(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NVB1C0_PITCH_OUT_VALUE(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NVB1C0_SET_DST_BLOCK_SIZE_WIDTH(value: int) -> int:
-    return set_bits(0, 3, value)
+    return set_bits(0, 4, value)
 
 
 def NVB1C0_SET_DST_BLOCK_SIZE_HEIGHT(value: int) -> int:
-    return set_bits(4, 3, value)
+    return set_bits(4, 4, value)
 
 
 def NVB1C0_SET_DST_BLOCK_SIZE_DEPTH(value: int) -> int:
-    return set_bits(8, 3, value)
+    return set_bits(8, 4, value)
 
 
 def NVB1C0_SET_DST_WIDTH_V(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NVB1C0_SET_DST_HEIGHT_V(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NVB1C0_SET_DST_DEPTH_V(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NVB1C0_SET_DST_LAYER_V(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NVB1C0_SET_DST_ORIGIN_BYTES_X_V(value: int) -> int:
-    return set_bits(0, 19, value)
+    return set_bits(0, 20, value)
 
 
 def NVB1C0_SET_DST_ORIGIN_SAMPLES_Y_V(value: int) -> int:
-    return set_bits(0, 15, value)
+    return set_bits(0, 16, value)
 
 
 def NVB1C0_LAUNCH_DMA_DST_MEMORY_LAYOUT(value: int) -> int:
-    return set_bits(0, 0, value)
+    return set_bits(0, 1, value)
 
 
 def NVB1C0_LAUNCH_DMA_COMPLETION_TYPE(value: int) -> int:
-    return set_bits(4, 1, value)
+    return set_bits(4, 2, value)
 
 
 def NVB1C0_LAUNCH_DMA_INTERRUPT_TYPE(value: int) -> int:
-    return set_bits(8, 1, value)
+    return set_bits(8, 2, value)
 
 
 def NVB1C0_LAUNCH_DMA_SEMAPHORE_STRUCT_SIZE(value: int) -> int:
-    return set_bits(12, 0, value)
+    return set_bits(12, 1, value)
 
 
 def NVB1C0_LAUNCH_DMA_REDUCTION_ENABLE(value: int) -> int:
-    return set_bits(1, 0, value)
+    return set_bits(1, 1, value)
 
 
 def NVB1C0_LAUNCH_DMA_REDUCTION_OP(value: int) -> int:
-    return set_bits(13, 2, value)
+    return set_bits(13, 3, value)
 
 
 def NVB1C0_LAUNCH_DMA_REDUCTION_FORMAT(value: int) -> int:
-    return set_bits(2, 1, value)
+    return set_bits(2, 2, value)
 
 
 def NVB1C0_LAUNCH_DMA_SYSMEMBAR_DISABLE(value: int) -> int:
-    return set_bits(6, 0, value)
+    return set_bits(6, 1, value)
 
 
 def NVB1C0_LOAD_INLINE_DATA_V(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NVB1C0_SET_I2M_SEMAPHORE_A_OFFSET_UPPER(value: int) -> int:
-    return set_bits(0, 7, value)
+    return set_bits(0, 8, value)
 
 
 def NVB1C0_SET_I2M_SEMAPHORE_B_OFFSET_LOWER(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NVB1C0_SET_I2M_SEMAPHORE_C_PAYLOAD(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NVB1C0_SET_I2M_SPARE_NOOP00_V(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NVB1C0_SET_I2M_SPARE_NOOP01_V(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NVB1C0_SET_I2M_SPARE_NOOP02_V(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NVB1C0_SET_I2M_SPARE_NOOP03_V(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NVB1C0_SET_VALID_SPAN_OVERFLOW_AREA_A_ADDRESS_UPPER(value: int) -> int:
-    return set_bits(0, 7, value)
+    return set_bits(0, 8, value)
 
 
 def NVB1C0_SET_VALID_SPAN_OVERFLOW_AREA_B_ADDRESS_LOWER(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NVB1C0_SET_VALID_SPAN_OVERFLOW_AREA_C_SIZE(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NVB1C0_SET_COALESCE_WAITING_PERIOD_UNIT_CLOCKS(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NVB1C0_PERFMON_TRANSFER_V(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NVB1C0_SET_SHADER_SHARED_MEMORY_WINDOW_BASE_ADDRESS(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NVB1C0_SET_SELECT_MAXWELL_TEXTURE_HEADERS_V(value: int) -> int:
-    return set_bits(0, 0, value)
+    return set_bits(0, 1, value)
 
 
 def NVB1C0_INVALIDATE_SHADER_CACHES_INSTRUCTION(value: int) -> int:
-    return set_bits(0, 0, value)
+    return set_bits(0, 1, value)
 
 
 def NVB1C0_INVALIDATE_SHADER_CACHES_DATA(value: int) -> int:
-    return set_bits(4, 0, value)
+    return set_bits(4, 1, value)
 
 
 def NVB1C0_INVALIDATE_SHADER_CACHES_CONSTANT(value: int) -> int:
-    return set_bits(12, 0, value)
+    return set_bits(12, 1, value)
 
 
 def NVB1C0_INVALIDATE_SHADER_CACHES_LOCKS(value: int) -> int:
-    return set_bits(1, 0, value)
+    return set_bits(1, 1, value)
 
 
 def NVB1C0_INVALIDATE_SHADER_CACHES_FLUSH_DATA(value: int) -> int:
-    return set_bits(2, 0, value)
+    return set_bits(2, 1, value)
 
 
 def NVB1C0_SET_RESERVED_SW_METHOD00_V(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NVB1C0_SET_RESERVED_SW_METHOD01_V(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NVB1C0_SET_RESERVED_SW_METHOD02_V(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NVB1C0_SET_RESERVED_SW_METHOD03_V(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NVB1C0_SET_RESERVED_SW_METHOD04_V(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NVB1C0_SET_RESERVED_SW_METHOD05_V(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NVB1C0_SET_RESERVED_SW_METHOD06_V(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NVB1C0_SET_RESERVED_SW_METHOD07_V(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NVB1C0_SET_CWD_CONTROL_SM_SELECTION(value: int) -> int:
-    return set_bits(0, 0, value)
+    return set_bits(0, 1, value)
 
 
 def NVB1C0_INVALIDATE_TEXTURE_HEADER_CACHE_NO_WFI_LINES(value: int) -> int:
-    return set_bits(0, 0, value)
+    return set_bits(0, 1, value)
 
 
 def NVB1C0_INVALIDATE_TEXTURE_HEADER_CACHE_NO_WFI_TAG(value: int) -> int:
-    return set_bits(4, 21, value)
+    return set_bits(4, 22, value)
 
 
 def NVB1C0_SET_CWD_REF_COUNTER_SELECT(value: int) -> int:
-    return set_bits(0, 5, value)
+    return set_bits(0, 6, value)
 
 
 def NVB1C0_SET_CWD_REF_COUNTER_VALUE(value: int) -> int:
-    return set_bits(8, 15, value)
+    return set_bits(8, 16, value)
 
 
 def NVB1C0_SET_RESERVED_SW_METHOD08_V(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NVB1C0_SET_RESERVED_SW_METHOD09_V(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NVB1C0_SET_RESERVED_SW_METHOD10_V(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NVB1C0_SET_RESERVED_SW_METHOD11_V(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NVB1C0_SET_RESERVED_SW_METHOD12_V(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NVB1C0_SET_RESERVED_SW_METHOD13_V(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NVB1C0_SET_RESERVED_SW_METHOD14_V(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NVB1C0_SET_RESERVED_SW_METHOD15_V(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NVB1C0_SET_GWC_SCG_TYPE_SCG_TYPE(value: int) -> int:
-    return set_bits(0, 0, value)
+    return set_bits(0, 1, value)
 
 
 def NVB1C0_SET_SCG_CONTROL_COMPUTE1_MAX_SM_COUNT(value: int) -> int:
-    return set_bits(0, 8, value)
+    return set_bits(0, 9, value)
 
 
 def NVB1C0_INVALIDATE_CONSTANT_BUFFER_CACHE_A_ADDRESS_UPPER(value: int) -> int:
-    return set_bits(0, 7, value)
+    return set_bits(0, 8, value)
 
 
 def NVB1C0_INVALIDATE_CONSTANT_BUFFER_CACHE_B_ADDRESS_LOWER(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NVB1C0_INVALIDATE_CONSTANT_BUFFER_CACHE_C_BYTE_COUNT(value: int) -> int:
-    return set_bits(0, 16, value)
+    return set_bits(0, 17, value)
 
 
 def NVB1C0_INVALIDATE_CONSTANT_BUFFER_CACHE_C_THRU_L2(value: int) -> int:
-    return set_bits(31, 0, value)
+    return set_bits(31, 1, value)
 
 
 def NVB1C0_SET_COMPUTE_CLASS_VERSION_CURRENT(value: int) -> int:
-    return set_bits(0, 15, value)
+    return set_bits(0, 16, value)
 
 
 def NVB1C0_SET_COMPUTE_CLASS_VERSION_OLDEST_SUPPORTED(value: int) -> int:
-    return set_bits(16, 15, value)
+    return set_bits(16, 16, value)
 
 
 def NVB1C0_CHECK_COMPUTE_CLASS_VERSION_CURRENT(value: int) -> int:
-    return set_bits(0, 15, value)
+    return set_bits(0, 16, value)
 
 
 def NVB1C0_CHECK_COMPUTE_CLASS_VERSION_OLDEST_SUPPORTED(value: int) -> int:
-    return set_bits(16, 15, value)
+    return set_bits(16, 16, value)
 
 
 def NVB1C0_SET_QMD_VERSION_CURRENT(value: int) -> int:
-    return set_bits(0, 15, value)
+    return set_bits(0, 16, value)
 
 
 def NVB1C0_SET_QMD_VERSION_OLDEST_SUPPORTED(value: int) -> int:
-    return set_bits(16, 15, value)
+    return set_bits(16, 16, value)
 
 
 def NVB1C0_SET_WFI_CONFIG_ENABLE_SCG_TYPE_WFI(value: int) -> int:
-    return set_bits(0, 0, value)
+    return set_bits(0, 1, value)
 
 
 def NVB1C0_CHECK_QMD_VERSION_CURRENT(value: int) -> int:
-    return set_bits(0, 15, value)
+    return set_bits(0, 16, value)
 
 
 def NVB1C0_CHECK_QMD_VERSION_OLDEST_SUPPORTED(value: int) -> int:
-    return set_bits(16, 15, value)
+    return set_bits(16, 16, value)
 
 
 def NVB1C0_WAIT_FOR_IDLE_SCG_TYPE_V(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NVB1C0_INVALIDATE_SKED_CACHES_V(value: int) -> int:
-    return set_bits(0, 0, value)
+    return set_bits(0, 1, value)
 
 
 def NVB1C0_SET_SCG_RENDER_ENABLE_CONTROL_COMPUTE1_USES_RENDER_ENABLE(value: int) -> int:
-    return set_bits(0, 0, value)
+    return set_bits(0, 1, value)
 
 
 def NVB1C0_SET_CWD_SLOT_COUNT_V(value: int) -> int:
-    return set_bits(0, 7, value)
+    return set_bits(0, 8, value)
 
 
 def NVB1C0_SEND_PCAS_A_QMD_ADDRESS_SHIFTED8(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NVB1C0_SEND_PCAS_B_FROM(value: int) -> int:
-    return set_bits(0, 23, value)
+    return set_bits(0, 24, value)
 
 
 def NVB1C0_SEND_PCAS_B_DELTA(value: int) -> int:
-    return set_bits(24, 7, value)
+    return set_bits(24, 8, value)
 
 
 def NVB1C0_SEND_SIGNALING_PCAS_B_INVALIDATE(value: int) -> int:
-    return set_bits(0, 0, value)
+    return set_bits(0, 1, value)
 
 
 def NVB1C0_SEND_SIGNALING_PCAS_B_SCHEDULE(value: int) -> int:
-    return set_bits(1, 0, value)
+    return set_bits(1, 1, value)
 
 
 def NVB1C0_SET_SHADER_LOCAL_MEMORY_NON_THROTTLED_A_SIZE_UPPER(value: int) -> int:
-    return set_bits(0, 7, value)
+    return set_bits(0, 8, value)
 
 
 def NVB1C0_SET_SHADER_LOCAL_MEMORY_NON_THROTTLED_B_SIZE_LOWER(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NVB1C0_SET_SHADER_LOCAL_MEMORY_NON_THROTTLED_C_MAX_SM_COUNT(value: int) -> int:
-    return set_bits(0, 8, value)
+    return set_bits(0, 9, value)
 
 
 def NVB1C0_SET_SHADER_LOCAL_MEMORY_THROTTLED_A_SIZE_UPPER(value: int) -> int:
-    return set_bits(0, 7, value)
+    return set_bits(0, 8, value)
 
 
 def NVB1C0_SET_SHADER_LOCAL_MEMORY_THROTTLED_B_SIZE_LOWER(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NVB1C0_SET_SHADER_LOCAL_MEMORY_THROTTLED_C_MAX_SM_COUNT(value: int) -> int:
-    return set_bits(0, 8, value)
+    return set_bits(0, 9, value)
 
 
 def NVB1C0_SET_SPA_VERSION_MINOR(value: int) -> int:
-    return set_bits(0, 7, value)
+    return set_bits(0, 8, value)
 
 
 def NVB1C0_SET_SPA_VERSION_MAJOR(value: int) -> int:
-    return set_bits(8, 7, value)
+    return set_bits(8, 8, value)
 
 
 def NVB1C0_SET_FALCON00_V(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NVB1C0_SET_FALCON01_V(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NVB1C0_SET_FALCON02_V(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NVB1C0_SET_FALCON03_V(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NVB1C0_SET_FALCON04_V(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NVB1C0_SET_FALCON05_V(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NVB1C0_SET_FALCON06_V(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NVB1C0_SET_FALCON07_V(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NVB1C0_SET_FALCON08_V(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NVB1C0_SET_FALCON09_V(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NVB1C0_SET_FALCON10_V(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NVB1C0_SET_FALCON11_V(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NVB1C0_SET_FALCON12_V(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NVB1C0_SET_FALCON13_V(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NVB1C0_SET_FALCON14_V(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NVB1C0_SET_FALCON15_V(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NVB1C0_SET_FALCON16_V(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NVB1C0_SET_FALCON17_V(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NVB1C0_SET_FALCON18_V(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NVB1C0_SET_FALCON19_V(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NVB1C0_SET_FALCON20_V(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NVB1C0_SET_FALCON21_V(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NVB1C0_SET_FALCON22_V(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NVB1C0_SET_FALCON23_V(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NVB1C0_SET_FALCON24_V(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NVB1C0_SET_FALCON25_V(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NVB1C0_SET_FALCON26_V(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NVB1C0_SET_FALCON27_V(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NVB1C0_SET_FALCON28_V(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NVB1C0_SET_FALCON29_V(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NVB1C0_SET_FALCON30_V(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NVB1C0_SET_FALCON31_V(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NVB1C0_SET_SHADER_LOCAL_MEMORY_WINDOW_BASE_ADDRESS(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NVB1C0_SET_SHADER_LOCAL_MEMORY_A_ADDRESS_UPPER(value: int) -> int:
-    return set_bits(0, 7, value)
+    return set_bits(0, 8, value)
 
 
 def NVB1C0_SET_SHADER_LOCAL_MEMORY_B_ADDRESS_LOWER(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NVB1C0_SET_SHADER_CACHE_CONTROL_ICACHE_PREFETCH_ENABLE(value: int) -> int:
-    return set_bits(0, 0, value)
+    return set_bits(0, 1, value)
 
 
 def NVB1C0_SET_SM_TIMEOUT_INTERVAL_COUNTER_BIT(value: int) -> int:
-    return set_bits(0, 5, value)
+    return set_bits(0, 6, value)
 
 
 def NVB1C0_SET_SPARE_NOOP12_V(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NVB1C0_SET_SPARE_NOOP13_V(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NVB1C0_SET_SPARE_NOOP14_V(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NVB1C0_SET_SPARE_NOOP15_V(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NVB1C0_SET_SPARE_NOOP00_V(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NVB1C0_SET_SPARE_NOOP01_V(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NVB1C0_SET_SPARE_NOOP02_V(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NVB1C0_SET_SPARE_NOOP03_V(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NVB1C0_SET_SPARE_NOOP04_V(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NVB1C0_SET_SPARE_NOOP05_V(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NVB1C0_SET_SPARE_NOOP06_V(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NVB1C0_SET_SPARE_NOOP07_V(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NVB1C0_SET_SPARE_NOOP08_V(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NVB1C0_SET_SPARE_NOOP09_V(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NVB1C0_SET_SPARE_NOOP10_V(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NVB1C0_SET_SPARE_NOOP11_V(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NVB1C0_INVALIDATE_SAMPLER_CACHE_ALL_V(value: int) -> int:
-    return set_bits(0, 0, value)
+    return set_bits(0, 1, value)
 
 
 def NVB1C0_INVALIDATE_TEXTURE_HEADER_CACHE_ALL_V(value: int) -> int:
-    return set_bits(0, 0, value)
+    return set_bits(0, 1, value)
 
 
 def NVB1C0_INVALIDATE_TEXTURE_DATA_CACHE_NO_WFI_LINES(value: int) -> int:
-    return set_bits(0, 0, value)
+    return set_bits(0, 1, value)
 
 
 def NVB1C0_INVALIDATE_TEXTURE_DATA_CACHE_NO_WFI_TAG(value: int) -> int:
-    return set_bits(4, 21, value)
+    return set_bits(4, 22, value)
 
 
 def NVB1C0_ACTIVATE_PERF_SETTINGS_FOR_COMPUTE_CONTEXT_ALL(value: int) -> int:
-    return set_bits(0, 0, value)
+    return set_bits(0, 1, value)
 
 
 def NVB1C0_INVALIDATE_SAMPLER_CACHE_LINES(value: int) -> int:
-    return set_bits(0, 0, value)
+    return set_bits(0, 1, value)
 
 
 def NVB1C0_INVALIDATE_SAMPLER_CACHE_TAG(value: int) -> int:
-    return set_bits(4, 21, value)
+    return set_bits(4, 22, value)
 
 
 def NVB1C0_INVALIDATE_TEXTURE_HEADER_CACHE_LINES(value: int) -> int:
-    return set_bits(0, 0, value)
+    return set_bits(0, 1, value)
 
 
 def NVB1C0_INVALIDATE_TEXTURE_HEADER_CACHE_TAG(value: int) -> int:
-    return set_bits(4, 21, value)
+    return set_bits(4, 22, value)
 
 
 def NVB1C0_INVALIDATE_TEXTURE_DATA_CACHE_LINES(value: int) -> int:
-    return set_bits(0, 0, value)
+    return set_bits(0, 1, value)
 
 
 def NVB1C0_INVALIDATE_TEXTURE_DATA_CACHE_TAG(value: int) -> int:
-    return set_bits(4, 21, value)
+    return set_bits(4, 22, value)
 
 
 def NVB1C0_INVALIDATE_SAMPLER_CACHE_NO_WFI_LINES(value: int) -> int:
-    return set_bits(0, 0, value)
+    return set_bits(0, 1, value)
 
 
 def NVB1C0_INVALIDATE_SAMPLER_CACHE_NO_WFI_TAG(value: int) -> int:
-    return set_bits(4, 21, value)
+    return set_bits(4, 22, value)
 
 
 def NVB1C0_SET_SHADER_EXCEPTIONS_ENABLE(value: int) -> int:
-    return set_bits(0, 0, value)
+    return set_bits(0, 1, value)
 
 
 def NVB1C0_SET_RENDER_ENABLE_A_OFFSET_UPPER(value: int) -> int:
-    return set_bits(0, 7, value)
+    return set_bits(0, 8, value)
 
 
 def NVB1C0_SET_RENDER_ENABLE_B_OFFSET_LOWER(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NVB1C0_SET_RENDER_ENABLE_C_MODE(value: int) -> int:
-    return set_bits(0, 2, value)
+    return set_bits(0, 3, value)
 
 
 def NVB1C0_SET_TEX_SAMPLER_POOL_A_OFFSET_UPPER(value: int) -> int:
-    return set_bits(0, 7, value)
+    return set_bits(0, 8, value)
 
 
 def NVB1C0_SET_TEX_SAMPLER_POOL_B_OFFSET_LOWER(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NVB1C0_SET_TEX_SAMPLER_POOL_C_MAXIMUM_INDEX(value: int) -> int:
-    return set_bits(0, 19, value)
+    return set_bits(0, 20, value)
 
 
 def NVB1C0_SET_TEX_HEADER_POOL_A_OFFSET_UPPER(value: int) -> int:
-    return set_bits(0, 7, value)
+    return set_bits(0, 8, value)
 
 
 def NVB1C0_SET_TEX_HEADER_POOL_B_OFFSET_LOWER(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NVB1C0_SET_TEX_HEADER_POOL_C_MAXIMUM_INDEX(value: int) -> int:
-    return set_bits(0, 21, value)
+    return set_bits(0, 22, value)
 
 
 def NVB1C0_SET_PROGRAM_REGION_A_ADDRESS_UPPER(value: int) -> int:
-    return set_bits(0, 7, value)
+    return set_bits(0, 8, value)
 
 
 def NVB1C0_SET_PROGRAM_REGION_B_ADDRESS_LOWER(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NVB1C0_INVALIDATE_SHADER_CACHES_NO_WFI_INSTRUCTION(value: int) -> int:
-    return set_bits(0, 0, value)
+    return set_bits(0, 1, value)
 
 
 def NVB1C0_INVALIDATE_SHADER_CACHES_NO_WFI_GLOBAL_DATA(value: int) -> int:
-    return set_bits(4, 0, value)
+    return set_bits(4, 1, value)
 
 
 def NVB1C0_INVALIDATE_SHADER_CACHES_NO_WFI_CONSTANT(value: int) -> int:
-    return set_bits(12, 0, value)
+    return set_bits(12, 1, value)
 
 
 def NVB1C0_SET_RENDER_ENABLE_OVERRIDE_MODE(value: int) -> int:
-    return set_bits(0, 1, value)
+    return set_bits(0, 2, value)
 
 
 def NVB1C0_PIPE_NOP_V(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NVB1C0_SET_SPARE00_V(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NVB1C0_SET_SPARE01_V(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NVB1C0_SET_SPARE02_V(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NVB1C0_SET_SPARE03_V(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NVB1C0_SET_REPORT_SEMAPHORE_A_OFFSET_UPPER(value: int) -> int:
-    return set_bits(0, 7, value)
+    return set_bits(0, 8, value)
 
 
 def NVB1C0_SET_REPORT_SEMAPHORE_B_OFFSET_LOWER(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NVB1C0_SET_REPORT_SEMAPHORE_C_PAYLOAD(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NVB1C0_SET_REPORT_SEMAPHORE_D_OPERATION(value: int) -> int:
-    return set_bits(0, 1, value)
+    return set_bits(0, 2, value)
 
 
 def NVB1C0_SET_REPORT_SEMAPHORE_D_AWAKEN_ENABLE(value: int) -> int:
-    return set_bits(20, 0, value)
+    return set_bits(20, 1, value)
 
 
 def NVB1C0_SET_REPORT_SEMAPHORE_D_STRUCTURE_SIZE(value: int) -> int:
-    return set_bits(28, 0, value)
+    return set_bits(28, 1, value)
 
 
 def NVB1C0_SET_REPORT_SEMAPHORE_D_FLUSH_DISABLE(value: int) -> int:
-    return set_bits(2, 0, value)
+    return set_bits(2, 1, value)
 
 
 def NVB1C0_SET_REPORT_SEMAPHORE_D_REDUCTION_ENABLE(value: int) -> int:
-    return set_bits(3, 0, value)
+    return set_bits(3, 1, value)
 
 
 def NVB1C0_SET_REPORT_SEMAPHORE_D_REDUCTION_OP(value: int) -> int:
-    return set_bits(9, 2, value)
+    return set_bits(9, 3, value)
 
 
 def NVB1C0_SET_REPORT_SEMAPHORE_D_REDUCTION_FORMAT(value: int) -> int:
-    return set_bits(17, 1, value)
+    return set_bits(17, 2, value)
 
 
 def NVB1C0_SET_BINDLESS_TEXTURE_CONSTANT_BUFFER_SLOT_SELECT(value: int) -> int:
-    return set_bits(0, 2, value)
+    return set_bits(0, 3, value)
 
 
 def NVB1C0_SET_TRAP_HANDLER_OFFSET(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NVB1C0_SET_SHADER_PERFORMANCE_COUNTER_VALUE_UPPER_V(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NVB1C0_SET_SHADER_PERFORMANCE_COUNTER_VALUE_V(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NVB1C0_SET_SHADER_PERFORMANCE_COUNTER_EVENT_EVENT(value: int) -> int:
-    return set_bits(0, 7, value)
+    return set_bits(0, 8, value)
 
 
 def NVB1C0_SET_SHADER_PERFORMANCE_COUNTER_CONTROL_A_EVENT0(value: int) -> int:
-    return set_bits(0, 1, value)
+    return set_bits(0, 2, value)
 
 
 def NVB1C0_SET_SHADER_PERFORMANCE_COUNTER_CONTROL_A_BIT_SELECT0(value: int) -> int:
-    return set_bits(2, 2, value)
+    return set_bits(2, 3, value)
 
 
 def NVB1C0_SET_SHADER_PERFORMANCE_COUNTER_CONTROL_A_EVENT1(value: int) -> int:
-    return set_bits(5, 1, value)
+    return set_bits(5, 2, value)
 
 
 def NVB1C0_SET_SHADER_PERFORMANCE_COUNTER_CONTROL_A_BIT_SELECT1(value: int) -> int:
-    return set_bits(7, 2, value)
+    return set_bits(7, 3, value)
 
 
 def NVB1C0_SET_SHADER_PERFORMANCE_COUNTER_CONTROL_A_EVENT2(value: int) -> int:
-    return set_bits(10, 1, value)
+    return set_bits(10, 2, value)
 
 
 def NVB1C0_SET_SHADER_PERFORMANCE_COUNTER_CONTROL_A_BIT_SELECT2(value: int) -> int:
-    return set_bits(12, 2, value)
+    return set_bits(12, 3, value)
 
 
 def NVB1C0_SET_SHADER_PERFORMANCE_COUNTER_CONTROL_A_EVENT3(value: int) -> int:
-    return set_bits(15, 1, value)
+    return set_bits(15, 2, value)
 
 
 def NVB1C0_SET_SHADER_PERFORMANCE_COUNTER_CONTROL_A_BIT_SELECT3(value: int) -> int:
-    return set_bits(17, 2, value)
+    return set_bits(17, 3, value)
 
 
 def NVB1C0_SET_SHADER_PERFORMANCE_COUNTER_CONTROL_A_EVENT4(value: int) -> int:
-    return set_bits(20, 1, value)
+    return set_bits(20, 2, value)
 
 
 def NVB1C0_SET_SHADER_PERFORMANCE_COUNTER_CONTROL_A_BIT_SELECT4(value: int) -> int:
-    return set_bits(22, 2, value)
+    return set_bits(22, 3, value)
 
 
 def NVB1C0_SET_SHADER_PERFORMANCE_COUNTER_CONTROL_A_EVENT5(value: int) -> int:
-    return set_bits(25, 1, value)
+    return set_bits(25, 2, value)
 
 
 def NVB1C0_SET_SHADER_PERFORMANCE_COUNTER_CONTROL_A_BIT_SELECT5(value: int) -> int:
-    return set_bits(27, 2, value)
+    return set_bits(27, 3, value)
 
 
 def NVB1C0_SET_SHADER_PERFORMANCE_COUNTER_CONTROL_A_SPARE(value: int) -> int:
-    return set_bits(30, 1, value)
+    return set_bits(30, 2, value)
 
 
 def NVB1C0_SET_SHADER_PERFORMANCE_COUNTER_CONTROL_B_EDGE(value: int) -> int:
-    return set_bits(0, 0, value)
+    return set_bits(0, 1, value)
 
 
 def NVB1C0_SET_SHADER_PERFORMANCE_COUNTER_CONTROL_B_MODE(value: int) -> int:
-    return set_bits(1, 1, value)
+    return set_bits(1, 2, value)
 
 
 def NVB1C0_SET_SHADER_PERFORMANCE_COUNTER_CONTROL_B_WINDOWED(value: int) -> int:
-    return set_bits(3, 0, value)
+    return set_bits(3, 1, value)
 
 
 def NVB1C0_SET_SHADER_PERFORMANCE_COUNTER_CONTROL_B_FUNC(value: int) -> int:
-    return set_bits(4, 15, value)
+    return set_bits(4, 16, value)
 
 
 def NVB1C0_SET_SHADER_PERFORMANCE_COUNTER_TRAP_CONTROL_MASK(value: int) -> int:
-    return set_bits(0, 7, value)
+    return set_bits(0, 8, value)
 
 
 def NVB1C0_START_SHADER_PERFORMANCE_COUNTER_COUNTER_MASK(value: int) -> int:
-    return set_bits(0, 7, value)
+    return set_bits(0, 8, value)
 
 
 def NVB1C0_STOP_SHADER_PERFORMANCE_COUNTER_COUNTER_MASK(value: int) -> int:
-    return set_bits(0, 7, value)
+    return set_bits(0, 8, value)
 
 
 def NVB1C0_SET_MME_SHADOW_SCRATCH_V(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 
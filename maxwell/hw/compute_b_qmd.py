@@ -2,6 +2,7 @@
 # Last update date: 2022-02-05 01:36:25.411768
 
 from ctypes import *
+from typing import Dict, Tuple
 
 
 NVB1C0_QMDV00_06_QMD_RESERVED_V1_K_FALSE: int = 0x0
@@ -503,6 +504,331 @@ class qmdv0107(Structure):
     ]
 
 
+QMDV0006_FIELDS: Dict[str, Tuple[int, int]] = {
+    "qmd_reserved_v1_a": (0, 31),
+    "qmd_reserved_v1_b": (31, 1),
+    "qmd_reserved_v1_c": (32, 31),
+    "qmd_reserved_v1_d": (63, 1),
+    "qmd_reserved_v1_e": (64, 31),
+    "qmd_reserved_v1_f": (95, 1),
+    "qmd_reserved_v1_g": (96, 31),
+    "qmd_reserved_v1_h": (127, 1),
+    "qmd_reserved_a_a": (128, 32),
+    "qmd_reserved_v1_i": (160, 32),
+    "qmd_reserved_v1_j": (192, 5),
+    "qmd_reserved_a": (197, 3),
+    "qmd_reserved_v1_k": (200, 1),
+    "qmd_reserved_v1_l": (201, 1),
+    "semaphore_release_enable0": (202, 1),
+    "semaphore_release_enable1": (203, 1),
+    "qmd_reserved_b": (204, 4),
+    "qmd_reserved_v1_m": (208, 15),
+    "qmd_reserved_v1_n": (223, 1),
+    "qmd_reserved_v1_o": (224, 25),
+    "qmd_reserved_c": (249, 1),
+    "invalidate_texture_header_cache": (250, 1),
+    "invalidate_texture_sampler_cache": (251, 1),
+    "invalidate_texture_data_cache": (252, 1),
+    "invalidate_shader_data_cache": (253, 1),
+    "invalidate_instruction_cache": (254, 1),
+    "invalidate_shader_constant_cache": (255, 1),
+    "program_offset": (256, 32),
+    "qmd_reserved_v1_p": (288, 32),
+    "qmd_reserved_v1_q": (320, 8),
+    "qmd_reserved_d": (328, 8),
+    "qmd_reserved_v1_r": (336, 16),
+    "qmd_reserved_v1_s": (352, 6),
+    "qmd_reserved_e": (358, 8),
+    "release_membar_type": (366, 1),
+    "cwd_membar_type": (367, 2),
+    "qmd_reserved_v1_t": (369, 1),
+    "qmd_reserved_v1_u": (370, 1),
+    "throttled": (371, 1),
+    "qmd_reserved_e2_a": (372, 1),
+    "qmd_reserved_e2_b": (373, 1),
+    "api_visible_call_limit": (374, 1),
+    "shared_memory_bank_mapping": (375, 1),
+    "sampler_index": (376, 1),
+    "qmd_reserved_e3_a": (377, 1),
+    "cta_raster_width": (384, 32),
+    "cta_raster_height": (416, 16),
+    "cta_raster_depth": (432, 16),
+    "cta_raster_width_resume": (448, 32),
+    "cta_raster_height_resume": (480, 16),
+    "cta_raster_depth_resume": (496, 16),
+    "qmd_reserved_v1_v": (512, 24),
+    "qmd_reserved_f": (536, 7),
+    "qmd_reserved_v1_w": (543, 1),
+    "shared_memory_size": (544, 18),
+    "qmd_reserved_g": (562, 14),
+    "qmd_version": (576, 4),
+    "qmd_major_version": (580, 4),
+    "qmd_reserved_h": (584, 8),
+    "cta_thread_dimension0": (592, 16),
+    "cta_thread_dimension1": (608, 16),
+    "cta_thread_dimension2": (624, 16),
+    "constant_buffer_valid_0": (640, 1),
+    "constant_buffer_valid_1": (641, 1),
+    "constant_buffer_valid_2": (642, 1),
+    "constant_buffer_valid_3": (643, 1),
+    "constant_buffer_valid_4": (644, 1),
+    "constant_buffer_valid_5": (645, 1),
+    "constant_buffer_valid_6": (646, 1),
+    "constant_buffer_valid_7": (647, 1),
+    "qmd_reserved_i": (648, 21),
+    "l1_configuration": (669, 3),
+    "qmd_reserved_v1_x": (672, 32),
+    "qmd_reserved_v1_y": (704, 32),
+    "release0_address_lower": (736, 32),
+    "release0_address_upper": (768, 8),
+    "qmd_reserved_j": (776, 8),
+    "release0_reduction_op": (784, 3),
+    "qmd_reserved_k": (787, 1),
+    "release0_reduction_format": (788, 2),
+    "release0_reduction_enable": (790, 1),
+    "release0_structure_size": (791, 1),
+    "release0_payload": (800, 32),
+    "release1_address_lower": (832, 32),
+    "release1_address_upper": (864, 8),
+    "qmd_reserved_l": (872, 8),
+    "release1_reduction_op": (880, 3),
+    "qmd_reserved_m": (883, 1),
+    "release1_reduction_format": (884, 2),
+    "release1_reduction_enable": (886, 1),
+    "release1_structure_size": (887, 1),
+    "release1_payload": (896, 32),
+    "constant_buffer_addr_lower_0": (928, 32),
+    "constant_buffer_addr_upper_0": (960, 8),
+    "constant_buffer_reserved_addr_0": (968, 6),
+    "constant_buffer_invalidate_0": (974, 1),
+    "constant_buffer_size_0": (975, 17),
+    "constant_buffer_addr_lower_1": (992, 32),
+    "constant_buffer_addr_upper_1": (1024, 8),
+    "constant_buffer_reserved_addr_1": (1032, 6),
+    "constant_buffer_invalidate_1": (1038, 1),
+    "constant_buffer_size_1": (1039, 17),
+    "constant_buffer_addr_lower_2": (1056, 32),
+    "constant_buffer_addr_upper_2": (1088, 8),
+    "constant_buffer_reserved_addr_2": (1096, 6),
+    "constant_buffer_invalidate_2": (1102, 1),
+    "constant_buffer_size_2": (1103, 17),
+    "constant_buffer_addr_lower_3": (1120, 32),
+    "constant_buffer_addr_upper_3": (1152, 8),
+    "constant_buffer_reserved_addr_3": (1160, 6),
+    "constant_buffer_invalidate_3": (1166, 1),
+    "constant_buffer_size_3": (1167, 17),
+    "constant_buffer_addr_lower_4": (1184, 32),
+    "constant_buffer_addr_upper_4": (1216, 8),
+    "constant_buffer_reserved_addr_4": (1224, 6),
+    "constant_buffer_invalidate_4": (1230, 1),
+    "constant_buffer_size_4": (1231, 17),
+    "constant_buffer_addr_lower_5": (1248, 32),
+    "constant_buffer_addr_upper_5": (1280, 8),
+    "constant_buffer_reserved_addr_5": (1288, 6),
+    "constant_buffer_invalidate_5": (1294, 1),
+    "constant_buffer_size_5": (1295, 17),
+    "constant_buffer_addr_lower_6": (1312, 32),
+    "constant_buffer_addr_upper_6": (1344, 8),
+    "constant_buffer_reserved_addr_6": (1352, 6),
+    "constant_buffer_invalidate_6": (1358, 1),
+    "constant_buffer_size_6": (1359, 17),
+    "constant_buffer_addr_lower_7": (1376, 32),
+    "constant_buffer_addr_upper_7": (1408, 8),
+    "constant_buffer_reserved_addr_7": (1416, 6),
+    "constant_buffer_invalidate_7": (1422, 1),
+    "constant_buffer_size_7": (1423, 17),
+    "shader_local_memory_low_size": (1440, 24),
+    "qmd_reserved_n": (1464, 3),
+    "barrier_count": (1467, 5),
+    "shader_local_memory_high_size": (1472, 24),
+    "register_count": (1496, 8),
+    "shader_local_memory_crs_size": (1504, 24),
+    "sass_version": (1528, 8),
+    "qmd_spare_a": (1536, 32),
+    "qmd_spare_b": (1568, 32),
+    "qmd_spare_c": (1600, 32),
+    "qmd_spare_d": (1632, 32),
+    "qmd_spare_e": (1664, 32),
+    "qmd_spare_f": (1696, 32),
+    "qmd_spare_g": (1728, 32),
+    "qmd_spare_h": (1760, 32),
+    "qmd_spare_i": (1792, 32),
+    "qmd_spare_j": (1824, 32),
+    "qmd_spare_k": (1856, 32),
+    "qmd_spare_l": (1888, 32),
+    "qmd_spare_m": (1920, 32),
+    "qmd_spare_n": (1952, 32),
+    "debug_id_upper": (1984, 32),
+    "debug_id_lower": (2016, 32),
+}
+
+
+QMDV0107_FIELDS: Dict[str, Tuple[int, int]] = {
+    "outer_put": (0, 31),
+    "outer_overflow": (31, 1),
+    "outer_get": (32, 31),
+    "outer_sticky_overflow": (63, 1),
+    "inner_get": (64, 31),
+    "inner_overflow": (95, 1),
+    "inner_put": (96, 31),
+    "inner_sticky_overflow": (127, 1),
+    "qmd_reserved_a_a": (128, 32),
+    "dependent_qmd_pointer": (160, 32),
+    "qmd_group_id": (192, 6),
+    "sm_global_caching_enable": (198, 1),
+    "run_cta_in_one_sm_partition": (199, 1),
+    "is_queue": (200, 1),
+    "add_to_head_of_qmd_group_linked_list": (201, 1),
+    "semaphore_release_enable0": (202, 1),
+    "semaphore_release_enable1": (203, 1),
+    "require_scheduling_pcas": (204, 1),
+    "dependent_qmd_schedule_enable": (205, 1),
+    "dependent_qmd_type": (206, 1),
+    "dependent_qmd_field_copy": (207, 1),
+    "qmd_reserved_b": (208, 16),
+    "circular_queue_size": (224, 25),
+    "qmd_reserved_c": (249, 1),
+    "invalidate_texture_header_cache": (250, 1),
+    "invalidate_texture_sampler_cache": (251, 1),
+    "invalidate_texture_data_cache": (252, 1),
+    "invalidate_shader_data_cache": (253, 1),
+    "invalidate_instruction_cache": (254, 1),
+    "invalidate_shader_constant_cache": (255, 1),
+    "program_offset": (256, 32),
+    "circular_queue_addr_lower": (288, 32),
+    "circular_queue_addr_upper": (320, 8),
+    "qmd_reserved_d": (328, 8),
+    "circular_queue_entry_size": (336, 16),
+    "cwd_reference_count_id": (352, 6),
+    "cwd_reference_count_delta_minus_one": (358, 8),
+    "release_membar_type": (366, 1),
+    "cwd_reference_count_incr_enable": (367, 1),
+    "cwd_membar_type": (368, 2),
+    "sequentially_run_ctas": (370, 1),
+    "cwd_reference_count_decr_enable": (371, 1),
+    "throttled": (372, 1),
+    "fp32_nan_behavior": (373, 1),
+    "fp32_f2i_nan_behavior": (374, 1),
+    "api_visible_call_limit": (375, 1),
+    "shared_memory_bank_mapping": (376, 1),
+    "sampler_index": (377, 1),
+    "fp32_narrow_instruction": (378, 1),
+    "cta_raster_width": (384, 32),
+    "cta_raster_height": (416, 16),
+    "cta_raster_depth": (432, 16),
+    "cta_raster_width_resume": (448, 32),
+    "cta_raster_height_resume": (480, 16),
+    "cta_raster_depth_resume": (496, 16),
+    "queue_entries_per_cta_minus_one": (512, 7),
+    "coalesce_waiting_period": (519, 8),
+    "shared_memory_size": (544, 18),
+    "qmd_reserved_g": (562, 14),
+    "qmd_version": (576, 4),
+    "qmd_major_version": (580, 4),
+    "qmd_reserved_h": (584, 8),
+    "cta_thread_dimension0": (592, 16),
+    "cta_thread_dimension1": (608, 16),
+    "cta_thread_dimension2": (624, 16),
+    "constant_buffer_valid_0": (640, 1),
+    "constant_buffer_valid_1": (641, 1),
+    "constant_buffer_valid_2": (642, 1),
+    "constant_buffer_valid_3": (643, 1),
+    "constant_buffer_valid_4": (644, 1),
+    "constant_buffer_valid_5": (645, 1),
+    "constant_buffer_valid_6": (646, 1),
+    "constant_buffer_valid_7": (647, 1),
+    "qmd_reserved_i": (648, 21),
+    "l1_configuration": (669, 3),
+    "sm_disable_mask_lower": (672, 32),
+    "sm_disable_mask_upper": (704, 32),
+    "release0_address_lower": (736, 32),
+    "release0_address_upper": (768, 8),
+    "qmd_reserved_j": (776, 8),
+    "release0_reduction_op": (784, 3),
+    "qmd_reserved_k": (787, 1),
+    "release0_reduction_format": (788, 2),
+    "release0_reduction_enable": (790, 1),
+    "release0_structure_size": (791, 1),
+    "release0_payload": (800, 32),
+    "release1_address_lower": (832, 32),
+    "release1_address_upper": (864, 8),
+    "qmd_reserved_l": (872, 8),
+    "release1_reduction_op": (880, 3),
+    "qmd_reserved_m": (883, 1),
+    "release1_reduction_format": (884, 2),
+    "release1_reduction_enable": (886, 1),
+    "release1_structure_size": (887, 1),
+    "release1_payload": (896, 32),
+    "constant_buffer_addr_lower_0": (928, 32),
+    "constant_buffer_addr_upper_0": (960, 8),
+    "constant_buffer_reserved_addr_0": (968, 6),
+    "constant_buffer_invalidate_0": (974, 1),
+    "constant_buffer_size_0": (975, 17),
+    "constant_buffer_addr_lower_1": (992, 32),
+    "constant_buffer_addr_upper_1": (1024, 8),
+    "constant_buffer_reserved_addr_1": (1032, 6),
+    "constant_buffer_invalidate_1": (1038, 1),
+    "constant_buffer_size_1": (1039, 17),
+    "constant_buffer_addr_lower_2": (1056, 32),
+    "constant_buffer_addr_upper_2": (1088, 8),
+    "constant_buffer_reserved_addr_2": (1096, 6),
+    "constant_buffer_invalidate_2": (1102, 1),
+    "constant_buffer_size_2": (1103, 17),
+    "constant_buffer_addr_lower_3": (1120, 32),
+    "constant_buffer_addr_upper_3": (1152, 8),
+    "constant_buffer_reserved_addr_3": (1160, 6),
+    "constant_buffer_invalidate_3": (1166, 1),
+    "constant_buffer_size_3": (1167, 17),
+    "constant_buffer_addr_lower_4": (1184, 32),
+    "constant_buffer_addr_upper_4": (1216, 8),
+    "constant_buffer_reserved_addr_4": (1224, 6),
+    "constant_buffer_invalidate_4": (1230, 1),
+    "constant_buffer_size_4": (1231, 17),
+    "constant_buffer_addr_lower_5": (1248, 32),
+    "constant_buffer_addr_upper_5": (1280, 8),
+    "constant_buffer_reserved_addr_5": (1288, 6),
+    "constant_buffer_invalidate_5": (1294, 1),
+    "constant_buffer_size_5": (1295, 17),
+    "constant_buffer_addr_lower_6": (1312, 32),
+    "constant_buffer_addr_upper_6": (1344, 8),
+    "constant_buffer_reserved_addr_6": (1352, 6),
+    "constant_buffer_invalidate_6": (1358, 1),
+    "constant_buffer_size_6": (1359, 17),
+    "constant_buffer_addr_lower_7": (1376, 32),
+    "constant_buffer_addr_upper_7": (1408, 8),
+    "constant_buffer_reserved_addr_7": (1416, 6),
+    "constant_buffer_invalidate_7": (1422, 1),
+    "constant_buffer_size_7": (1423, 17),
+    "shader_local_memory_low_size": (1440, 24),
+    "qmd_reserved_n": (1464, 3),
+    "barrier_count": (1467, 5),
+    "shader_local_memory_high_size": (1472, 24),
+    "register_count": (1496, 8),
+    "shader_local_memory_crs_size": (1504, 24),
+    "sass_version": (1528, 8),
+    "hw_only_inner_get": (1536, 31),
+    "hw_only_require_scheduling_pcas": (1567, 1),
+    "hw_only_inner_put": (1568, 31),
+    "hw_only_scg_type": (1599, 1),
+    "hw_only_span_list_head_index": (1600, 30),
+    "qmd_reserved_q": (1630, 1),
+    "hw_only_span_list_head_index_valid": (1631, 1),
+    "hw_only_sked_next_qmd_pointer": (1632, 32),
+    "qmd_spare_e": (1664, 32),
+    "qmd_spare_f": (1696, 32),
+    "qmd_spare_g": (1728, 32),
+    "qmd_spare_h": (1760, 32),
+    "qmd_spare_i": (1792, 32),
+    "qmd_spare_j": (1824, 32),
+    "qmd_spare_k": (1856, 32),
+    "qmd_spare_l": (1888, 32),
+    "qmd_spare_m": (1920, 32),
+    "qmd_spare_n": (1952, 32),
+    "debug_id_upper": (1984, 32),
+    "debug_id_lower": (2016, 32),
+}
+
+
 
 
 
@@ -166,255 +166,255 @@ NVB0B5_PM_TRIGGER_END: int = 0x1114
 
 
 def NVB0B5_NOP_PARAMETER(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NVB0B5_PM_TRIGGER_V(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NVB0B5_SET_SEMAPHORE_A_UPPER(value: int) -> int:
-    return set_bits(0, 7, value)
+    return set_bits(0, 8, value)
 
 
 def NVB0B5_SET_SEMAPHORE_B_LOWER(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NVB0B5_SET_SEMAPHORE_PAYLOAD_PAYLOAD(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NVB0B5_SET_RENDER_ENABLE_A_UPPER(value: int) -> int:
-    return set_bits(0, 7, value)
+    return set_bits(0, 8, value)
 
 
 def NVB0B5_SET_RENDER_ENABLE_B_LOWER(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NVB0B5_SET_RENDER_ENABLE_C_MODE(value: int) -> int:
-    return set_bits(0, 2, value)
+    return set_bits(0, 3, value)
 
 
 def NVB0B5_SET_SRC_PHYS_MODE_TARGET(value: int) -> int:
-    return set_bits(0, 1, value)
+    return set_bits(0, 2, value)
 
 
 def NVB0B5_SET_DST_PHYS_MODE_TARGET(value: int) -> int:
-    return set_bits(0, 1, value)
+    return set_bits(0, 2, value)
 
 
 def NVB0B5_LAUNCH_DMA_DATA_TRANSFER_TYPE(value: int) -> int:
-    return set_bits(0, 1, value)
+    return set_bits(0, 2, value)
 
 
 def NVB0B5_LAUNCH_DMA_FLUSH_ENABLE(value: int) -> int:
-    return set_bits(2, 0, value)
+    return set_bits(2, 1, value)
 
 
 def NVB0B5_LAUNCH_DMA_SEMAPHORE_TYPE(value: int) -> int:
-    return set_bits(3, 1, value)
+    return set_bits(3, 2, value)
 
 
 def NVB0B5_LAUNCH_DMA_INTERRUPT_TYPE(value: int) -> int:
-    return set_bits(5, 1, value)
+    return set_bits(5, 2, value)
 
 
 def NVB0B5_LAUNCH_DMA_SRC_MEMORY_LAYOUT(value: int) -> int:
-    return set_bits(7, 0, value)
+    return set_bits(7, 1, value)
 
 
 def NVB0B5_LAUNCH_DMA_DST_MEMORY_LAYOUT(value: int) -> int:
-    return set_bits(8, 0, value)
+    return set_bits(8, 1, value)
 
 
 def NVB0B5_LAUNCH_DMA_MULTI_LINE_ENABLE(value: int) -> int:
-    return set_bits(9, 0, value)
+    return set_bits(9, 1, value)
 
 
 def NVB0B5_LAUNCH_DMA_REMAP_ENABLE(value: int) -> int:
-    return set_bits(10, 0, value)
+    return set_bits(10, 1, value)
 
 
 def NVB0B5_LAUNCH_DMA_FORCE_RMWDISABLE(value: int) -> int:
-    return set_bits(11, 0, value)
+    return set_bits(11, 1, value)
 
 
 def NVB0B5_LAUNCH_DMA_SRC_TYPE(value: int) -> int:
-    return set_bits(12, 0, value)
+    return set_bits(12, 1, value)
 
 
 def NVB0B5_LAUNCH_DMA_DST_TYPE(value: int) -> int:
-    return set_bits(13, 0, value)
+    return set_bits(13, 1, value)
 
 
 def NVB0B5_LAUNCH_DMA_SEMAPHORE_REDUCTION(value: int) -> int:
-    return set_bits(14, 3, value)
+    return set_bits(14, 4, value)
 
 
 def NVB0B5_LAUNCH_DMA_SEMAPHORE_REDUCTION_SIGN(value: int) -> int:
-    return set_bits(18, 0, value)
+    return set_bits(18, 1, value)
 
 
 def NVB0B5_LAUNCH_DMA_SEMAPHORE_REDUCTION_ENABLE(value: int) -> int:
-    return set_bits(19, 0, value)
+    return set_bits(19, 1, value)
 
 
 def NVB0B5_LAUNCH_DMA_BYPASS_L2(value: int) -> int:
-    return set_bits(20, 0, value)
+    return set_bits(20, 1, value)
 
 
 def NVB0B5_OFFSET_IN_UPPER_UPPER(value: int) -> int:
-    return set_bits(0, 7, value)
+    return set_bits(0, 8, value)
 
 
 def NVB0B5_OFFSET_IN_LOWER_VALUE(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NVB0B5_OFFSET_OUT_UPPER_UPPER(value: int) -> int:
-    return set_bits(0, 7, value)
+    return set_bits(0, 8, value)
 
 
 def NVB0B5_OFFSET_OUT_LOWER_VALUE(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NVB0B5_PITCH_IN_VALUE(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NVB0B5_PITCH_OUT_VALUE(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NVB0B5_LINE_LENGTH_IN_VALUE(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NVB0B5_LINE_COUNT_VALUE(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NVB0B5_SET_REMAP_CONST_A_V(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NVB0B5_SET_REMAP_CONST_B_V(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NVB0B5_SET_REMAP_COMPONENTS_DST_X(value: int) -> int:
-    return set_bits(0, 2, value)
+    return set_bits(0, 3, value)
 
 
 def NVB0B5_SET_REMAP_COMPONENTS_DST_Y(value: int) -> int:
-    return set_bits(4, 2, value)
+    return set_bits(4, 3, value)
 
 
 def NVB0B5_SET_REMAP_COMPONENTS_DST_Z(value: int) -> int:
-    return set_bits(8, 2, value)
+    return set_bits(8, 3, value)
 
 
 def NVB0B5_SET_REMAP_COMPONENTS_DST_W(value: int) -> int:
-    return set_bits(12, 2, value)
+    return set_bits(12, 3, value)
 
 
 def NVB0B5_SET_REMAP_COMPONENTS_COMPONENT_SIZE(value: int) -> int:
-    return set_bits(16, 1, value)
+    return set_bits(16, 2, value)
 
 
 def NVB0B5_SET_REMAP_COMPONENTS_NUM_SRC_COMPONENTS(value: int) -> int:
-    return set_bits(20, 1, value)
+    return set_bits(20, 2, value)
 
 
 def NVB0B5_SET_REMAP_COMPONENTS_NUM_DST_COMPONENTS(value: int) -> int:
-    return set_bits(24, 1, value)
+    return set_bits(24, 2, value)
 
 
 def NVB0B5_SET_DST_BLOCK_SIZE_WIDTH(value: int) -> int:
-    return set_bits(0, 3, value)
+    return set_bits(0, 4, value)
 
 
 def NVB0B5_SET_DST_BLOCK_SIZE_HEIGHT(value: int) -> int:
-    return set_bits(4, 3, value)
+    return set_bits(4, 4, value)
 
 
 def NVB0B5_SET_DST_BLOCK_SIZE_DEPTH(value: int) -> int:
-    return set_bits(8, 3, value)
+    return set_bits(8, 4, value)
 
 
 def NVB0B5_SET_DST_BLOCK_SIZE_GOB_HEIGHT(value: int) -> int:
-    return set_bits(12, 3, value)
+    return set_bits(12, 4, value)
 
 
 def NVB0B5_SET_DST_WIDTH_V(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NVB0B5_SET_DST_HEIGHT_V(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NVB0B5_SET_DST_DEPTH_V(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NVB0B5_SET_DST_LAYER_V(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NVB0B5_SET_DST_ORIGIN_X(value: int) -> int:
-    return set_bits(0, 15, value)
+    return set_bits(0, 16, value)
 
 
 def NVB0B5_SET_DST_ORIGIN_Y(value: int) -> int:
-    return set_bits(16, 15, value)
+    return set_bits(16, 16, value)
 
 
 def NVB0B5_SET_SRC_BLOCK_SIZE_WIDTH(value: int) -> int:
-    return set_bits(0, 3, value)
+    return set_bits(0, 4, value)
 
 
 def NVB0B5_SET_SRC_BLOCK_SIZE_HEIGHT(value: int) -> int:
-    return set_bits(4, 3, value)
+    return set_bits(4, 4, value)
 
 
 def NVB0B5_SET_SRC_BLOCK_SIZE_DEPTH(value: int) -> int:
-    return set_bits(8, 3, value)
+    return set_bits(8, 4, value)
 
 
 def NVB0B5_SET_SRC_BLOCK_SIZE_GOB_HEIGHT(value: int) -> int:
-    return set_bits(12, 3, value)
+    return set_bits(12, 4, value)
 
 
 def NVB0B5_SET_SRC_WIDTH_V(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NVB0B5_SET_SRC_HEIGHT_V(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NVB0B5_SET_SRC_DEPTH_V(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NVB0B5_SET_SRC_LAYER_V(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 def NVB0B5_SET_SRC_ORIGIN_X(value: int) -> int:
-    return set_bits(0, 15, value)
+    return set_bits(0, 16, value)
 
 
 def NVB0B5_SET_SRC_ORIGIN_Y(value: int) -> int:
-    return set_bits(16, 15, value)
+    return set_bits(16, 16, value)
 
 
 def NVB0B5_PM_TRIGGER_END_V(value: int) -> int:
-    return set_bits(0, 31, value)
+    return set_bits(0, 32, value)
 
 
 
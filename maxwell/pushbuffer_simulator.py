@@ -0,0 +1,730 @@
+from array import array
+from command_buffer import *
+from maxwell.block_linear import get_block_linear_offsets
+from maxwell.command_buffer_decoder import HOST_METHOD_LIMIT, decode_command_buffer
+from maxwell.hw.channel_gpfifo import *
+from maxwell.hw.compute_b import *
+from maxwell.hw.dma_copy_a import *
+from maxwell.hw.compute_b_qmd import *
+from maxwell.qmd_codec import QMDV0107_CODEC
+from nvgpu_emulator import EmulatedAddressSpace, EmulatedChannel, EmulatedEngine
+
+import numpy as np
+import time
+import typing
+
+# Classes used by the Tegra X1, bound with SET_OBJECT by TegraGpuChannel.
+COMPUTE_CLASS = 0xB1C0
+INLINE_TO_MEMORY_CLASS = 0xA140
+DMA_COPY_CLASS = 0xB0B5
+
+REGISTER_COUNT = 0x2000
+
+DispatchHandler = typing.Callable[[EmulatedAddressSpace, int, bytes], None]
+
+
+def _create_field_decoder(encoder: typing.Callable[[int], int]) -> typing.Callable[[int], int]:
+    # The generated helpers only encode, recover the field position from its mask.
+    mask = encoder(0xFFFFFFFF)
+    shift = (mask & -mask).bit_length() - 1
+
+    return lambda value: (value & mask) >> shift
+
+
+_I2M_DST_MEMORY_LAYOUT = _create_field_decoder(NVB1C0_LAUNCH_DMA_DST_MEMORY_LAYOUT)
+_I2M_DST_BLOCK_HEIGHT = _create_field_decoder(NVB1C0_SET_DST_BLOCK_SIZE_HEIGHT)
+_I2M_DST_BLOCK_DEPTH = _create_field_decoder(NVB1C0_SET_DST_BLOCK_SIZE_DEPTH)
+_PCAS_INVALIDATE = _create_field_decoder(NVB1C0_SEND_SIGNALING_PCAS_B_INVALIDATE)
+_PCAS_SCHEDULE = _create_field_decoder(NVB1C0_SEND_SIGNALING_PCAS_B_SCHEDULE)
+_SET_OBJECT_NVCLASS = _create_field_decoder(NVB06F_SET_OBJECT_NVCLASS)
+_HOST_SEMAPHORE_OPERATION = _create_field_decoder(NVB06F_SEMAPHORED_OPERATION)
+_HOST_SEMAPHORE_RELEASE_SIZE = _create_field_decoder(NVB06F_SEMAPHORED_RELEASE_SIZE)
+_REPORT_OPERATION = _create_field_decoder(NVB1C0_SET_REPORT_SEMAPHORE_D_OPERATION)
+_REPORT_STRUCTURE_SIZE = _create_field_decoder(
+    NVB1C0_SET_REPORT_SEMAPHORE_D_STRUCTURE_SIZE
+)
+
+_DMA_SRC_MEMORY_LAYOUT = _create_field_decoder(NVB0B5_LAUNCH_DMA_SRC_MEMORY_LAYOUT)
+_DMA_DST_MEMORY_LAYOUT = _create_field_decoder(NVB0B5_LAUNCH_DMA_DST_MEMORY_LAYOUT)
+_DMA_MULTI_LINE_ENABLE = _create_field_decoder(NVB0B5_LAUNCH_DMA_MULTI_LINE_ENABLE)
+_DMA_REMAP_ENABLE = _create_field_decoder(NVB0B5_LAUNCH_DMA_REMAP_ENABLE)
+_DMA_DATA_TRANSFER_TYPE = _create_field_decoder(NVB0B5_LAUNCH_DMA_DATA_TRANSFER_TYPE)
+_DMA_SEMAPHORE_TYPE = _create_field_decoder(NVB0B5_LAUNCH_DMA_SEMAPHORE_TYPE)
+_DMA_BLOCK_HEIGHT = _create_field_decoder(NVB0B5_SET_SRC_BLOCK_SIZE_HEIGHT)
+_DMA_BLOCK_DEPTH = _create_field_decoder(NVB0B5_SET_SRC_BLOCK_SIZE_DEPTH)
+_DMA_ORIGIN_X = _create_field_decoder(NVB0B5_SET_SRC_ORIGIN_X)
+_DMA_ORIGIN_Y = _create_field_decoder(NVB0B5_SET_SRC_ORIGIN_Y)
+_REMAP_COMPONENT_SIZE = _create_field_decoder(
+    NVB0B5_SET_REMAP_COMPONENTS_COMPONENT_SIZE
+)
+_REMAP_NUM_SRC_COMPONENTS = _create_field_decoder(
+    NVB0B5_SET_REMAP_COMPONENTS_NUM_SRC_COMPONENTS
+)
+_REMAP_NUM_DST_COMPONENTS = _create_field_decoder(
+    NVB0B5_SET_REMAP_COMPONENTS_NUM_DST_COMPONENTS
+)
+def _write_semaphore_release(
+    address_space: EmulatedAddressSpace, address: int, payload: int, is_four_words: bool
+) -> None:
+    if is_four_words:
+        # Four words releases also carry a timestamp, the emulated GPU clock is the monotonic one.
+        address_space.write(
+            address,
+            array("I", [payload, 0]).tobytes()
+            + array("Q", [time.monotonic_ns()]).tobytes(),
+        )
+    else:
+        address_space.write(address, array("I", [payload]).tobytes())
+
+
+# NOTE: Release fields are at the same place in every QMD version we support.
+_QMD_RELEASES = [
+    (
+        QMDV0107_CODEC.compile_unpacker([f"semaphore_release_enable{index}"]),
+        QMDV0107_CODEC.compile_unpacker(
+            [
+                f"release{index}_address_lower",
+                f"release{index}_address_upper",
+                f"release{index}_payload",
+                f"release{index}_structure_size",
+                f"release{index}_reduction_enable",
+                f"release{index}_reduction_op",
+            ]
+        ),
+    )
+    for index in range(2)
+]
+
+_RELEASE_REDUCTIONS: typing.Dict[int, typing.Callable[[int, int], int]] = {
+    NVB1C0_QMDV01_07_RELEASE0_REDUCTION_OP_RED_ADD: lambda old, value: old + value,
+    NVB1C0_QMDV01_07_RELEASE0_REDUCTION_OP_RED_MIN: min,
+    NVB1C0_QMDV01_07_RELEASE0_REDUCTION_OP_RED_MAX: max,
+    NVB1C0_QMDV01_07_RELEASE0_REDUCTION_OP_RED_INC: lambda old, value: (
+        0 if old >= value else old + 1
+    ),
+    NVB1C0_QMDV01_07_RELEASE0_REDUCTION_OP_RED_DEC: lambda old, value: (
+        value if old == 0 or old > value else old - 1
+    ),
+    NVB1C0_QMDV01_07_RELEASE0_REDUCTION_OP_RED_AND: lambda old, value: old & value,
+    NVB1C0_QMDV01_07_RELEASE0_REDUCTION_OP_RED_OR: lambda old, value: old | value,
+    NVB1C0_QMDV01_07_RELEASE0_REDUCTION_OP_RED_XOR: lambda old, value: old ^ value,
+}
+
+_REMAP_DST_COMPONENTS = [
+    _create_field_decoder(NVB0B5_SET_REMAP_COMPONENTS_DST_X),
+    _create_field_decoder(NVB0B5_SET_REMAP_COMPONENTS_DST_Y),
+    _create_field_decoder(NVB0B5_SET_REMAP_COMPONENTS_DST_Z),
+    _create_field_decoder(NVB0B5_SET_REMAP_COMPONENTS_DST_W),
+]
+
+
+class PitchSurface(object):
+    address: int
+    pitch: int
+
+    def __init__(self, address: int, pitch: int) -> None:
+        self.address = address
+        self.pitch = pitch
+
+    def _get_view(
+        self, address_space: EmulatedAddressSpace, line_length: int, line_count: int
+    ) -> np.ndarray:
+        size = (line_count - 1) * self.pitch + line_length
+        buffer = np.frombuffer(address_space.view(self.address, size), dtype=np.uint8)
+
+        return np.lib.stride_tricks.as_strided(
+            buffer, (line_count, line_length), (self.pitch, 1)
+        )
+
+    def read(
+        self, address_space: EmulatedAddressSpace, line_length: int, line_count: int
+    ) -> np.ndarray:
+        return self._get_view(address_space, line_length, line_count).copy()
+
+    def write(self, address_space: EmulatedAddressSpace, data: np.ndarray) -> None:
+        (line_count, line_length) = data.shape
+        self._get_view(address_space, line_length, line_count)[...] = data
+
+
+class BlockLinearSurface(object):
+    address: int
+    width: int
+    height: int
+    block_height_log2: int
+    block_depth_log2: int
+    origin_x: int
+    origin_y: int
+    layer: int
+
+    def __init__(
+        self,
+        address: int,
+        width: int,
+        height: int,
+        block_height_log2: int,
+        block_depth_log2: int,
+        origin_x: int,
+        origin_y: int,
+        layer: int,
+    ) -> None:
+        self.address = address
+        self.width = width
+        self.height = height
+        self.block_height_log2 = block_height_log2
+        self.block_depth_log2 = block_depth_log2
+        self.origin_x = origin_x
+        self.origin_y = origin_y
+        self.layer = layer
+
+    def _get_view(
+        self, address_space: EmulatedAddressSpace, line_length: int, line_count: int
+    ) -> typing.Tuple[np.ndarray, np.ndarray]:
+        offsets = get_block_linear_offsets(
+            self.width,
+            self.height,
+            self.block_height_log2,
+            self.block_depth_log2,
+            np.arange(self.origin_x, self.origin_x + line_length),
+            np.arange(self.origin_y, self.origin_y + line_count),
+            self.layer,
+        )
+        size = int(offsets.max()) + 1
+        buffer = np.frombuffer(address_space.view(self.address, size), dtype=np.uint8)
+
+        return (buffer, offsets)
+
+    def read(
+        self, address_space: EmulatedAddressSpace, line_length: int, line_count: int
+    ) -> np.ndarray:
+        (buffer, offsets) = self._get_view(address_space, line_length, line_count)
+
+        return buffer[offsets]
+
+    def write(self, address_space: EmulatedAddressSpace, data: np.ndarray) -> None:
+        (line_count, line_length) = data.shape
+        (buffer, offsets) = self._get_view(address_space, line_length, line_count)
+        buffer[offsets] = data
+
+
+Surface = typing.Union[PitchSurface, BlockLinearSurface]
+
+
+class PushbufferSimulatorStatistics(object):
+    entry_count: int
+    command_count: int
+    method_count: int
+    inline_transfer_count: int
+    inline_bytes: int
+    dma_count: int
+    dma_bytes: int
+    dispatch_count: int
+
+    def __init__(self) -> None:
+        self.reset()
+
+    def reset(self) -> None:
+        self.entry_count = 0
+        self.command_count = 0
+        self.method_count = 0
+        self.inline_transfer_count = 0
+        self.inline_bytes = 0
+        self.dma_count = 0
+        self.dma_bytes = 0
+        self.dispatch_count = 0
+
+    def __repr__(self) -> str:
+        return f"PushbufferSimulatorStatistics(entry_count={self.entry_count}, command_count={self.command_count}, method_count={self.method_count}, inline_transfer_count={self.inline_transfer_count}, inline_bytes=0x{self.inline_bytes:x}, dma_count={self.dma_count}, dma_bytes=0x{self.dma_bytes:x}, dispatch_count={self.dispatch_count})"
+
+
+class _SimulatedEngine(object):
+    simulator: "PushbufferSimulator"
+    address_space: EmulatedAddressSpace
+    registers: typing.List[int]
+    triggers: typing.Dict[int, typing.Callable[[int], None]]
+
+    def __init__(
+        self, simulator: "PushbufferSimulator", address_space: EmulatedAddressSpace
+    ) -> None:
+        self.simulator = simulator
+        self.address_space = address_space
+        self.registers = [0] * REGISTER_COUNT
+        self.triggers = dict()
+
+    def get_register(self, method: int) -> int:
+        return self.registers[method >> 2]
+
+    def get_address(self, upper_method: int) -> int:
+        return (self.get_register(upper_method) << 32) | self.get_register(
+            upper_method + 4
+        )
+
+    def load_inline_data(self, data: bytes) -> bool:
+        """Bulk path for non-increasing LOAD_INLINE_DATA, return False if not supported"""
+
+        return False
+
+
+class _InlineToMemoryEngine(_SimulatedEngine):
+    """Inline to memory (I2M) transfers, shared by the I2M and compute classes"""
+
+    pending_data: typing.Optional[bytearray]
+    pending_size: int
+
+    def __init__(
+        self, simulator: "PushbufferSimulator", address_space: EmulatedAddressSpace
+    ) -> None:
+        super().__init__(simulator, address_space)
+
+        self.pending_data = None
+        self.pending_size = 0
+        self.triggers[NVB1C0_LAUNCH_DMA] = self._launch_dma
+        self.triggers[NVB1C0_LOAD_INLINE_DATA] = self._load_inline_data_word
+
+    def _launch_dma(self, value: int) -> None:
+        self.pending_data = bytearray()
+        self.pending_size = self.get_register(NVB1C0_LINE_LENGTH_IN) * self.get_register(
+            NVB1C0_LINE_COUNT
+        )
+
+        self._flush()
+
+    def _load_inline_data_word(self, value: int) -> None:
+        self.load_inline_data(value.to_bytes(4, "little"))
+
+    def load_inline_data(self, data: bytes) -> bool:
+        if self.pending_data is None:
+            raise Exception("LOAD_INLINE_DATA without a pending LAUNCH_DMA")
+
+        self.pending_data += data
+        self._flush()
+
+        return True
+
+    def _get_destination(self) -> Surface:
+        address = self.get_address(NVB1C0_OFFSET_OUT_UPPER)
+        launch_dma = self.get_register(NVB1C0_LAUNCH_DMA)
+
+        if (
+            _I2M_DST_MEMORY_LAYOUT(launch_dma)
+            == NVB1C0_LAUNCH_DMA_DST_MEMORY_LAYOUT_PITCH
+        ):
+            return PitchSurface(address, self.get_register(NVB1C0_PITCH_OUT))
+
+        block_size = self.get_register(NVB1C0_SET_DST_BLOCK_SIZE)
+
+        return BlockLinearSurface(
+            address,
+            self.get_register(NVB1C0_SET_DST_WIDTH),
+            self.get_register(NVB1C0_SET_DST_HEIGHT),
+            _I2M_DST_BLOCK_HEIGHT(block_size),
+            _I2M_DST_BLOCK_DEPTH(block_size),
+            self.get_register(NVB1C0_SET_DST_ORIGIN_BYTES_X),
+            self.get_register(NVB1C0_SET_DST_ORIGIN_SAMPLES_Y),
+            self.get_register(NVB1C0_SET_DST_LAYER),
+        )
+
+    def _flush(self) -> None:
+        assert self.pending_data is not None
+
+        # Lines are packed in the inline data, the last dword may be padded.
+        if len(self.pending_data) < self.pending_size:
+            return
+
+        line_length = self.get_register(NVB1C0_LINE_LENGTH_IN)
+        line_count = self.get_register(NVB1C0_LINE_COUNT)
+
+        if self.pending_size != 0:
+            data = np.frombuffer(self.pending_data, dtype=np.uint8, count=self.pending_size)
+            self._get_destination().write(
+                self.address_space, data.reshape(line_count, line_length)
+            )
+
+        statistics = self.simulator.statistics
+        statistics.inline_transfer_count += 1
+        statistics.inline_bytes += self.pending_size
+
+        self.pending_data = None
+        self.pending_size = 0
+
+
+class _ComputeEngine(_InlineToMemoryEngine):
+    # QMDs as fetched by their last invalidating launch, keyed by address.
+    qmd_cache: typing.Dict[int, bytes]
+
+    def __init__(
+        self, simulator: "PushbufferSimulator", address_space: EmulatedAddressSpace
+    ) -> None:
+        super().__init__(simulator, address_space)
+
+        self.qmd_cache = dict()
+
+        self.triggers[NVB1C0_SEND_SIGNALING_PCAS_B] = self._send_signaling_pcas_b
+        self.triggers[NVB1C0_SET_REPORT_SEMAPHORE_D] = self._set_report_semaphore_d
+
+    def _set_report_semaphore_d(self, value: int) -> None:
+        if _REPORT_OPERATION(value) != NVB1C0_SET_REPORT_SEMAPHORE_D_OPERATION_RELEASE:
+            return
+
+        _write_semaphore_release(
+            self.address_space,
+            self.get_address(NVB1C0_SET_REPORT_SEMAPHORE_A),
+            self.get_register(NVB1C0_SET_REPORT_SEMAPHORE_C),
+            _REPORT_STRUCTURE_SIZE(value)
+            == NVB1C0_SET_REPORT_SEMAPHORE_D_STRUCTURE_SIZE_FOUR_WORDS,
+        )
+
+    def _send_signaling_pcas_b(self, value: int) -> None:
+        if _PCAS_SCHEDULE(value) != NVB1C0_SEND_SIGNALING_PCAS_B_SCHEDULE_TRUE:
+            return
+
+        qmd_address = self.get_register(NVB1C0_SEND_PCAS_A) << 8
+        qmd = self.qmd_cache.get(qmd_address)
+
+        # Without INVALIDATE a QMD seen before runs from its cached copy, even if memory changed.
+        if (
+            qmd is None
+            or _PCAS_INVALIDATE(value) == NVB1C0_SEND_SIGNALING_PCAS_B_INVALIDATE_TRUE
+        ):
+            qmd = self.address_space.read(qmd_address, self.simulator.QMD_SIZE)
+            self.qmd_cache[qmd_address] = qmd
+
+        self.simulator.statistics.dispatch_count += 1
+        self.simulator.dispatch_handler(self.address_space, qmd_address, qmd)
+
+        self._release_semaphores(memoryview(qmd).cast("I"))
+
+    def _release_semaphores(self, qmd: memoryview) -> None:
+        for (unpack_enable, unpack_release) in _QMD_RELEASES:
+            if unpack_enable(qmd)[0] == 0:
+                continue
+
+            (
+                address_lower,
+                address_upper,
+                payload,
+                structure_size,
+                reduction_enable,
+                reduction_op,
+            ) = unpack_release(qmd)
+            address = (address_upper << 32) | address_lower
+
+            if reduction_enable != 0:
+                old = array("I", self.address_space.read(address, 4))[0]
+                payload = _RELEASE_REDUCTIONS[reduction_op](old, payload) & 0xFFFFFFFF
+
+            _write_semaphore_release(
+                self.address_space,
+                address,
+                payload,
+                structure_size
+                == NVB1C0_QMDV01_07_RELEASE0_STRUCTURE_SIZE_FOUR_WORDS,
+            )
+
+
+class _DmaCopyEngine(_SimulatedEngine):
+    def __init__(
+        self, simulator: "PushbufferSimulator", address_space: EmulatedAddressSpace
+    ) -> None:
+        super().__init__(simulator, address_space)
+
+        self.triggers[NVB0B5_LAUNCH_DMA] = self._launch_dma
+
+    def _get_surface(
+        self,
+        is_pitch: bool,
+        address: int,
+        pitch_method: int,
+        block_size_method: int,
+        bytes_per_element: int,
+    ) -> Surface:
+        if is_pitch:
+            return PitchSurface(address, self.get_register(pitch_method))
+
+        # SET_{SRC,DST}_BLOCK_SIZE, WIDTH, HEIGHT, DEPTH, LAYER and ORIGIN are contiguous.
+        block_size = self.get_register(block_size_method)
+        origin = self.get_register(block_size_method + 0x14)
+
+        return BlockLinearSurface(
+            address,
+            self.get_register(block_size_method + 0x4) * bytes_per_element,
+            self.get_register(block_size_method + 0x8),
+            _DMA_BLOCK_HEIGHT(block_size),
+            _DMA_BLOCK_DEPTH(block_size),
+            _DMA_ORIGIN_X(origin) * bytes_per_element,
+            _DMA_ORIGIN_Y(origin),
+            self.get_register(block_size_method + 0x10),
+        )
+
+    def _remap(
+        self, source: np.ndarray, destination: Surface, line_length: int
+    ) -> np.ndarray:
+        remap_components = self.get_register(NVB0B5_SET_REMAP_COMPONENTS)
+        component_size = _REMAP_COMPONENT_SIZE(remap_components) + 1
+        source_count = _REMAP_NUM_SRC_COMPONENTS(remap_components) + 1
+        destination_count = _REMAP_NUM_DST_COMPONENTS(remap_components) + 1
+        line_count = source.shape[0]
+
+        source = source.reshape(line_count, line_length, source_count, component_size)
+        constants = [
+            np.frombuffer(
+                self.get_register(method).to_bytes(4, "little")[:component_size],
+                dtype=np.uint8,
+            )
+            for method in [NVB0B5_SET_REMAP_CONST_A, NVB0B5_SET_REMAP_CONST_B]
+        ]
+        result = np.empty(
+            (line_count, line_length, destination_count, component_size), dtype=np.uint8
+        )
+        previous: typing.Optional[np.ndarray] = None
+
+        for index in range(destination_count):
+            selector = _REMAP_DST_COMPONENTS[index](remap_components)
+
+            if selector <= NVB0B5_SET_REMAP_COMPONENTS_DST_X_SRC_W:
+                result[:, :, index] = source[:, :, selector]
+            elif selector == NVB0B5_SET_REMAP_COMPONENTS_DST_X_CONST_A:
+                result[:, :, index] = constants[0]
+            elif selector == NVB0B5_SET_REMAP_COMPONENTS_DST_X_CONST_B:
+                result[:, :, index] = constants[1]
+            else:
+                if previous is None:
+                    previous = destination.read(
+                        self.address_space,
+                        line_length * destination_count * component_size,
+                        line_count,
+                    ).reshape(result.shape)
+
+                result[:, :, index] = previous[:, :, index]
+
+        return result.reshape(line_count, -1)
+
+    def _launch_dma(self, value: int) -> None:
+        if _DMA_DATA_TRANSFER_TYPE(value) != NVB0B5_LAUNCH_DMA_DATA_TRANSFER_TYPE_NONE:
+            self._copy(value)
+
+        semaphore_type = _DMA_SEMAPHORE_TYPE(value)
+
+        if semaphore_type != NVB0B5_LAUNCH_DMA_SEMAPHORE_TYPE_NONE:
+            _write_semaphore_release(
+                self.address_space,
+                self.get_address(NVB0B5_SET_SEMAPHORE_A),
+                self.get_register(NVB0B5_SET_SEMAPHORE_PAYLOAD),
+                semaphore_type
+                == NVB0B5_LAUNCH_DMA_SEMAPHORE_TYPE_RELEASE_FOUR_WORD_SEMAPHORE,
+            )
+
+    def _copy(self, value: int) -> None:
+        line_length = self.get_register(NVB0B5_LINE_LENGTH_IN)
+        line_count = 1
+
+        if _DMA_MULTI_LINE_ENABLE(value) == NVB0B5_LAUNCH_DMA_MULTI_LINE_ENABLE_TRUE:
+            line_count = self.get_register(NVB0B5_LINE_COUNT)
+
+        # With remapping enabled, widths and origins are in elements instead of bytes.
+        source_element_size = 1
+        destination_element_size = 1
+        is_remapped = _DMA_REMAP_ENABLE(value) == NVB0B5_LAUNCH_DMA_REMAP_ENABLE_TRUE
+
+        if is_remapped:
+            remap_components = self.get_register(NVB0B5_SET_REMAP_COMPONENTS)
+            component_size = _REMAP_COMPONENT_SIZE(remap_components) + 1
+            source_element_size = component_size * (
+                _REMAP_NUM_SRC_COMPONENTS(remap_components) + 1
+            )
+            destination_element_size = component_size * (
+                _REMAP_NUM_DST_COMPONENTS(remap_components) + 1
+            )
+
+        source = self._get_surface(
+            _DMA_SRC_MEMORY_LAYOUT(value) == NVB0B5_LAUNCH_DMA_SRC_MEMORY_LAYOUT_PITCH,
+            self.get_address(NVB0B5_OFFSET_IN_UPPER),
+            NVB0B5_PITCH_IN,
+            NVB0B5_SET_SRC_BLOCK_SIZE,
+            source_element_size,
+        )
+        destination = self._get_surface(
+            _DMA_DST_MEMORY_LAYOUT(value) == NVB0B5_LAUNCH_DMA_DST_MEMORY_LAYOUT_PITCH,
+            self.get_address(NVB0B5_OFFSET_OUT_UPPER),
+            NVB0B5_PITCH_OUT,
+            NVB0B5_SET_DST_BLOCK_SIZE,
+            destination_element_size,
+        )
+
+        if line_length != 0 and line_count != 0:
+            data = source.read(
+                self.address_space, line_length * source_element_size, line_count
+            )
+
+            if is_remapped:
+                data = self._remap(data, destination, line_length)
+
+            destination.write(self.address_space, data)
+
+        statistics = self.simulator.statistics
+        statistics.dma_count += 1
+        statistics.dma_bytes += line_length * destination_element_size * line_count
+
+
+class _ChannelState(object):
+    engines: typing.List[typing.Optional[_SimulatedEngine]]
+    host_registers: typing.List[int]
+
+    def __init__(self) -> None:
+        self.engines = [None] * 8
+        self.host_registers = [0] * (HOST_METHOD_LIMIT >> 2)
+
+
+def _words_to_bytes(words: typing.Sequence[int]) -> bytes:
+    if isinstance(words, memoryview):
+        return words.tobytes()
+
+    return array("I", words).tobytes()
+
+
+class PushbufferSimulator(EmulatedEngine):
+    """
+    Functional simulator of the pushbuffers executed by an emulated channel.
+
+    Inline to memory transfers (compute and I2M classes) and copy engine transfers are applied to
+    the emulated address space. Compute dispatches are forwarded to dispatch_handler with their QMD.
+    QMDs are cached per address and only fetched again by a launch with INVALIDATE set.
+    Host semaphore acquires must already be satisfied when they run, as nothing else can release
+    them. Other methods are only latched in the per subchannel register file.
+    """
+
+    QMD_SIZE: int = 0x100
+
+    statistics: PushbufferSimulatorStatistics
+    dispatch_handler: DispatchHandler
+    dispatches: typing.List[typing.Tuple[int, bytes]]
+
+    _engine_types: typing.Dict[int, typing.Type[_SimulatedEngine]]
+
+    def __init__(self, dispatch_handler: typing.Optional[DispatchHandler] = None) -> None:
+        self.statistics = PushbufferSimulatorStatistics()
+        self.dispatches = list()
+
+        if dispatch_handler is None:
+            dispatch_handler = self._record_dispatch
+
+        self.dispatch_handler = dispatch_handler
+        self._engine_types = {
+            COMPUTE_CLASS: _ComputeEngine,
+            INLINE_TO_MEMORY_CLASS: _InlineToMemoryEngine,
+            DMA_COPY_CLASS: _DmaCopyEngine,
+        }
+
+    def _record_dispatch(
+        self, address_space: EmulatedAddressSpace, qmd_address: int, qmd: bytes
+    ) -> None:
+        self.dispatches.append((qmd_address, qmd))
+
+    def _bind_object(
+        self,
+        state: _ChannelState,
+        address_space: EmulatedAddressSpace,
+        subchannel: int,
+        value: int,
+    ) -> None:
+        engine_type = self._engine_types.get(
+            _SET_OBJECT_NVCLASS(value), _SimulatedEngine
+        )
+        state.engines[subchannel] = engine_type(self, address_space)
+
+    def _host_semaphore(
+        self, state: _ChannelState, address_space: EmulatedAddressSpace, value: int
+    ) -> None:
+        registers = state.host_registers
+        address = ((registers[NVB06F_SEMAPHOREA >> 2] & 0xFF) << 32) | registers[
+            NVB06F_SEMAPHOREB >> 2
+        ]
+        payload = registers[NVB06F_SEMAPHOREC >> 2]
+        operation = _HOST_SEMAPHORE_OPERATION(value)
+
+        if operation == NVB06F_SEMAPHORED_OPERATION_RELEASE:
+            _write_semaphore_release(
+                address_space,
+                address,
+                payload,
+                _HOST_SEMAPHORE_RELEASE_SIZE(value) == NVB06F_SEMAPHORED_RELEASE_SIZE_16BYTE,
+            )
+        elif operation in [
+            NVB06F_SEMAPHORED_OPERATION_ACQUIRE,
+            NVB06F_SEMAPHORED_OPERATION_ACQ_GEQ,
+        ]:
+            current = array("I", address_space.read(address, 4))[0]
+
+            if operation == NVB06F_SEMAPHORED_OPERATION_ACQUIRE:
+                is_satisfied = current == payload
+            else:
+                is_satisfied = ((current - payload) & 0xFFFFFFFF) < 0x80000000
+
+            # Methods run in order, nothing can release the semaphore while the channel waits.
+            if not is_satisfied:
+                raise Exception(
+                    f"Semaphore acquire of 0x{payload:x} at 0x{address:x} never completes (value is 0x{current:x})"
+                )
+
+    def execute(
+        self, channel: EmulatedChannel, entries: typing.List[typing.Tuple[int, int]]
+    ) -> None:
+        address_space = channel.address_space
+        assert address_space is not None
+
+        if channel.engine_state is None:
+            channel.engine_state = _ChannelState()
+
+        state: _ChannelState = channel.engine_state
+        statistics = self.statistics
+
+        for (address, word_count) in entries:
+            statistics.entry_count += 1
+
+            view = address_space.view(address, word_count * 4)
+
+            for command in decode_command_buffer(view):
+                statistics.command_count += 1
+
+                if command.method < HOST_METHOD_LIMIT:
+                    for (method, value) in command.method_writes():
+                        statistics.method_count += 1
+                        state.host_registers[method >> 2] = value
+
+                        if method == NVB06F_SET_OBJECT:
+                            self._bind_object(state, address_space, command.subchannel, value)
+                        elif method == NVB06F_SEMAPHORED:
+                            self._host_semaphore(state, address_space, value)
+
+                    continue
+
+                engine = state.engines[command.subchannel]
+
+                if engine is None:
+                    raise Exception(
+                        f"{command.method_name} sent to unbound subchannel {command.subchannel}"
+                    )
+
+                # Bulk path for inline data, this is where most of the words are.
+                if (
+                    command.method == NVB1C0_LOAD_INLINE_DATA
+                    and command.submission_mode
+                    in [
+                        COMMAND_SUBMISSION_MODE_NON_INCREASING,
+                        COMMAND_SUBMISSION_MODE_NON_INCREASING_OLD,
+                    ]
+                    and engine.load_inline_data(_words_to_bytes(command.arguments))
+                ):
+                    statistics.method_count += len(command.arguments)
+                    continue
+
+                registers = engine.registers
+                triggers = engine.triggers
+
+                for (method, value) in command.method_writes():
+                    statistics.method_count += 1
+                    registers[method >> 2] = value
+
+                    trigger = triggers.get(method)
+
+                    if trigger is not None:
+                        trigger(value)
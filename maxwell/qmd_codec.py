@@ -0,0 +1,271 @@
+from array import array
+from ctypes import sizeof
+from maxwell.hw.compute_b_qmd import *
+
+import typing
+
+QMD_SIZE_IN_BITS = 2048
+QMD_SIZE_IN_WORDS = QMD_SIZE_IN_BITS // 32
+
+# (word, shift in word, mask, shift in value)
+QmdFieldPart = typing.Tuple[int, int, int, int]
+
+
+def _get_field_parts(start: int, size: int) -> typing.List[QmdFieldPart]:
+    parts: typing.List[QmdFieldPart] = list()
+    value_shift = 0
+
+    # Fields are split on word boundaries, none of the QMD fields straddle words today.
+    while size != 0:
+        word = start // 32
+        shift = start % 32
+        part_size = min(size, 32 - shift)
+
+        parts.append((word, shift, (1 << part_size) - 1, value_shift))
+
+        start += part_size
+        size -= part_size
+        value_shift += part_size
+
+    return parts
+
+
+class QmdCodec(object):
+    """
+    Packs and unpacks QMD fields with shift and masks computed from the generated bit ranges.
+
+    compile_packer and compile_unpacker generate straight-line code for a fixed list of fields,
+    the batch variants handle many QMDs at once with numpy.
+    """
+
+    qmd_type: typing.Type[typing.Union[qmdv0006, qmdv0107]]
+    fields: typing.Dict[str, typing.Tuple[int, int]]
+
+    _parts: typing.Dict[str, typing.List[QmdFieldPart]]
+
+    def __init__(
+        self,
+        qmd_type: typing.Type[typing.Union[qmdv0006, qmdv0107]],
+        fields: typing.Dict[str, typing.Tuple[int, int]],
+    ) -> None:
+        self.qmd_type = qmd_type
+        self.fields = fields
+        self._parts = {
+            name: _get_field_parts(start, size)
+            for (name, (start, size)) in fields.items()
+        }
+
+    def get_parts(self, name: str) -> typing.List[QmdFieldPart]:
+        return self._parts[name]
+
+    def validate(self) -> None:
+        used = 0
+
+        for (name, (start, size)) in self.fields.items():
+            if size == 0 or start + size > QMD_SIZE_IN_BITS:
+                raise Exception(f"QMD field {name} is out of bounds")
+
+            mask = ((1 << size) - 1) << start
+
+            if used & mask != 0:
+                raise Exception(f"QMD field {name} overlaps another field")
+
+            used |= mask
+
+    def validate_structure(self) -> None:
+        """Check the bit ranges against the ctypes structure, field by field"""
+
+        if sizeof(self.qmd_type) * 8 != QMD_SIZE_IN_BITS:
+            raise Exception(f"{self.qmd_type.__name__} isn't {QMD_SIZE_IN_BITS} bits")
+
+        for (name, _, size) in self.qmd_type._fields_:
+            job = self.qmd_type()
+            setattr(job, name, (1 << size) - 1)
+
+            (start, expected_size) = self.fields[name]
+
+            if expected_size != size or int.from_bytes(
+                bytes(job), "little"
+            ) != (((1 << size) - 1) << start):
+                raise Exception(f"QMD field {name} doesn't match {self.qmd_type.__name__}")
+
+    def pack(
+        self,
+        values: typing.Dict[str, int],
+        base: typing.Optional[typing.Union[bytes, bytearray, memoryview]] = None,
+    ) -> bytearray:
+        if base is None:
+            words = array("I", bytes(QMD_SIZE_IN_WORDS * 4))
+        else:
+            words = array("I", bytes(base))
+
+        for (name, value) in values.items():
+            for (word, shift, mask, value_shift) in self._parts[name]:
+                words[word] = (words[word] & ~(mask << shift)) | (
+                    ((value >> value_shift) & mask) << shift
+                )
+
+        return bytearray(words.tobytes())
+
+    def unpack(
+        self,
+        data: typing.Union[bytes, bytearray, memoryview],
+        names: typing.Optional[typing.Iterable[str]] = None,
+    ) -> typing.Dict[str, int]:
+        words = memoryview(data).cast("B").cast("I")
+        result: typing.Dict[str, int] = dict()
+
+        for name in names if names is not None else self.fields:
+            value = 0
+
+            for (word, shift, mask, value_shift) in self._parts[name]:
+                value |= ((words[word] >> shift) & mask) << value_shift
+
+            result[name] = value
+
+        return result
+
+    def _group_by_word(
+        self, names: typing.Sequence[str]
+    ) -> typing.Dict[int, typing.List[typing.Tuple[int, int, int, int]]]:
+        result: typing.Dict[int, typing.List[typing.Tuple[int, int, int, int]]] = dict()
+
+        for (index, name) in enumerate(names):
+            for (word, shift, mask, value_shift) in self._parts[name]:
+                result.setdefault(word, list()).append(
+                    (index, shift, mask, value_shift)
+                )
+
+        return result
+
+    def compile_packer(
+        self, names: typing.Sequence[str]
+    ) -> typing.Callable[..., None]:
+        """
+        Create a function (words, *values) writing the given fields in an array("I") (or any
+        writable sequence of u32) in place, with one read-modify-write per touched word.
+        """
+
+        arguments = [f"v{index}" for index in range(len(names))]
+        lines = [f"def pack(words, {', '.join(arguments)}):"]
+
+        for (word, parts) in sorted(self._group_by_word(names).items()):
+            kept = 0xFFFFFFFF
+
+            for (_, shift, mask, _) in parts:
+                kept &= ~(mask << shift) & 0xFFFFFFFF
+
+            terms = [
+                f"((v{index} >> {value_shift}) & {hex(mask)}) << {shift}"
+                for (index, shift, mask, value_shift) in parts
+            ]
+
+            if kept != 0:
+                terms.insert(0, f"(words[{word}] & {hex(kept)})")
+
+            lines.append(f"    words[{word}] = {' | '.join(terms)}")
+
+        if len(lines) == 1:
+            lines.append("    pass")
+
+        scope: typing.Dict[str, typing.Any] = dict()
+        exec("\n".join(lines), scope)
+
+        return scope["pack"]
+
+    def compile_unpacker(
+        self, names: typing.Sequence[str]
+    ) -> typing.Callable[..., typing.Tuple[int, ...]]:
+        """Create a function (words) returning the given fields as a tuple"""
+
+        values: typing.List[str] = list()
+
+        for name in names:
+            terms = [
+                f"(((words[{word}] >> {shift}) & {hex(mask)}) << {value_shift})"
+                for (word, shift, mask, value_shift) in self._parts[name]
+            ]
+            values.append(" | ".join(terms))
+
+        source = f"def unpack(words):\n    return ({''.join(value + ', ' for value in values)})"
+
+        scope: typing.Dict[str, typing.Any] = dict()
+        exec(source, scope)
+
+        return scope["unpack"]
+
+    def pack_batch(
+        self,
+        columns: typing.Any,
+        count: typing.Optional[int] = None,
+        base: typing.Optional[typing.Union[bytes, bytearray, memoryview]] = None,
+    ) -> typing.Any:
+        """
+        Pack many QMDs at once, columns is a numpy structured array or maps field names to
+        scalars or arrays of count values.
+
+        Returns a (count, QMD_SIZE_IN_WORDS) uint32 array, the bytes of each row are a QMD.
+        """
+
+        import numpy as np
+
+        if isinstance(columns, np.ndarray):
+            columns = {name: columns[name] for name in columns.dtype.names}
+
+        if count is None:
+            count = max(np.size(column) for column in columns.values())
+
+        if base is None:
+            base = bytes(QMD_SIZE_IN_WORDS * 4)
+
+        result = np.tile(np.frombuffer(bytes(base), dtype=np.uint32), (count, 1))
+
+        for (name, column) in columns.items():
+            values = np.broadcast_to(np.asarray(column, dtype=np.uint64), (count,))
+
+            for (word, shift, mask, value_shift) in self._parts[name]:
+                part = ((values >> np.uint64(value_shift)) & np.uint64(mask)).astype(
+                    np.uint32
+                )
+                result[:, word] &= np.uint32(~(mask << shift) & 0xFFFFFFFF)
+                result[:, word] |= part << np.uint32(shift)
+
+        return result
+
+    def unpack_batch(
+        self, data: typing.Any, names: typing.Optional[typing.Iterable[str]] = None
+    ) -> typing.Dict[str, typing.Any]:
+        """Unpack fields of many QMDs (any buffer of whole QMDs) as uint64 arrays"""
+
+        import numpy as np
+
+        words = np.frombuffer(data, dtype=np.uint32).reshape(-1, QMD_SIZE_IN_WORDS)
+        result: typing.Dict[str, typing.Any] = dict()
+
+        for name in names if names is not None else self.fields:
+            value = np.zeros(words.shape[0], dtype=np.uint64)
+
+            for (word, shift, mask, value_shift) in self._parts[name]:
+                value |= (
+                    (words[:, word].astype(np.uint64) >> np.uint64(shift))
+                    & np.uint64(mask)
+                ) << np.uint64(value_shift)
+
+            result[name] = value
+
+        return result
+
+
+QMDV0006_CODEC = QmdCodec(qmdv0006, QMDV0006_FIELDS)
+QMDV0107_CODEC = QmdCodec(qmdv0107, QMDV0107_FIELDS)
+
+_QMD_CODECS: typing.Dict[type, QmdCodec] = {
+    qmdv0006: QMDV0006_CODEC,
+    qmdv0107: QMDV0107_CODEC,
+}
+
+
+def get_qmd_codec(
+    qmd_type: typing.Type[typing.Union[qmdv0006, qmdv0107]]
+) -> QmdCodec:
+    return _QMD_CODECS[qmd_type]
@@ -0,0 +1,174 @@
+from bisect import insort
+from collections import OrderedDict
+from command_buffer import *
+from nvgpu import GpuMemory, SyncFence, align_up
+from maxwell.hw import *
+from maxwell.hw.compute_b import *
+from maxwell.hw.compute_b_qmd import *
+
+import hashlib
+import typing
+
+SHADER_PROGRAM_ALIGN_REQUIREMENT = 0x100
+
+
+def invalidate_instruction_cache(command_buffer: CommandBuffer):
+    command_buffer.write_u32(
+        InlineCommand(
+            NVB1C0_INVALIDATE_SHADER_CACHES,
+            SUBCHANNEL_ID_COMPUTE,
+            NVB1C0_INVALIDATE_SHADER_CACHES_INSTRUCTION(
+                NVB1C0_INVALIDATE_SHADER_CACHES_INSTRUCTION_TRUE
+            ),
+        )
+    )
+
+
+class ShaderProgram(object):
+    key: bytes
+    offset: int
+    size: int
+
+    # Last submission using this program, None if it was never submitted.
+    fence: typing.Optional[SyncFence]
+    is_pending: bool
+
+    def __init__(self, key: bytes, offset: int, size: int) -> None:
+        self.key = key
+        self.offset = offset
+        self.size = size
+        self.fence = None
+        self.is_pending = False
+
+
+class ShaderProgramRegion(object):
+    """
+    Places SM binaries in the program region given to initialize_compute_engine.
+
+    Programs are keyed by the hash of their code so identical kernels are uploaded once, the least
+    recently used ones are evicted when the region is full.
+    """
+
+    memory: GpuMemory
+
+    # In least to most recently used order.
+    programs: typing.OrderedDict[bytes, ShaderProgram]
+    # Sorted (offset, size) ranges.
+    free_ranges: typing.List[typing.Tuple[int, int]]
+
+    # Programs used since the last attach_fence.
+    _pending: typing.List[ShaderProgram]
+    # Command buffer that got an instruction cache invalidation since the last attach_fence.
+    _invalidated_command_buffer: typing.Optional[CommandBuffer]
+
+    def __init__(self, memory: GpuMemory) -> None:
+        self.memory = memory
+        self.programs = OrderedDict()
+        self.free_ranges = [(0, memory.gpu_memory_size)]
+        self._pending = list()
+        self._invalidated_command_buffer = None
+
+    def _allocate(self, size: int) -> typing.Optional[int]:
+        for (index, (offset, range_size)) in enumerate(self.free_ranges):
+            if range_size >= size:
+                if range_size == size:
+                    self.free_ranges.pop(index)
+                else:
+                    self.free_ranges[index] = (offset + size, range_size - size)
+
+                return offset
+
+        return None
+
+    def _free(self, offset: int, size: int) -> None:
+        insort(self.free_ranges, (offset, size))
+
+        # Coalesce with the neighbours.
+        result: typing.List[typing.Tuple[int, int]] = list()
+
+        for (range_offset, range_size) in self.free_ranges:
+            if len(result) != 0 and result[-1][0] + result[-1][1] == range_offset:
+                result[-1] = (result[-1][0], result[-1][1] + range_size)
+            else:
+                result.append((range_offset, range_size))
+
+        self.free_ranges = result
+
+    def _evict(self) -> None:
+        for program in self.programs.values():
+            if not program.is_pending:
+                break
+        else:
+            raise Exception(
+                "Shader program region exhausted by programs of unsubmitted dispatches"
+            )
+
+        if program.fence is not None:
+            program.fence.wait()
+
+        del self.programs[program.key]
+        self._free(program.offset, program.size)
+
+    def upload(self, command_buffer: CommandBuffer, code: typing.Union[bytes, bytearray]) -> int:
+        """Returns the offset of the code in the region, uploading it if it isn't already resident"""
+
+        key = hashlib.sha256(code).digest()
+        program = self.programs.get(key)
+
+        if program is None:
+            size = align_up(len(code), SHADER_PROGRAM_ALIGN_REQUIREMENT)
+
+            if size > self.memory.gpu_memory_size:
+                raise Exception("Shader program doesn't fit in the program region")
+
+            offset = self._allocate(size)
+
+            while offset is None:
+                self._evict()
+                offset = self._allocate(size)
+
+            self.memory.write(offset, code)
+
+            # Only new code can make the instruction cache stale. It is written through the CPU
+            # mapping before the submission runs, so a single invalidation ahead of the first
+            # dispatch of the submission covers every program uploaded for it. Evicted programs
+            # were used by earlier submissions only, their lines are dropped by it too.
+            if self._invalidated_command_buffer is not command_buffer:
+                invalidate_instruction_cache(command_buffer)
+                self._invalidated_command_buffer = command_buffer
+
+            program = ShaderProgram(key, offset, size)
+            self.programs[key] = program
+        else:
+            self.programs.move_to_end(key)
+
+        if not program.is_pending:
+            program.is_pending = True
+            self._pending.append(program)
+
+        return program.offset
+
+    def bind(
+        self,
+        command_buffer: CommandBuffer,
+        job: typing.Union[qmdv0006, qmdv0107],
+        code: typing.Union[bytes, bytearray],
+    ) -> int:
+        job.program_offset = self.upload(command_buffer, code)
+
+        return job.program_offset
+
+    def attach_fence(self, fence: SyncFence) -> None:
+        """
+        Programs used since the last call can be evicted once fence signals.
+
+        Call it once the command buffers given to upload are submitted, it also ends the batching
+        of instruction cache invalidations.
+        """
+
+        for program in self._pending:
+            program.fence = fence
+            program.is_pending = False
+
+        self._pending.clear()
+        self._invalidated_command_buffer = None
@@ -890,7 +890,7 @@ def print_nv_bitfield(stream: CodeStream, nv_bitfield: NvBitfieldMacroDefinition
     stream.write_line(f"def {func_name}(value: int) -> int:")
     stream.indent()
     stream.write_line(
-        f"return set_bits({nv_bitfield.offset_start}, {nv_bitfield.offset_end - nv_bitfield.offset_start}, value)"
+        f"return set_bits({nv_bitfield.offset_start}, {nv_bitfield.offset_end - nv_bitfield.offset_start + 1}, value)"
     )
     stream.unindent()
 
@@ -919,6 +919,22 @@ def print_nv_qmd(stream: CodeStream, qmd: QmdStruct):
     stream.write_line()
 
 
+def print_nv_qmd_fields(stream: CodeStream, qmd: QmdStruct):
+    # Bit ranges straight from the MW(hi:lo) definitions, ctypes may pad differently.
+    stream.write_line(f"{qmd.name.upper()}_FIELDS: Dict[str, Tuple[int, int]] = {{")
+    stream.indent()
+
+    for (field_name, bitfield_end, bitfield_start) in qmd.fields:
+        stream.write_line(
+            f'"{field_name}": ({bitfield_start}, {bitfield_end - bitfield_start + 1}),'
+        )
+
+    stream.unindent()
+    stream.write_line("}")
+    stream.write_line()
+    stream.write_line()
+
+
 def print_ioctl_macro(stream: CodeStream, ioctl: IoctlMacroDefinition):
     ioctl_name = ioctl.name.upper()
 
@@ -1077,6 +1093,9 @@ def parse_header(target_header: str, output_file_path: str, node: Cursor) -> Non
     if len(structs) != 0 or len(qmds) != 0:
         stream.write_line("from ctypes import *")
 
+    if len(qmds) != 0:
+        stream.write_line("from typing import Dict, Tuple")
+
     if len(ioctls) != 0 or len(nv_bitfields) != 0:
         stream.write_line("from utils import *")
 
@@ -1105,6 +1124,9 @@ def parse_header(target_header: str, output_file_path: str, node: Cursor) -> Non
     for qmd in qmds:
         print_nv_qmd(stream, qmd)
 
+    for qmd in qmds:
+        print_nv_qmd_fields(stream, qmd)
+
     stream.write_line()
     stream.write_line()
 
@@ -1,28 +1,47 @@
 from ctypes import (
     addressof,
+    c_char,
     c_short,
     c_uint,
     c_int,
     c_ulong,
+    memset,
+    pointer,
     sizeof,
     POINTER,
     CDLL,
 )
+from collections import deque
 from mmap import MAP_SHARED, PROT_READ, PROT_WRITE, mmap
 from select import *
-from typing import Any, List, Optional, Tuple, Union, overload
+from typing import Any, Deque, Dict, List, Optional, Tuple, Union, overload
 from command_buffer import *
 from nvmap_header import (
+    NVMAP_IOC_ALLOC,
+    NVMAP_IOC_CACHE_64,
+    NVMAP_IOC_CREATE,
     NVMAP_IOC_FREE,
+    NVMAP_IOC_GET_FD,
     nvmap_alloc_handle,
+    nvmap_cache_op_64,
     nvmap_create_handle,
-    nvmap_ioc_alloc,
-    nvmap_ioc_create,
-    nvmap_ioc_get_fd,
 )
 from nvgpu_header import (
     NVGPU_AS_MAP_BUFFER_FLAGS_CACHEABLE,
+    NVGPU_AS_IOCTL_BIND_CHANNEL,
+    NVGPU_AS_IOCTL_MAP_BUFFER_EX,
     NVGPU_AS_MAP_BUFFER_FLAGS_DIRECT_KIND_CTRL,
+    NVGPU_GPU_IOCTL_ALLOC_AS,
+    NVGPU_GPU_IOCTL_GET_CHARACTERISTICS,
+    NVGPU_GPU_IOCTL_GET_CPU_TIME_CORRELATION_INFO,
+    NVGPU_GPU_IOCTL_OPEN_CHANNEL,
+    NVGPU_GPU_IOCTL_OPEN_TSG,
+    NVGPU_IOCTL_CHANNEL_ALLOC_GPFIFO,
+    NVGPU_IOCTL_CHANNEL_ALLOC_OBJ_CTX,
+    NVGPU_IOCTL_CHANNEL_SET_NVMAP_FD,
+    NVGPU_IOCTL_CHANNEL_SETUP_BIND,
+    NVGPU_IOCTL_CHANNEL_SUBMIT_GPFIFO,
+    NVGPU_TSG_IOCTL_BIND_CHANNEL,
     NVGPU_SUBMIT_GPFIFO_FLAGS_FENCE_GET,
     NVGPU_SUBMIT_GPFIFO_FLAGS_FENCE_WAIT,
     NVGPU_SUBMIT_GPFIFO_FLAGS_SYNC_FENCE,
@@ -30,27 +49,16 @@ from nvgpu_header import (
     nvgpu_alloc_gpfifo_args,
     nvgpu_alloc_obj_ctx_args,
     nvgpu_as_bind_channel_args,
-    nvgpu_as_ioctl_bind_channel,
-    nvgpu_as_ioctl_map_buffer_ex,
     nvgpu_as_map_buffer_ex_args,
     nvgpu_channel_setup_bind_args,
     nvgpu_fence,
     nvgpu_gpu_characteristics,
     nvgpu_gpu_get_characteristics,
-    nvgpu_gpu_ioctl_alloc_as,
-    nvgpu_gpu_ioctl_get_characteristics,
-    nvgpu_gpu_ioctl_open_channel,
-    nvgpu_gpu_ioctl_open_tsg,
+    nvgpu_gpu_get_cpu_time_correlation_info_args,
     nvgpu_gpu_open_channel_args,
     nvgpu_gpu_open_tsg_args,
-    nvgpu_ioctl_channel_alloc_gpfifo,
-    nvgpu_ioctl_channel_alloc_obj_ctx,
-    nvgpu_ioctl_channel_set_nvmap_fd,
-    nvgpu_ioctl_channel_setup_bind,
-    nvgpu_ioctl_channel_submit_gpfifo,
     nvgpu_set_nvmap_fd_args,
     nvgpu_submit_gpfifo_args,
-    nvgpu_tsg_ioctl_bind_channel,
 )
 from os import close
 import errno
@@ -98,85 +106,181 @@ def get_errno_code() -> Optional[str]:
     return None
 
 
+class IoctlBackend(object):
+    """Default backend, forwards everything to the kernel"""
+
+    _files: Dict[int, Any]
+
+    def __init__(self) -> None:
+        self._files = dict()
+
+    def open(self, path: str) -> int:
+        file = open(path, "wb")
+        self._files[file.fileno()] = file
+
+        return file.fileno()
+
+    def close(self, fd: int) -> None:
+        file = self._files.pop(fd, None)
+
+        if file is not None:
+            file.close()
+        else:
+            close(fd)
+
+    def ioctl(self, fd: int, request: int, argument: Any) -> int:
+        return ioctl(fd, request, argument)
+
+    def get_errno(self) -> int:
+        return get_errno()
+
+
+_ioctl_backend: IoctlBackend = IoctlBackend()
+
+
+def get_ioctl_backend() -> IoctlBackend:
+    return _ioctl_backend
+
+
+def set_ioctl_backend(backend: IoctlBackend) -> None:
+    global _ioctl_backend
+
+    _ioctl_backend = backend
+
+
 class BlockDevice(object):
-    file: Any
+    backend: IoctlBackend
     fd: int
 
-    def __init__(self, path: Optional[str] = None, fd: int = -1) -> None:
+    # Preallocated ioctl arguments (and pointers to them) per argument type.
+    _arguments: Dict[Any, Tuple[Any, Any]]
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        fd: int = -1,
+        backend: Optional[IoctlBackend] = None,
+    ) -> None:
+        self._arguments = dict()
+
+        if backend is None:
+            backend = get_ioctl_backend()
+
+        self.backend = backend
+
         if fd != -1:
             self.fd = fd
         elif path is not None:
-            self.file = open(path, "wb")
-            self.fd = self.file.fileno()
+            self.fd = backend.open(path)
         else:
             raise Exception("INVALID COMBINAISON")
 
     def close(self) -> None:
-        if self.file is not None:
-            self.file.close()
+        self.backend.close(self.fd)
+
+    def ioctl(self, request: int, argument: Any) -> int:
+        return self.backend.ioctl(self.fd, request, argument)
+
+    def get_argument(self, argument_type: Any) -> Tuple[Any, Any]:
+        # NOTE: Arguments are reused between calls and are thus not thread safe.
+        entry = self._arguments.get(argument_type)
+
+        if entry is None:
+            argument = argument_type()
+            entry = (argument, pointer(argument))
+            self._arguments[argument_type] = entry
         else:
-            close(self.fd)
+            memset(addressof(entry[0]), 0, sizeof(argument_type))
+
+        return entry
 
     def check_result(self, result_code: int, output_value: Any = None) -> Any:
         if result_code == 0:
             return output_value
 
-        exception = ErrnoException(get_errno())
+        exception = ErrnoException(self.backend.get_errno())
 
         print(exception.message)
 
         raise exception
 
 
+NVMAP_CACHE_OP_WB = 0
+NVMAP_CACHE_OP_INV = 1
+NVMAP_CACHE_OP_WB_INV = 2
+
+
 class NvMap(BlockDevice):
     def __init__(self) -> None:
         super().__init__("/dev/nvmap")
 
     def create(self, size: int) -> int:
-        request = nvmap_create_handle()
+        (request, request_pointer) = self.get_argument(nvmap_create_handle)
         request.unamed_field0.unamed_field0.unamed_field0.size = size
 
-        self.check_result(nvmap_ioc_create(self.fd, request))
+        self.check_result(self.ioctl(NVMAP_IOC_CREATE, request_pointer))
 
         return request.unamed_field0.unamed_field0.handle
 
     def get_fd(self, handle: int) -> int:
-        request = nvmap_create_handle()
+        (request, request_pointer) = self.get_argument(nvmap_create_handle)
         request.unamed_field0.unamed_field0.handle = handle
 
-        self.check_result(nvmap_ioc_get_fd(self.fd, request))
+        self.check_result(self.ioctl(NVMAP_IOC_GET_FD, request_pointer))
 
         return request.unamed_field0.unamed_field0.unamed_field0.fd
 
     def free(self, handle: int) -> None:
-        self.check_result(ioctl(self.fd, NVMAP_IOC_FREE, c_uint(handle)))
+        self.check_result(self.ioctl(NVMAP_IOC_FREE, c_uint(handle)))
 
     def allocate(self, handle: int, heap_mask: int, flags: int, align: int) -> None:
-        request = nvmap_alloc_handle()
+        (request, request_pointer) = self.get_argument(nvmap_alloc_handle)
         request.handle = handle
         request.heap_mask = heap_mask
         request.flags = flags
         request.align = align
 
-        self.check_result(nvmap_ioc_alloc(self.fd, request))
+        self.check_result(self.ioctl(NVMAP_IOC_ALLOC, request_pointer))
+
+    def cache(self, handle: int, address: int, size: int, op: int) -> None:
+        (request, request_pointer) = self.get_argument(nvmap_cache_op_64)
+        request.addr = address
+        request.handle = handle
+        request.len = size
+        request.op = op
+
+        self.check_result(self.ioctl(NVMAP_IOC_CACHE_64, request_pointer))
 
 
 class NvHostGpu(BlockDevice):
-    def __init__(self, path: Optional[str] = "/dev/nvhost-gpu", fd: int = -1) -> None:
-        super().__init__(path, fd)
+    gpfifo_entries: Any
+
+    def __init__(
+        self,
+        path: Optional[str] = "/dev/nvhost-gpu",
+        fd: int = -1,
+        backend: Optional[IoctlBackend] = None,
+    ) -> None:
+        super().__init__(path, fd, backend)
+
+        self.gpfifo_entries = (c_ulong * 0x20)()
 
     def set_nvmap_fd(self, nvmap: NvMap) -> None:
         request = nvgpu_set_nvmap_fd_args()
         request.fd = nvmap.fd
 
-        self.check_result(nvgpu_ioctl_channel_set_nvmap_fd(self.fd, request))
+        self.check_result(
+            self.ioctl(NVGPU_IOCTL_CHANNEL_SET_NVMAP_FD, pointer(request))
+        )
 
     def alloc_gpfifo(self, num_entries: int, flags: int) -> None:
         request = nvgpu_alloc_gpfifo_args()
         request.num_entries = num_entries
         request.flags = flags
 
-        self.check_result(nvgpu_ioctl_channel_alloc_gpfifo(self.fd, request))
+        self.check_result(
+            self.ioctl(NVGPU_IOCTL_CHANNEL_ALLOC_GPFIFO, pointer(request))
+        )
 
     def setup_bind(
         self,
@@ -197,7 +301,7 @@ class NvHostGpu(BlockDevice):
         request.userd_dmabuf_offset = userd_dmabuf_offset
         request.gpfifo_dmabuf_offset = gpfifo_dmabuf_offset
 
-        self.check_result(nvgpu_ioctl_channel_setup_bind(self.fd, request))
+        self.check_result(self.ioctl(NVGPU_IOCTL_CHANNEL_SETUP_BIND, pointer(request)))
 
         if errno == 0:
             return request.work_submit_token
@@ -207,22 +311,33 @@ class NvHostGpu(BlockDevice):
         request.class_num = class_num
         request.flags = flags
 
-        self.check_result(nvgpu_ioctl_channel_alloc_obj_ctx(self.fd, request))
+        self.check_result(
+            self.ioctl(NVGPU_IOCTL_CHANNEL_ALLOC_OBJ_CTX, pointer(request))
+        )
 
         return request.obj_id
 
     def submit_gpfifo(
         self,
-        user_queue: List[c_ulong],
+        user_queue: List[int],
         flags: int,
         waiting_fence: Optional[nvgpu_fence] = None,
     ) -> Optional[nvgpu_fence]:
-        queue_array_type = c_ulong * len(user_queue)
-        ioctl_user_queue = queue_array_type(*user_queue)
+        entry_count = len(user_queue)
+
+        if entry_count > len(self.gpfifo_entries):
+            capacity = len(self.gpfifo_entries)
 
-        request = nvgpu_submit_gpfifo_args()
-        request.gpfifo = addressof(ioctl_user_queue)
-        request.num_entries = len(user_queue)
+            while capacity < entry_count:
+                capacity *= 2
+
+            self.gpfifo_entries = (c_ulong * capacity)()
+
+        self.gpfifo_entries[0:entry_count] = user_queue
+
+        (request, request_pointer) = self.get_argument(nvgpu_submit_gpfifo_args)
+        request.gpfifo = addressof(self.gpfifo_entries)
+        request.num_entries = entry_count
         request.flags = flags
 
         if (
@@ -232,8 +347,11 @@ class NvHostGpu(BlockDevice):
         ):
             request.fence = waiting_fence
 
-        self.check_result(nvgpu_ioctl_channel_submit_gpfifo(self.fd, request))
+        self.check_result(
+            self.ioctl(NVGPU_IOCTL_CHANNEL_SUBMIT_GPFIFO, request_pointer)
+        )
 
+        # NOTE: The fence lives in the pooled argument, it is only valid until the next submit.
         if (
             flags & NVGPU_SUBMIT_GPFIFO_FLAGS_FENCE_GET
         ) == NVGPU_SUBMIT_GPFIFO_FLAGS_FENCE_GET:
@@ -244,20 +362,23 @@ class NvHostGpu(BlockDevice):
 
 class NvAddressSpace(BlockDevice):
     def __init__(
-        self, path: Optional[str] = "/dev/nvhost-as-gpu", fd: int = -1
+        self,
+        path: Optional[str] = "/dev/nvhost-as-gpu",
+        fd: int = -1,
+        backend: Optional[IoctlBackend] = None,
     ) -> None:
-        super().__init__(path, fd)
+        super().__init__(path, fd, backend)
 
     def bind_channel(self, channel: NvHostGpu) -> int:
         request = nvgpu_as_bind_channel_args()
         request.channel_fd = channel.fd
 
-        errno = nvgpu_as_ioctl_bind_channel(self.fd, request)
+        errno = self.ioctl(NVGPU_AS_IOCTL_BIND_CHANNEL, pointer(request))
 
         if errno == 0:
             return 0
 
-        return get_errno()
+        return self.backend.get_errno()
 
     def map_buffer_ex(
         self,
@@ -270,29 +391,34 @@ class NvAddressSpace(BlockDevice):
         mapping_size: int = 0,
         offset: int = 0,
     ) -> Tuple[int, int, int]:
-        request = nvgpu_as_map_buffer_ex_args()
+        (request, request_pointer) = self.get_argument(nvgpu_as_map_buffer_ex_args)
         request.flags = flags
-        request.compr_kind = c_short(compr_kind)
-        request.incompr_kind = c_short(incompr_kind)
+        request.compr_kind = compr_kind
+        request.incompr_kind = incompr_kind
         request.dmabuf_fd = dmabuf_fd
         request.page_size = page_size
         request.buffer_offset = buffer_offset
         request.mapping_size = mapping_size
         request.offset = offset
 
-        self.check_result(nvgpu_as_ioctl_map_buffer_ex(self.fd, request))
+        self.check_result(self.ioctl(NVGPU_AS_IOCTL_MAP_BUFFER_EX, request_pointer))
 
         return (request.flags, request.page_size, request.offset)
 
 
 class NvHostTSGGpu(BlockDevice):
     def __init__(
-        self, path: Optional[str] = "/dev/nvhost-tsg-gpu", fd: int = -1
+        self,
+        path: Optional[str] = "/dev/nvhost-tsg-gpu",
+        fd: int = -1,
+        backend: Optional[IoctlBackend] = None,
     ) -> None:
-        super().__init__(path, fd)
+        super().__init__(path, fd, backend)
 
     def bind_channel(self, channel: NvHostGpu) -> None:
-        self.check_result(nvgpu_tsg_ioctl_bind_channel(self.fd, c_int(channel.fd)))
+        self.check_result(
+            self.ioctl(NVGPU_TSG_IOCTL_BIND_CHANNEL, pointer(c_int(channel.fd)))
+        )
 
 
 class NvHostGpuCtrl(BlockDevice):
@@ -307,8 +433,26 @@ class NvHostGpuCtrl(BlockDevice):
         request.gpu_characteristics_buf_size = sizeof(result)
 
         return self.check_result(
-            nvgpu_gpu_ioctl_get_characteristics(self.fd, request), result
+            self.ioctl(NVGPU_GPU_IOCTL_GET_CHARACTERISTICS, pointer(request)), result
+        )
+
+    def get_cpu_time_correlation_info(
+        self, count: int, source_id: int
+    ) -> List[Tuple[int, int]]:
+        (request, request_pointer) = self.get_argument(
+            nvgpu_gpu_get_cpu_time_correlation_info_args
         )
+        request.count = count
+        request.source_id = source_id
+
+        self.check_result(
+            self.ioctl(NVGPU_GPU_IOCTL_GET_CPU_TIME_CORRELATION_INFO, request_pointer)
+        )
+
+        return [
+            (sample.cpu_timestamp, sample.gpu_timestamp)
+            for sample in request.samples[:count]
+        ]
 
     def allocate_address_space(
         self, big_page_size: c_uint, flags: c_uint
@@ -317,24 +461,24 @@ class NvHostGpuCtrl(BlockDevice):
         request.big_page_size = big_page_size
         request.flags = flags
 
-        self.check_result(nvgpu_gpu_ioctl_alloc_as(self.fd, request))
+        self.check_result(self.ioctl(NVGPU_GPU_IOCTL_ALLOC_AS, pointer(request)))
 
-        return NvAddressSpace(request.as_fd)
+        return NvAddressSpace(fd=request.as_fd, backend=self.backend)
 
     def open_tsg(self) -> NvHostTSGGpu:
         request = nvgpu_gpu_open_tsg_args()
 
-        self.check_result(nvgpu_gpu_ioctl_open_tsg(self.fd, request))
+        self.check_result(self.ioctl(NVGPU_GPU_IOCTL_OPEN_TSG, pointer(request)))
 
-        return NvHostTSGGpu(request.tsg_fd)
+        return NvHostTSGGpu(fd=request.tsg_fd, backend=self.backend)
 
     def open_channel(self, runlist_id: int) -> Union[NvHostGpu, int]:
         request = nvgpu_gpu_open_channel_args()
         request.unamed_field0.runlist_id = runlist_id
 
-        self.check_result(nvgpu_gpu_ioctl_open_channel(self.fd, request))
+        self.check_result(self.ioctl(NVGPU_GPU_IOCTL_OPEN_CHANNEL, pointer(request)))
 
-        return NvHostGpu(request.unamed_field0.channel_fd)
+        return NvHostGpu(fd=request.unamed_field0.channel_fd, backend=self.backend)
 
 
 class GpuMemory(object):
@@ -371,6 +515,31 @@ class GpuMemory(object):
     def __setitem__(self, index: slice, object: bytes) -> None:
         return self.mmap_instance.__setitem__(index, object)
 
+    def flush(self, offset: int = 0, size: Optional[int] = None) -> None:
+        """Make CPU writes to the mapping visible to the GPU (write back or write-combine flush)"""
+
+        if size is None:
+            size = self.gpu_memory_size - offset
+
+        # NOTE: The buffer export must not outlive this call or the mapping can't be closed.
+        mapping_start = c_char.from_buffer(self.mmap_instance)
+        address = addressof(mapping_start)
+        del mapping_start
+
+        self.nvmap_instance.cache(
+            self.nvmap_handle, address + offset, size, NVMAP_CACHE_OP_WB
+        )
+
+    def write(self, offset: int, data: Any) -> None:
+        """Write any buffer straight into the CPU mapping and flush it for the GPU"""
+
+        view = memoryview(data).cast("B")
+
+        assert offset + view.nbytes <= self.gpu_memory_size
+
+        self.mmap_instance[offset : offset + view.nbytes] = view
+        self.flush(offset, view.nbytes)
+
     def close(self):
         self.mmap_instance.close()
         # FIXME: missing unmap of the address space here
@@ -380,27 +549,196 @@ class GpuMemory(object):
         return f"GpuMemory(nvmap_handle={self.nvmap_handle}, user_size=0x{self.user_size:x}, gpu_address=0x{self.gpu_address:x}, gpu_memory_size=0x{self.gpu_memory_size:x})"
 
 
+class SyncFence(object):
+    fd: int
+    is_signaled: bool
+    _poll: poll
+
+    def __init__(self, fd: int) -> None:
+        self.fd = fd
+        self.is_signaled = False
+        self._poll = poll()
+        self._poll.register(fd, POLLOUT | POLLIN)
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        if not self.is_signaled:
+            self.is_signaled = len(self._poll.poll(timeout)) != 0
+
+        return self.is_signaled
+
+    def close(self) -> None:
+        if self.fd == -1:
+            return
+
+        self.wait()
+        self._poll.unregister(self.fd)
+        close(self.fd)
+        self.fd = -1
+
+
 class SubmittedCommandBuffer(object):
-    gpu_memory: GpuMemory
-    external_wait_fd: int
-    external_wait: poll
+    gpu_memory: Optional[GpuMemory]
+    fence: SyncFence
 
-    def __init__(
-        self, gpu_memory: GpuMemory, external_wait_fd: int, external_wait: poll
-    ) -> None:
+    def __init__(self, gpu_memory: Optional[GpuMemory], fence: SyncFence) -> None:
         self.gpu_memory = gpu_memory
-        self.external_wait_fd = external_wait_fd
-        self.external_wait = external_wait
+        self.fence = fence
+
+    @property
+    def external_wait_fd(self) -> int:
+        return self.fence.fd
 
     def wait(self, timeout: Optional[float] = None) -> bool:
-        return len(self.external_wait.poll(timeout)) != 0
+        return self.fence.wait(timeout)
 
     def close(self):
         self.wait()
-        self.gpu_memory.close()
 
-        self.external_wait.unregister(self.external_wait_fd)
-        close(self.external_wait_fd)
+        # NOTE: Command buffers living in the channel ring are not owned.
+        if self.gpu_memory is not None:
+            self.gpu_memory.close()
+            self.gpu_memory = None
+
+        self.fence.close()
+
+
+class CommandBufferRing(object):
+    ALIGNMENT: int = 0x10
+
+    gpu_memory: GpuMemory
+    head: int
+    in_flight: Deque[Tuple[int, int, Optional[SyncFence]]]
+
+    def __init__(self, gpu_memory: GpuMemory) -> None:
+        self.gpu_memory = gpu_memory
+        self.head = 0
+        self.in_flight = deque()
+
+    @property
+    def size(self) -> int:
+        return self.gpu_memory.gpu_memory_size
+
+    @staticmethod
+    def get_batch_size(command_buffers: List[CommandBuffer]) -> int:
+        return sum(
+            align_up(len(command_buffer), CommandBufferRing.ALIGNMENT)
+            for command_buffer in command_buffers
+        )
+
+    def _find_offset(self, head: int, tail: int, size: int) -> Optional[int]:
+        if head > tail:
+            if head + size <= self.size:
+                return head
+
+            # Wrap around if there is enough space before the oldest region.
+            if size <= tail:
+                return 0
+        elif head + size <= tail:
+            return head
+
+        return None
+
+    def _try_allocate(self, size: int) -> Optional[int]:
+        if len(self.in_flight) == 0:
+            self.head = 0
+
+            return 0
+
+        return self._find_offset(self.head, self.in_flight[0][0], size)
+
+    def can_allocate_without_fence(
+        self, size: int, pending: Optional[Tuple[int, int]] = None
+    ) -> bool:
+        """
+        Whether size can be allocated once every fenced region is reclaimed, after committing the
+        pending (offset, size) region without fence if given.
+        """
+
+        size = align_up(size, self.ALIGNMENT)
+
+        assert size <= self.size
+
+        regions = list(self.in_flight)
+
+        if pending is not None:
+            regions.append((pending[0], pending[0] + align_up(pending[1], self.ALIGNMENT), None))
+
+        # Regions after the newest fence can't be reclaimed until another fence is requested.
+        newest_fenced_index = max(
+            (index for (index, (_, _, fence)) in enumerate(regions) if fence is not None),
+            default=-1,
+        )
+        regions = regions[newest_fenced_index + 1 :]
+
+        if len(regions) == 0:
+            return True
+
+        return self._find_offset(regions[-1][1], regions[0][0], size) is not None
+
+    def get_oldest_fence(self) -> Optional[SyncFence]:
+        for (_, _, fence) in self.in_flight:
+            if fence is not None:
+                return fence
+
+        return None
+
+    def reclaim(self, wait: bool = False) -> None:
+        while len(self.in_flight) != 0:
+            # NOTE: Regions submitted without a fence are done once a later fence signals as the channel executes in order.
+            fence = self.get_oldest_fence()
+
+            if fence is None or not fence.wait(None if wait else 0):
+                break
+
+            while self.in_flight.popleft()[2] is not fence:
+                pass
+
+            # Only block for a single region at a time.
+            wait = False
+
+    def try_allocate(self, size: int) -> Optional[int]:
+        """Same as allocate without blocking, None if no region can be reclaimed yet"""
+
+        size = align_up(size, self.ALIGNMENT)
+
+        assert size <= self.size
+
+        offset = self._try_allocate(size)
+
+        if offset is None:
+            self.reclaim()
+            offset = self._try_allocate(size)
+
+        return offset
+
+    def allocate(self, size: int) -> int:
+        size = align_up(size, self.ALIGNMENT)
+        offset = self.try_allocate(size)
+
+        while offset is None:
+            if self.get_oldest_fence() is None:
+                raise Exception(
+                    "Command buffer ring exhausted by submissions without fence"
+                )
+
+            self.reclaim(True)
+            offset = self._try_allocate(size)
+
+        return offset
+
+    def commit(self, offset: int, size: int, fence: Optional[SyncFence]) -> None:
+        end_offset = offset + align_up(size, self.ALIGNMENT)
+
+        self.in_flight.append((offset, end_offset, fence))
+        self.head = end_offset
+
+    def close(self) -> None:
+        for (_, _, fence) in self.in_flight:
+            if fence is not None:
+                fence.wait()
+
+        self.in_flight.clear()
+        self.gpu_memory.close()
 
 
 class TegraGpuChannel(object):
@@ -415,10 +753,15 @@ class TegraGpuChannel(object):
 
     worktoken: Optional[int]
     object_id: int
+    command_buffer_ring: CommandBufferRing
+    waiting_fence: nvgpu_fence
 
-    def __init__(self, gpfifo_queue_size: int = 0x800) -> None:
+    def __init__(
+        self, gpfifo_queue_size: int = 0x800, command_buffer_ring_size: int = 0x100000
+    ) -> None:
         self.nvhost_gpu_ctrl = NvHostGpuCtrl()
         self.nvmap = NvMap()
+        self.waiting_fence = nvgpu_fence()
 
         self.characteristics = self.nvhost_gpu_ctrl.get_characteristics()
         self.address_space = self.nvhost_gpu_ctrl.allocate_address_space(
@@ -440,6 +783,10 @@ class TegraGpuChannel(object):
             self.characteristics.threed_class, 0
         )
 
+        self.command_buffer_ring = CommandBufferRing(
+            self.create_gpu_memory(command_buffer_ring_size)
+        )
+
         # Finaly bind all channels
         setup_engines_command_buffer = CommandBuffer()
         setup_engines_command_buffer.write_u32(BIND_CHANNEL_3D)
@@ -464,6 +811,7 @@ class TegraGpuChannel(object):
         return self.user_size
 
     def close(self):
+        self.command_buffer_ring.close()
         self.channel.close()
         self.thread_scheduler_group.close()
         self.address_space.close()
@@ -520,50 +868,98 @@ class TegraGpuChannel(object):
             aligned_size,
         )
 
-    def submit_commands(
+    def submit_gpfifo_batch(
         self,
         command_buffers: List[CommandBuffer],
-        external_wait: Optional[SubmittedCommandBuffer] = None,
-    ) -> List[SubmittedCommandBuffer]:
-        command_buffers_gpu_memory: List[GpuMemory] = list()
+        waiting_fence_fd: Optional[int] = None,
+        request_fence: bool = True,
+        ring_offset: Optional[int] = None,
+    ) -> Tuple[List[Optional[GpuMemory]], Optional[SyncFence]]:
+        """ring_offset is a region of the command buffer ring already allocated for the batch"""
+
+        command_buffers_gpu_memory: List[Optional[GpuMemory]] = list()
+        user_queue: List[int] = list()
+
+        ring = self.command_buffer_ring
+        ring_size = CommandBufferRing.get_batch_size(command_buffers)
+        use_ring = ring_size <= ring.size
+
+        if use_ring:
+            if ring_offset is None:
+                ring_offset = ring.allocate(ring_size)
+
+            offset = ring_offset
+
+            for command_buffer in command_buffers:
+                size = len(command_buffer)
+                ring.gpu_memory[offset : offset + size] = command_buffer.buffer
+                user_queue.append(
+                    (ring.gpu_memory.gpu_address + offset) | (size // 4) << 42
+                )
+                command_buffers_gpu_memory.append(None)
+                offset += align_up(size, CommandBufferRing.ALIGNMENT)
+        else:
+            # Too big for the ring, fallback to dedicated allocations.
+            for command_buffer in command_buffers:
+                memory = self.create_gpu_memory(len(command_buffer))
+                memory[0 : len(command_buffer)] = command_buffer.buffer
+                user_queue.append(memory.gpu_address | (memory.user_size // 4) << 42)
+                command_buffers_gpu_memory.append(memory)
+
+        flags = 0
+        waiting_fence = None
 
-        for command_buffer in command_buffers:
-            memory = self.create_gpu_memory(len(command_buffer.buffer))
-            memory[0 : len(command_buffer.buffer)] = command_buffer.buffer
-            command_buffers_gpu_memory.append(memory)
+        if request_fence:
+            flags |= (
+                NVGPU_SUBMIT_GPFIFO_FLAGS_SYNC_FENCE
+                | NVGPU_SUBMIT_GPFIFO_FLAGS_FENCE_GET
+            )
 
-        user_queue: List[c_ulong] = list()
+        if waiting_fence_fd is not None:
+            waiting_fence = self.waiting_fence
+            waiting_fence.id = waiting_fence_fd
 
-        for gpu_memory in command_buffers_gpu_memory:
-            user_queue.append(
-                c_ulong(gpu_memory.gpu_address | (gpu_memory.user_size // 4) << 42)
+            flags |= (
+                NVGPU_SUBMIT_GPFIFO_FLAGS_SYNC_FENCE
+                | NVGPU_SUBMIT_GPFIFO_FLAGS_FENCE_WAIT
             )
 
-        flags = (
-            NVGPU_SUBMIT_GPFIFO_FLAGS_SYNC_FENCE | NVGPU_SUBMIT_GPFIFO_FLAGS_FENCE_GET
-        )
-        waiting_fence = None
+        result = self.channel.submit_gpfifo(user_queue, flags, waiting_fence)
 
-        if external_wait is not None:
-            waiting_fence = nvgpu_fence()
-            waiting_fence.id = external_wait.external_wait_fd
+        fence = None
 
-            flags |= NVGPU_SUBMIT_GPFIFO_FLAGS_FENCE_WAIT
+        if request_fence:
+            assert result is not None
 
-        result = self.channel.submit_gpfifo(user_queue, flags, waiting_fence)
+            fence = SyncFence(result.id)
+
+        if use_ring:
+            assert ring_offset is not None
+
+            ring.commit(ring_offset, ring_size, fence)
+
+        return (command_buffers_gpu_memory, fence)
 
-        assert result is not None
+    def submit_commands(
+        self,
+        command_buffers: List[CommandBuffer],
+        external_wait: Optional[SubmittedCommandBuffer] = None,
+    ) -> List[SubmittedCommandBuffer]:
+        waiting_fence_fd = None
 
-        external_wait_fd = result.id
-        external_wait_poll = poll()
-        external_wait_poll.register(external_wait_fd, POLLOUT | POLLIN)
+        if external_wait is not None:
+            waiting_fence_fd = external_wait.external_wait_fd
+
+        (command_buffers_gpu_memory, fence) = self.submit_gpfifo_batch(
+            command_buffers, waiting_fence_fd
+        )
+
+        assert fence is not None
 
         submitted_command_buffers: List[SubmittedCommandBuffer] = list()
 
         for gpu_memory in command_buffers_gpu_memory:
-            submitted_command_buffers.append(
-                SubmittedCommandBuffer(gpu_memory, external_wait_fd, external_wait_poll)
-            )
+            submitted_command_buffers.append(SubmittedCommandBuffer(gpu_memory, fence))
 
         return submitted_command_buffers
 
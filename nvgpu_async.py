@@ -0,0 +1,93 @@
+import asyncio
+from command_buffer import CommandBuffer
+from nvgpu import CommandBufferRing, SubmittedCommandBuffer, SyncFence, TegraGpuChannel
+from typing import Dict, List, Optional
+
+
+class AsyncTegraGpuChannel(object):
+    """asyncio front-end for TegraGpuChannel, sync fences are watched by the running loop"""
+
+    channel: TegraGpuChannel
+    _fence_futures: Dict[int, "asyncio.Future[SyncFence]"]
+
+    def __init__(self, channel: TegraGpuChannel) -> None:
+        self.channel = channel
+        self._fence_futures = dict()
+
+    def _on_fence_readable(self, fence: SyncFence) -> None:
+        asyncio.get_running_loop().remove_reader(fence.fd)
+        fence.is_signaled = True
+
+        future = self._fence_futures.pop(fence.fd)
+
+        if not future.done():
+            future.set_result(fence)
+
+    async def wait_fence(self, fence: SyncFence) -> SyncFence:
+        if fence.is_signaled or fence.fd == -1:
+            return fence
+
+        # NOTE: A loop only supports one reader per fd, share the future between waiters.
+        future = self._fence_futures.get(fence.fd)
+
+        if future is None:
+            loop = asyncio.get_running_loop()
+            future = loop.create_future()
+            self._fence_futures[fence.fd] = future
+            loop.add_reader(fence.fd, self._on_fence_readable, fence)
+
+        return await asyncio.shield(future)
+
+    async def wait(self, submitted: SubmittedCommandBuffer) -> SubmittedCommandBuffer:
+        await self.wait_fence(submitted.fence)
+
+        return submitted
+
+    async def _reserve_ring(self, command_buffers: List[CommandBuffer]) -> None:
+        ring = self.channel.command_buffer_ring
+        size = CommandBufferRing.get_batch_size(command_buffers)
+
+        # Batches too big for the ring use dedicated memory, nothing to wait for.
+        if size > ring.size:
+            return
+
+        # Wait for room on the loop, so submit_commands doesn't block on a fence.
+        while ring.try_allocate(size) is None:
+            fence = ring.get_oldest_fence()
+
+            if fence is None:
+                raise Exception(
+                    "Command buffer ring exhausted by submissions without fence"
+                )
+
+            await self.wait_fence(fence)
+
+    async def submit_commands(
+        self,
+        command_buffers: List[CommandBuffer],
+        external_wait: Optional[SubmittedCommandBuffer] = None,
+    ) -> List[SubmittedCommandBuffer]:
+        await self._reserve_ring(command_buffers)
+
+        submitted_command_buffers = self.channel.submit_commands(
+            command_buffers, external_wait
+        )
+
+        # All command buffers of a submission share the same fence.
+        await self.wait_fence(submitted_command_buffers[0].fence)
+
+        return submitted_command_buffers
+
+    async def submit(
+        self,
+        command_buffer: CommandBuffer,
+        external_wait: Optional[SubmittedCommandBuffer] = None,
+    ) -> SubmittedCommandBuffer:
+        return (await self.submit_commands([command_buffer], external_wait))[0]
+
+    def close(self) -> None:
+        for (fd, future) in self._fence_futures.items():
+            future.get_loop().remove_reader(fd)
+            future.cancel()
+
+        self._fence_futures.clear()
@@ -0,0 +1,456 @@
+from bisect import bisect_right
+from ctypes import c_ulong, memmove
+from mmap import MAP_SHARED, PROT_READ, PROT_WRITE, mmap
+from nvgpu import IoctlBackend, align_up
+from nvgpu_header import (
+    NVGPU_AS_IOCTL_BIND_CHANNEL,
+    NVGPU_AS_IOCTL_MAP_BUFFER_EX,
+    NVGPU_GPU_GET_CPU_TIME_CORRELATION_INFO_MAX_COUNT,
+    NVGPU_GPU_GET_CPU_TIME_CORRELATION_INFO_SRC_ID_TSC,
+    NVGPU_GPU_IOCTL_ALLOC_AS,
+    NVGPU_GPU_IOCTL_GET_CHARACTERISTICS,
+    NVGPU_GPU_IOCTL_GET_CPU_TIME_CORRELATION_INFO,
+    NVGPU_GPU_IOCTL_OPEN_CHANNEL,
+    NVGPU_GPU_IOCTL_OPEN_TSG,
+    NVGPU_IOCTL_CHANNEL_ALLOC_GPFIFO,
+    NVGPU_IOCTL_CHANNEL_ALLOC_OBJ_CTX,
+    NVGPU_IOCTL_CHANNEL_SET_NVMAP_FD,
+    NVGPU_IOCTL_CHANNEL_SETUP_BIND,
+    NVGPU_IOCTL_CHANNEL_SUBMIT_GPFIFO,
+    NVGPU_SUBMIT_GPFIFO_FLAGS_FENCE_GET,
+    NVGPU_TSG_IOCTL_BIND_CHANNEL,
+    nvgpu_gpu_characteristics,
+)
+from nvmap_header import (
+    NVMAP_IOC_ALLOC,
+    NVMAP_IOC_CACHE_64,
+    NVMAP_IOC_CREATE,
+    NVMAP_IOC_FREE,
+    NVMAP_IOC_GET_FD,
+)
+from typing import Any, Callable, Dict, List, Optional, Tuple
+import errno
+import os
+import time
+
+# GPFIFO entry layout: 40 bits of address followed by the length in words at bit 42.
+GPFIFO_ENTRY_ADDRESS_MASK = (1 << 40) - 4
+GPFIFO_ENTRY_LENGTH_SHIFT = 42
+GPFIFO_ENTRY_LENGTH_MASK = (1 << 21) - 1
+
+
+class EmulatedNvMapHandle(object):
+    size: int
+    memfd: int
+
+    def __init__(self, size: int) -> None:
+        self.size = size
+        self.memfd = os.memfd_create("nvmap", os.MFD_CLOEXEC)
+        os.ftruncate(self.memfd, size)
+
+    def close(self) -> None:
+        os.close(self.memfd)
+
+
+class EmulatedNvMap(object):
+    handles: Dict[int, EmulatedNvMapHandle]
+    handles_by_fd: Dict[int, EmulatedNvMapHandle]
+    next_handle: int
+
+    def __init__(self) -> None:
+        self.handles = dict()
+        self.handles_by_fd = dict()
+        self.next_handle = 1
+
+
+class EmulatedMapping(object):
+    gpu_address: int
+    size: int
+    mapping: mmap
+
+    def __init__(self, gpu_address: int, size: int, mapping: mmap) -> None:
+        self.gpu_address = gpu_address
+        self.size = size
+        self.mapping = mapping
+
+
+class EmulatedAddressSpace(object):
+    BASE_ADDRESS: int = 0x100000000
+
+    next_address: int
+    mappings: List[EmulatedMapping]
+    _mapping_addresses: List[int]
+
+    def __init__(self) -> None:
+        self.next_address = self.BASE_ADDRESS
+        self.mappings = list()
+        self._mapping_addresses = list()
+
+    def map(self, handle: EmulatedNvMapHandle, page_size: int) -> int:
+        page_size = max(page_size, 0x1000)
+        gpu_address = align_up(self.next_address, page_size)
+        size = align_up(handle.size, 0x1000)
+
+        mapping = mmap(handle.memfd, size, MAP_SHARED, PROT_READ | PROT_WRITE)
+
+        self.mappings.append(EmulatedMapping(gpu_address, size, mapping))
+        self._mapping_addresses.append(gpu_address)
+        self.next_address = gpu_address + size
+
+        return gpu_address
+
+    def translate(self, gpu_address: int, size: int) -> Tuple[mmap, int]:
+        index = bisect_right(self._mapping_addresses, gpu_address) - 1
+
+        if index >= 0:
+            mapping = self.mappings[index]
+            offset = gpu_address - mapping.gpu_address
+
+            if offset + size <= mapping.size:
+                return (mapping.mapping, offset)
+
+        raise Exception(f"GPU page fault at 0x{gpu_address:x} (size 0x{size:x})")
+
+    def view(self, gpu_address: int, size: int) -> memoryview:
+        (mapping, offset) = self.translate(gpu_address, size)
+
+        return memoryview(mapping)[offset : offset + size]
+
+    def read(self, gpu_address: int, size: int) -> bytes:
+        (mapping, offset) = self.translate(gpu_address, size)
+
+        return mapping[offset : offset + size]
+
+    def write(self, gpu_address: int, data: bytes) -> None:
+        (mapping, offset) = self.translate(gpu_address, len(data))
+        mapping[offset : offset + len(data)] = data
+
+
+class EmulatedChannel(object):
+    address_space: Optional[EmulatedAddressSpace]
+    object_classes: List[int]
+    submit_count: int
+    entry_count: int
+
+    # Private state of the engine executing this channel.
+    engine_state: Any
+
+    def __init__(self) -> None:
+        self.address_space = None
+        self.object_classes = list()
+        self.submit_count = 0
+        self.entry_count = 0
+        self.engine_state = None
+
+
+class EmulatedEngine(object):
+    """Executes the command buffers of a submission, the default one does nothing"""
+
+    def execute(self, channel: EmulatedChannel, entries: List[Tuple[int, int]]) -> None:
+        pass
+
+
+class EmulatedTsg(object):
+    channels: List[EmulatedChannel]
+
+    def __init__(self) -> None:
+        self.channels = list()
+
+
+class EmulatedGpuCtrl(object):
+    pass
+
+
+class NvGpuEmulator(IoctlBackend):
+    """
+    In-process stand-in for /dev/nvmap and /dev/nvhost-*.
+
+    Device fds are real (they point to /dev/null) so they can be closed like any other fd.
+    nvmap memory is backed by memfds, so mmap works as usual on the dmabuf fds returned by get_fd.
+    Sync fences are the read end of a pipe that gets written once the engine executed the submission.
+    """
+
+    engine: EmulatedEngine
+    characteristics: nvgpu_gpu_characteristics
+    devices: Dict[int, Any]
+    errno: int
+    # (handle, address, size, op) of every accepted NVMAP_IOC_CACHE_64 request.
+    cache_operations: List[Tuple[int, int, int, int]]
+
+    _handlers: Dict[int, Callable[[Any, Any], int]]
+
+    def __init__(self, engine: Optional[EmulatedEngine] = None) -> None:
+        super().__init__()
+
+        if engine is None:
+            engine = EmulatedEngine()
+
+        self.engine = engine
+        self.devices = dict()
+        self.errno = 0
+        self.cache_operations = list()
+
+        # Tegra X1 values.
+        self.characteristics = nvgpu_gpu_characteristics()
+        self.characteristics.arch = 0x120
+        self.characteristics.impl = 0xB
+        self.characteristics.num_gpc = 1
+        self.characteristics.big_page_size = 0x20000
+        self.characteristics.available_big_page_sizes = 0x30000
+        self.characteristics.twod_class = 0x902D
+        self.characteristics.threed_class = 0xB197
+        self.characteristics.compute_class = 0xB1C0
+        self.characteristics.gpfifo_class = 0xB06F
+        self.characteristics.inline_to_memory_class = 0xA140
+        self.characteristics.dma_copy_class = 0xB0B5
+        self.characteristics.sm_arch_sm_version = 0x503
+        self.characteristics.sm_arch_spa_version = 0x503
+        self.characteristics.sm_arch_warp_count = 0x80
+
+        self._handlers = {
+            NVMAP_IOC_CREATE: self._nvmap_create,
+            NVMAP_IOC_GET_FD: self._nvmap_get_fd,
+            NVMAP_IOC_ALLOC: self._nvmap_alloc,
+            NVMAP_IOC_FREE: self._nvmap_free,
+            NVMAP_IOC_CACHE_64: self._nvmap_cache,
+            NVGPU_GPU_IOCTL_GET_CHARACTERISTICS: self._ctrl_get_characteristics,
+            NVGPU_GPU_IOCTL_GET_CPU_TIME_CORRELATION_INFO: self._ctrl_get_cpu_time_correlation_info,
+            NVGPU_GPU_IOCTL_ALLOC_AS: self._ctrl_alloc_as,
+            NVGPU_GPU_IOCTL_OPEN_TSG: self._ctrl_open_tsg,
+            NVGPU_GPU_IOCTL_OPEN_CHANNEL: self._ctrl_open_channel,
+            NVGPU_AS_IOCTL_BIND_CHANNEL: self._as_bind_channel,
+            NVGPU_AS_IOCTL_MAP_BUFFER_EX: self._as_map_buffer_ex,
+            NVGPU_TSG_IOCTL_BIND_CHANNEL: self._tsg_bind_channel,
+            NVGPU_IOCTL_CHANNEL_SET_NVMAP_FD: self._channel_nop,
+            NVGPU_IOCTL_CHANNEL_ALLOC_GPFIFO: self._channel_nop,
+            NVGPU_IOCTL_CHANNEL_SETUP_BIND: self._channel_nop,
+            NVGPU_IOCTL_CHANNEL_ALLOC_OBJ_CTX: self._channel_alloc_obj_ctx,
+            NVGPU_IOCTL_CHANNEL_SUBMIT_GPFIFO: self._channel_submit_gpfifo,
+        }
+
+    def _create_device(self, device: Any) -> int:
+        fd = os.open(os.devnull, os.O_RDWR | os.O_CLOEXEC)
+        self.devices[fd] = device
+
+        return fd
+
+    def open(self, path: str) -> int:
+        name = os.path.basename(path)
+
+        if name == "nvmap":
+            return self._create_device(EmulatedNvMap())
+        elif name == "nvhost-ctrl-gpu":
+            return self._create_device(EmulatedGpuCtrl())
+        elif name == "nvhost-gpu":
+            return self._create_device(EmulatedChannel())
+        elif name == "nvhost-as-gpu":
+            return self._create_device(EmulatedAddressSpace())
+        elif name == "nvhost-tsg-gpu":
+            return self._create_device(EmulatedTsg())
+
+        raise FileNotFoundError(errno.ENOENT, os.strerror(errno.ENOENT), path)
+
+    def close(self, fd: int) -> None:
+        self.devices.pop(fd, None)
+        os.close(fd)
+
+    def ioctl(self, fd: int, request: int, argument: Any) -> int:
+        device = self.devices.get(fd)
+        handler = self._handlers.get(request)
+
+        if device is None:
+            self.errno = errno.EBADF
+        elif handler is None:
+            self.errno = errno.ENOTTY
+        else:
+            self.errno = handler(device, argument)
+
+        if self.errno != 0:
+            return -1
+
+        return 0
+
+    def get_errno(self) -> int:
+        return self.errno
+
+    def _nvmap_create(self, nvmap: EmulatedNvMap, argument: Any) -> int:
+        request = argument.contents.unamed_field0.unamed_field0
+
+        handle_id = nvmap.next_handle
+        nvmap.next_handle += 1
+        nvmap.handles[handle_id] = EmulatedNvMapHandle(request.unamed_field0.size)
+
+        request.handle = handle_id
+
+        return 0
+
+    def _nvmap_get_fd(self, nvmap: EmulatedNvMap, argument: Any) -> int:
+        request = argument.contents.unamed_field0.unamed_field0
+        handle = nvmap.handles.get(request.handle)
+
+        if handle is None:
+            return errno.EINVAL
+
+        fd = os.dup(handle.memfd)
+        nvmap.handles_by_fd[fd] = handle
+        request.unamed_field0.fd = fd
+
+        return 0
+
+    def _nvmap_alloc(self, nvmap: EmulatedNvMap, argument: Any) -> int:
+        if argument.contents.handle not in nvmap.handles:
+            return errno.EINVAL
+
+        return 0
+
+    def _nvmap_cache(self, nvmap: EmulatedNvMap, argument: Any) -> int:
+        # memfd mappings are coherent, only validate and record the request.
+        request = argument.contents
+        handle = nvmap.handles.get(request.handle)
+
+        if handle is None or request.len > handle.size:
+            return errno.EINVAL
+
+        self.cache_operations.append((request.handle, request.addr, request.len, request.op))
+
+        return 0
+
+    def _nvmap_free(self, nvmap: EmulatedNvMap, argument: Any) -> int:
+        handle = nvmap.handles.pop(argument.value, None)
+
+        if handle is None:
+            return errno.EINVAL
+
+        handle.close()
+
+        return 0
+
+    def _ctrl_get_characteristics(self, _: EmulatedGpuCtrl, argument: Any) -> int:
+        request = argument.contents
+        data = bytes(self.characteristics)
+        size = min(request.gpu_characteristics_buf_size, len(data))
+
+        memmove(request.gpu_characteristics_buf_addr, data, size)
+        request.gpu_characteristics_buf_size = len(data)
+
+        return 0
+
+    def _ctrl_get_cpu_time_correlation_info(
+        self, _: EmulatedGpuCtrl, argument: Any
+    ) -> int:
+        request = argument.contents
+
+        if (
+            request.count == 0
+            or request.count > NVGPU_GPU_GET_CPU_TIME_CORRELATION_INFO_MAX_COUNT
+            or request.source_id != NVGPU_GPU_GET_CPU_TIME_CORRELATION_INFO_SRC_ID_TSC
+        ):
+            return errno.EINVAL
+
+        # The emulated GPU clock is the monotonic clock, so is the emulated TSC.
+        for index in range(request.count):
+            timestamp = time.monotonic_ns()
+            request.samples[index].cpu_timestamp = timestamp
+            request.samples[index].gpu_timestamp = timestamp
+
+        return 0
+
+    def _ctrl_alloc_as(self, _: EmulatedGpuCtrl, argument: Any) -> int:
+        argument.contents.as_fd = self._create_device(EmulatedAddressSpace())
+
+        return 0
+
+    def _ctrl_open_tsg(self, _: EmulatedGpuCtrl, argument: Any) -> int:
+        argument.contents.tsg_fd = self._create_device(EmulatedTsg())
+
+        return 0
+
+    def _ctrl_open_channel(self, _: EmulatedGpuCtrl, argument: Any) -> int:
+        argument.contents.unamed_field0.channel_fd = self._create_device(
+            EmulatedChannel()
+        )
+
+        return 0
+
+    def _as_bind_channel(
+        self, address_space: EmulatedAddressSpace, argument: Any
+    ) -> int:
+        channel = self.devices.get(argument.contents.channel_fd)
+
+        if not isinstance(channel, EmulatedChannel):
+            return errno.EINVAL
+
+        channel.address_space = address_space
+
+        return 0
+
+    def _as_map_buffer_ex(
+        self, address_space: EmulatedAddressSpace, argument: Any
+    ) -> int:
+        request = argument.contents
+        handle = None
+
+        for nvmap in self.devices.values():
+            if isinstance(nvmap, EmulatedNvMap):
+                handle = nvmap.handles_by_fd.get(request.dmabuf_fd, handle)
+
+        if handle is None:
+            return errno.EINVAL
+
+        request.offset = address_space.map(handle, request.page_size)
+
+        return 0
+
+    def _tsg_bind_channel(self, tsg: EmulatedTsg, argument: Any) -> int:
+        channel = self.devices.get(argument.contents.value)
+
+        if not isinstance(channel, EmulatedChannel):
+            return errno.EINVAL
+
+        tsg.channels.append(channel)
+
+        return 0
+
+    def _channel_nop(self, _: EmulatedChannel, argument: Any) -> int:
+        return 0
+
+    def _channel_alloc_obj_ctx(self, channel: EmulatedChannel, argument: Any) -> int:
+        request = argument.contents
+
+        channel.object_classes.append(request.class_num)
+        request.obj_id = len(channel.object_classes)
+
+        return 0
+
+    def _channel_submit_gpfifo(self, channel: EmulatedChannel, argument: Any) -> int:
+        request = argument.contents
+
+        if channel.address_space is None:
+            return errno.EINVAL
+
+        raw_entries = (c_ulong * request.num_entries).from_address(request.gpfifo)
+        entries = [
+            (
+                raw_entry & GPFIFO_ENTRY_ADDRESS_MASK,
+                (raw_entry >> GPFIFO_ENTRY_LENGTH_SHIFT) & GPFIFO_ENTRY_LENGTH_MASK,
+            )
+            for raw_entry in raw_entries
+        ]
+
+        # NOTE: The engine runs synchronously, fences we wait on are thus always signaled already.
+        self.engine.execute(channel, entries)
+
+        channel.submit_count += 1
+        channel.entry_count += len(entries)
+
+        if (
+            request.flags & NVGPU_SUBMIT_GPFIFO_FLAGS_FENCE_GET
+        ) == NVGPU_SUBMIT_GPFIFO_FLAGS_FENCE_GET:
+            (read_fd, write_fd) = os.pipe()
+            os.write(write_fd, b"\x01")
+            os.close(write_fd)
+
+            request.fence.id = read_fd
+            request.fence.value = channel.submit_count
+
+        return 0
@@ -0,0 +1,236 @@
+from command_buffer import *
+from maxwell.hw.channel_gpfifo import NVB06F_WFI, NVB06F_WFI_SCOPE, NVB06F_WFI_SCOPE_ALL
+from nvgpu import CommandBufferRing, GpuMemory, SubmittedCommandBuffer, SyncFence, TegraGpuChannel
+from typing import Dict, List, Optional, Tuple
+
+
+def _create_wait_for_idle_command_buffer() -> CommandBuffer:
+    command_buffer = CommandBuffer()
+    command_buffer.write_u32(
+        InlineCommand(
+            NVB06F_WFI,
+            SUBCHANNEL_ID_3D,
+            NVB06F_WFI_SCOPE(NVB06F_WFI_SCOPE_ALL),
+        )
+    )
+
+    return command_buffer
+
+
+# Only ever read, shared by every WFI entry.
+_WAIT_FOR_IDLE_COMMAND_BUFFER = _create_wait_for_idle_command_buffer()
+
+
+class SubmissionNode(object):
+    command_buffer: CommandBuffer
+    dependencies: List["SubmissionNode"]
+    external_waits: List[SubmittedCommandBuffer]
+    signal: bool
+
+    submitted: Optional[SubmittedCommandBuffer]
+
+    def __init__(
+        self,
+        command_buffer: CommandBuffer,
+        dependencies: List["SubmissionNode"],
+        external_waits: List[SubmittedCommandBuffer],
+        signal: bool,
+    ) -> None:
+        self.command_buffer = command_buffer
+        self.dependencies = dependencies
+        self.external_waits = external_waits
+        self.signal = signal
+        self.submitted = None
+
+
+class SubmissionGraph(object):
+    """
+    A DAG of command buffers submitted to a single channel.
+
+    A channel executes its GPFIFO entries in order, so dependencies only need a WFI between nodes.
+    Independent nodes are coalesced in as few submit ioctls as possible and a kernel fence is only
+    requested after nodes marked with signal (and at the end of the graph).
+    """
+
+    nodes: List[SubmissionNode]
+    internal_memories: List[Tuple[GpuMemory, SyncFence]]
+
+    def __init__(self) -> None:
+        self.nodes = list()
+        self.internal_memories = list()
+
+    def add(
+        self,
+        command_buffer: CommandBuffer,
+        dependencies: List[SubmissionNode] = [],
+        external_waits: List[SubmittedCommandBuffer] = [],
+        signal: bool = False,
+    ) -> SubmissionNode:
+        node = SubmissionNode(
+            command_buffer, list(dependencies), list(external_waits), signal
+        )
+        self.nodes.append(node)
+
+        return node
+
+    def _sort(self) -> List[SubmissionNode]:
+        dependent_count: Dict[int, int] = dict()
+        dependents: Dict[int, List[SubmissionNode]] = dict()
+
+        for node in self.nodes:
+            dependent_count[id(node)] = len(node.dependencies)
+
+            for dependency in node.dependencies:
+                dependents.setdefault(id(dependency), list()).append(node)
+
+        # Kahn's algorithm, ready nodes are kept in insertion order.
+        ready = [node for node in self.nodes if dependent_count[id(node)] == 0]
+        result: List[SubmissionNode] = list()
+
+        while len(ready) != 0:
+            # Delay nodes waiting on external fences so they don't split or stall batches.
+            index = next(
+                (
+                    index
+                    for (index, node) in enumerate(ready)
+                    if len(node.external_waits) == 0
+                ),
+                0,
+            )
+            node = ready.pop(index)
+            result.append(node)
+
+            for dependent in dependents.get(id(node), []):
+                dependent_count[id(dependent)] -= 1
+
+                if dependent_count[id(dependent)] == 0:
+                    ready.append(dependent)
+
+        if len(result) != len(self.nodes):
+            raise Exception("Submission graph contains a cycle")
+
+        return result
+
+    def _plan(
+        self,
+    ) -> List[Tuple[List[Optional[SubmissionNode]], List[CommandBuffer], Optional[int], bool]]:
+        # (nodes, command buffers, waiting fence fd, request fence) of each submit ioctl.
+        batches: List[
+            Tuple[List[Optional[SubmissionNode]], List[CommandBuffer], Optional[int], bool]
+        ] = list()
+        batch_nodes: List[Optional[SubmissionNode]] = list()
+        batch_command_buffers: List[CommandBuffer] = list()
+        batch_wait_fd: Optional[int] = None
+
+        def flush(request_fence: bool) -> None:
+            nonlocal batch_nodes, batch_command_buffers, batch_wait_fd
+
+            if len(batch_command_buffers) == 0:
+                return
+
+            batches.append((batch_nodes, batch_command_buffers, batch_wait_fd, request_fence))
+
+            batch_nodes = list()
+            batch_command_buffers = list()
+            batch_wait_fd = None
+
+        for node in self._sort():
+            for (index, external_wait) in enumerate(node.external_waits):
+                # A submit can only wait on one fence, split around extra ones.
+                flush(False)
+
+                batch_wait_fd = external_wait.external_wait_fd
+
+                if index + 1 != len(node.external_waits):
+                    batch_nodes.append(None)
+                    batch_command_buffers.append(_WAIT_FOR_IDLE_COMMAND_BUFFER)
+
+            # The WFI gets its own GPFIFO entry, the command buffer of the node is used as is.
+            if len(node.dependencies) != 0:
+                batch_nodes.append(None)
+                batch_command_buffers.append(_WAIT_FOR_IDLE_COMMAND_BUFFER)
+
+            batch_nodes.append(node)
+            batch_command_buffers.append(node.command_buffer)
+
+            if node.signal:
+                flush(True)
+
+        flush(True)
+
+        return batches
+
+    def reclaim(self, wait: bool = False) -> None:
+        """Release the memory of internal command buffers whose submission completed"""
+
+        pending: List[Tuple[GpuMemory, SyncFence]] = list()
+
+        for (gpu_memory, fence) in self.internal_memories:
+            if fence.wait(None if wait else 0):
+                gpu_memory.close()
+            else:
+                pending.append((gpu_memory, fence))
+
+        self.internal_memories = pending
+
+    def submit(self, channel: TegraGpuChannel) -> List[SubmittedCommandBuffer]:
+        self.reclaim()
+
+        ring = channel.command_buffer_ring
+        batches = self._plan()
+
+        # Nodes (and their memory) still waiting for a fence to be attached.
+        unfenced: List[Tuple[Optional[SubmissionNode], Optional[GpuMemory]]] = list()
+
+        for (index, batch) in enumerate(batches):
+            (batch_nodes, batch_command_buffers, batch_wait_fd, request_fence) = batch
+
+            size = CommandBufferRing.get_batch_size(batch_command_buffers)
+            ring_offset = None
+
+            # Allocate the region here so the batch is submitted at the offset checked below.
+            if size <= ring.size:
+                ring_offset = ring.allocate(size)
+
+            if not request_fence:
+                # Unfenced ring regions can't be reclaimed, ask for a fence before the next batch
+                # would exhaust the ring instead of failing in the middle of the graph.
+                next_size = CommandBufferRing.get_batch_size(batches[index + 1][1])
+                pending = None
+
+                if ring_offset is not None:
+                    pending = (ring_offset, size)
+
+                if next_size <= ring.size and not ring.can_allocate_without_fence(
+                    next_size, pending
+                ):
+                    request_fence = True
+
+            (gpu_memories, fence) = channel.submit_gpfifo_batch(
+                batch_command_buffers, batch_wait_fd, request_fence, ring_offset
+            )
+
+            unfenced.extend(zip(batch_nodes, gpu_memories))
+
+            if fence is not None:
+                # Every unfenced node completes when this fence signals.
+                for (node, gpu_memory) in unfenced:
+                    if node is not None:
+                        node.submitted = SubmittedCommandBuffer(gpu_memory, fence)
+                    elif gpu_memory is not None:
+                        # WFI entries belong to no node, release them ourselves if they aren't in the ring.
+                        self.internal_memories.append((gpu_memory, fence))
+
+                unfenced.clear()
+
+        result: List[SubmittedCommandBuffer] = list()
+
+        for node in self.nodes:
+            assert node.submitted is not None
+
+            result.append(node.submitted)
+
+        return result
+
+    def close(self) -> None:
+        self.reclaim(True)
@@ -0,0 +1,34 @@
+import os
+import sys
+
+# Modules of the repository are imported from its root, like the rest of the tree does.
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+
+
+@pytest.fixture
+def simulator():
+    from maxwell.pushbuffer_simulator import PushbufferSimulator
+    from nvgpu_emulator import NvGpuEmulator
+
+    import nvgpu
+
+    simulator = PushbufferSimulator()
+    previous_backend = nvgpu.get_ioctl_backend()
+    nvgpu.set_ioctl_backend(NvGpuEmulator(simulator))
+
+    yield simulator
+
+    nvgpu.set_ioctl_backend(previous_backend)
+
+
+@pytest.fixture
+def channel(simulator):
+    from nvgpu import TegraGpuChannel
+
+    channel = TegraGpuChannel()
+
+    yield channel
+
+    channel.close()
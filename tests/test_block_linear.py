@@ -0,0 +1,202 @@
+from maxwell.block_linear import *
+from maxwell.hw.dma_copy_a import (
+    NVB0B5_SET_DST_BLOCK_SIZE_DEPTH,
+    NVB0B5_SET_DST_BLOCK_SIZE_HEIGHT,
+)
+
+import numpy as np
+import os
+import pytest
+
+MEMORY_SIZE = 0x40000
+
+
+@pytest.fixture
+def memory(channel):
+    memory = channel.create_gpu_memory(MEMORY_SIZE)
+
+    yield memory
+
+    memory.close()
+
+
+def _get_offset(
+    width: int,
+    height: int,
+    block_height_log2: int,
+    block_depth_log2: int,
+    x: int,
+    y: int,
+    z: int,
+) -> int:
+    # Reference walk of the layout: blocks of GOBs, GOBs of 64 bytes by 8 rows.
+    block_height = GOB_HEIGHT << block_height_log2
+    block_depth = 1 << block_depth_log2
+    gob_size_in_block = GOB_SIZE << block_height_log2
+    block_size = gob_size_in_block << block_depth_log2
+    width_in_gobs = (width + GOB_WIDTH - 1) // GOB_WIDTH
+    height_in_blocks = (height + block_height - 1) // block_height
+
+    block_index = (
+        (z // block_depth) * height_in_blocks + y // block_height
+    ) * width_in_gobs + x // GOB_WIDTH
+    gob_offset = (
+        (z % block_depth) * gob_size_in_block
+        + ((y % block_height) // GOB_HEIGHT) * GOB_SIZE
+    )
+    byte_offset = (
+        ((x % 64) // 32) * 256
+        + ((y % 8) // 2) * 64
+        + ((x % 32) // 16) * 32
+        + (y % 2) * 16
+        + x % 16
+    )
+
+    return block_index * block_size + gob_offset + byte_offset
+
+
+def _create_image(
+    gpu_address: int,
+    horizontal: int,
+    vertical: int,
+    depth: int,
+    bytes_per_block: int,
+    block_height_log2: int,
+    block_depth_log2: int,
+    layer_stride: int = 0,
+) -> ImageInfo:
+    image = ImageInfo()
+    image.gpu_address = gpu_address
+    image.horizontal = horizontal
+    image.vertical = vertical
+    image.depth = depth
+    image.tile_mode = NVB0B5_SET_DST_BLOCK_SIZE_HEIGHT(
+        block_height_log2
+    ) | NVB0B5_SET_DST_BLOCK_SIZE_DEPTH(block_depth_log2)
+    image.layer_stride = layer_stride
+    image.width_ms = horizontal
+    image.height_ms = vertical
+    image.bytes_per_block = bytes_per_block
+    image.is_linear = False
+    image.is_layered = layer_stride != 0
+
+    return image
+
+
+@pytest.mark.parametrize(
+    ("x", "y", "expected"),
+    [
+        (0, 0, 0),
+        (15, 0, 15),
+        (16, 0, 32),
+        (0, 1, 16),
+        (0, 2, 64),
+        (32, 0, 256),
+        (63, 7, GOB_SIZE - 1),
+        (64, 0, GOB_SIZE),
+    ],
+)
+def test_gob_offsets(x, y, expected):
+    offsets = get_block_linear_offsets(128, 8, 0, 0, np.array([x]), np.array([y]), 0)
+
+    assert offsets[0, 0] == expected
+
+
+@pytest.mark.parametrize(
+    ("width", "height", "depth", "block_height_log2", "block_depth_log2"),
+    [
+        (64, 8, 1, 0, 0),
+        (200, 40, 1, 1, 0),
+        (96, 70, 3, 2, 1),
+        (256, 16, 5, 0, 2),
+    ],
+)
+def test_block_linear_offsets_match_reference(
+    width, height, depth, block_height_log2, block_depth_log2
+):
+    x = np.arange(width)
+    y = np.arange(height)
+
+    for z in range(depth):
+        offsets = get_block_linear_offsets(
+            width, height, block_height_log2, block_depth_log2, x, y, z
+        )
+
+        for (sample_x, sample_y) in [
+            (0, 0),
+            (width - 1, 0),
+            (0, height - 1),
+            (width - 1, height - 1),
+            (width // 3, height // 2),
+            (17, 9 % height),
+        ]:
+            assert offsets[sample_y, sample_x] == _get_offset(
+                width,
+                height,
+                block_height_log2,
+                block_depth_log2,
+                sample_x,
+                sample_y,
+                z,
+            )
+
+        # Every byte of the surface is hit at most once and fits in its size.
+        assert len(np.unique(offsets)) == width * height
+        assert offsets.max() < get_block_linear_size(
+            width, height, depth, block_height_log2, block_depth_log2
+        )
+
+
+@pytest.mark.parametrize(
+    ("horizontal", "vertical", "depth", "bytes_per_block", "block_height_log2", "block_depth_log2"),
+    [
+        # Sector aligned rows.
+        (16, 8, 1, 4, 0, 0),
+        (50, 37, 1, 4, 2, 0),
+        # Rows that aren't a whole number of sectors.
+        (13, 11, 1, 1, 1, 0),
+        (7, 20, 3, 3, 1, 1),
+    ],
+)
+def test_swizzle_round_trip(
+    memory, horizontal, vertical, depth, bytes_per_block, block_height_log2, block_depth_log2
+):
+    image = _create_image(
+        memory.gpu_address,
+        horizontal,
+        vertical,
+        depth,
+        bytes_per_block,
+        block_height_log2,
+        block_depth_log2,
+    )
+    row_size = horizontal * bytes_per_block
+    data = os.urandom(depth * vertical * row_size)
+
+    swizzle_image(image, memory, data)
+
+    assert deswizzle_image(image, memory).tobytes() == data
+
+    # Spot check the placement against the reference layout.
+    swizzled = memory[0 : get_image_size(image)]
+
+    for (x, y, z) in [(0, 0, 0), (row_size - 1, vertical - 1, depth - 1), (row_size // 2, vertical // 2, 0)]:
+        assert swizzled[
+            _get_offset(row_size, vertical, block_height_log2, block_depth_log2, x, y, z)
+        ] == data[(z * vertical + y) * row_size + x]
+
+
+def test_swizzle_layers(memory):
+    layer_stride = 0x4000
+    image = _create_image(memory.gpu_address + 0x100, 32, 16, 1, 4, 1, 0, layer_stride)
+    layers = [os.urandom(32 * 16 * 4) for _ in range(3)]
+
+    for (layer, data) in enumerate(layers):
+        swizzle_image(image, memory, data, layer)
+
+    for (layer, data) in enumerate(layers):
+        assert deswizzle_image(image, memory, layer).tobytes() == data
+
+    offset = 0x100 + layer_stride
+
+    assert memory[offset : offset + 16] == layers[1][0:16]
@@ -0,0 +1,126 @@
+from command_buffer import *
+import command_buffer
+from maxwell.hw.channel_gpfifo import (
+    NVB06F_DMA_IMMD_DATA,
+    NVB06F_DMA_METHOD_ADDRESS,
+    NVB06F_DMA_METHOD_COUNT,
+    NVB06F_DMA_METHOD_SUBCHANNEL,
+    NVB06F_DMA_SEC_OP,
+)
+
+import numpy as np
+import pytest
+import random
+
+SUBMISSION_MODES = [
+    COMMAND_SUBMISSION_MODE_INCREASING,
+    COMMAND_SUBMISSION_MODE_NON_INCREASING,
+    COMMAND_SUBMISSION_MODE_INLINE,
+    COMMAND_SUBMISSION_MODE_INCREASING_ONCE,
+]
+
+
+def _random_fields(rng: random.Random, count: int):
+    return [
+        (
+            rng.randrange(0, 0x1000) << 2,
+            rng.randrange(0, 8),
+            # Bias towards the edges of the count field.
+            rng.choice([0, 1, 0xFFF, 0x1000, 0x1FFF, rng.randrange(0, 0x2000)]),
+            rng.choice(SUBMISSION_MODES),
+        )
+        for _ in range(count)
+    ]
+
+
+def _reference_encode(method: int, subchannel: int, argument: int, mode: int) -> int:
+    return (
+        NVB06F_DMA_METHOD_ADDRESS(method >> 2)
+        | NVB06F_DMA_METHOD_SUBCHANNEL(subchannel)
+        | NVB06F_DMA_METHOD_COUNT(argument)
+        | NVB06F_DMA_SEC_OP(mode)
+    )
+
+
+def _get_field(encoder) -> tuple:
+    # Recover (offset, mask) from a generated set_bits helper.
+    shifted_mask = encoder(0xFFFFFFFF)
+    offset = (shifted_mask & -shifted_mask).bit_length() - 1
+
+    return (offset, shifted_mask >> offset)
+
+
+@pytest.mark.parametrize(
+    ("name", "encoder"),
+    [
+        ("METHOD", NVB06F_DMA_METHOD_ADDRESS),
+        ("SUBCHANNEL", NVB06F_DMA_METHOD_SUBCHANNEL),
+        ("ARGUMENT", NVB06F_DMA_METHOD_COUNT),
+        ("SUBMISSION_MODE", NVB06F_DMA_SEC_OP),
+    ],
+)
+def test_field_matches_host_class(name, encoder):
+    assert (
+        getattr(command_buffer, f"_{name}_OFFSET"),
+        getattr(command_buffer, f"_{name}_MASK"),
+    ) == _get_field(encoder)
+
+
+def test_inline_argument_matches_host_class():
+    assert command_buffer._INLINE_ARGUMENT_MAX == _get_field(NVB06F_DMA_IMMD_DATA)[1]
+    assert MAX_COMMAND_ARGUMENT_COUNT == _get_field(NVB06F_DMA_METHOD_COUNT)[1]
+
+
+def test_command_round_trip():
+    rng = random.Random(0x4E56)
+
+    for (method, subchannel, argument, mode) in _random_fields(rng, 20000):
+        header = Command(method, subchannel, argument, mode)
+
+        assert header == _reference_encode(method, subchannel, argument, mode)
+        assert DecodeCommand(header) == (method, subchannel, argument, mode)
+
+
+def test_raw_method_round_trip():
+    rng = random.Random(0xB06F)
+
+    for (method, subchannel, argument, mode) in _random_fields(rng, 1000):
+        assert Command(method >> 2, subchannel, argument, mode, True) == Command(
+            method, subchannel, argument, mode
+        )
+
+
+def test_large_count_is_not_truncated():
+    assert DecodeCommand(NonIncrCommand(0x1B0, 1, 4096)) == (
+        0x1B0,
+        1,
+        4096,
+        COMMAND_SUBMISSION_MODE_NON_INCREASING,
+    )
+
+
+def test_out_of_range_fields_are_rejected():
+    with pytest.raises(AssertionError):
+        NonIncrCommand(0x1B0, 1, 0x2000)
+
+    with pytest.raises(AssertionError):
+        IncrCommand(0x4000, 1, 1)
+
+
+def test_encode_commands_matches_command():
+    rng = random.Random(0xC0DE)
+    fields = _random_fields(rng, 5000)
+    (methods, subchannels, arguments, modes) = zip(*fields)
+
+    encoded = EncodeCommands(methods, subchannels, arguments, modes)
+
+    assert encoded.dtype == np.uint32
+    assert encoded.tolist() == [Command(*entry) for entry in fields]
+    assert EncodeCommands(
+        np.asarray(methods) >> 2, subchannels, arguments, modes, True
+    ).tolist() == encoded.tolist()
+
+
+def test_encode_commands_rejects_large_count():
+    with pytest.raises(AssertionError):
+        EncodeCommands([0x1B0], [1], [0x2000], [COMMAND_SUBMISSION_MODE_INCREASING])
@@ -0,0 +1,73 @@
+from command_buffer import *
+from maxwell.command_buffer_decoder import decode_command_buffer, get_method_name
+from maxwell.hw.channel_gpfifo import NVB06F_SET_REFERENCE, NVB06F_WFI
+from maxwell.hw.compute_b import NVB1C0_LAUNCH_DMA, NVB1C0_LOAD_INLINE_DATA
+from maxwell.hw.dma_copy_a import NVB0B5_OFFSET_IN_UPPER
+
+import pytest
+
+
+def test_decode_all_counted_modes():
+    command_buffer = CommandBuffer()
+    command_buffer.write_method(NVB0B5_OFFSET_IN_UPPER, SUBCHANNEL_ID_DMA, [1, 2, 3, 4])
+    command_buffer.write_u32(InlineCommand(NVB06F_WFI, SUBCHANNEL_ID_3D, 1))
+    command_buffer.write_u32(NonIncrCommand(NVB1C0_LOAD_INLINE_DATA, SUBCHANNEL_ID_COMPUTE, 2))
+    command_buffer.write_u32(5)
+    command_buffer.write_u32(6)
+    command_buffer.write_u32(
+        Command(NVB1C0_LAUNCH_DMA, SUBCHANNEL_ID_COMPUTE, 3, COMMAND_SUBMISSION_MODE_INCREASING_ONCE)
+    )
+    command_buffer.write_u32(7)
+    command_buffer.write_u32(8)
+    command_buffer.write_u32(9)
+
+    commands = list(decode_command_buffer(command_buffer))
+
+    assert [command.method_name for command in commands] == [
+        "NVB0B5_OFFSET_IN_UPPER",
+        "NVB06F_WFI",
+        "NVB1C0_LOAD_INLINE_DATA",
+        "NVB1C0_LAUNCH_DMA",
+    ]
+    assert [list(command.arguments) for command in commands] == [[1, 2, 3, 4], [1], [5, 6], [7, 8, 9]]
+    assert list(commands[0].method_writes()) == [
+        (NVB0B5_OFFSET_IN_UPPER + index * 4, index + 1) for index in range(4)
+    ]
+    assert list(commands[2].method_writes()) == [
+        (NVB1C0_LOAD_INLINE_DATA, 5),
+        (NVB1C0_LOAD_INLINE_DATA, 6),
+    ]
+    assert list(commands[3].method_writes()) == [
+        (NVB1C0_LAUNCH_DMA, 7),
+        (NVB1C0_LAUNCH_DMA + 4, 8),
+        (NVB1C0_LAUNCH_DMA + 4, 9),
+    ]
+
+
+@pytest.mark.parametrize(
+    "submission_mode",
+    [COMMAND_SUBMISSION_MODE_INCREASING_OLD, COMMAND_SUBMISSION_MODE_NON_INCREASING_OLD, 6, 7],
+)
+def test_decode_rejects_unsupported_submission_modes(submission_mode):
+    command_buffer = CommandBuffer()
+    command_buffer.write_u32(InlineCommand(NVB06F_WFI, SUBCHANNEL_ID_3D, 0))
+    command_buffer.write_u32(Command(NVB06F_SET_REFERENCE, 0, 1, submission_mode))
+    command_buffer.write_u32(0)
+
+    with pytest.raises(ValueError, match="Unsupported submission mode .* at offset 0x4"):
+        list(decode_command_buffer(command_buffer))
+
+
+def test_decode_truncated_command_buffer():
+    command_buffer = CommandBuffer()
+    command_buffer.write_u32(IncrCommand(NVB0B5_OFFSET_IN_UPPER, SUBCHANNEL_ID_DMA, 4))
+    command_buffer.write_u32(0)
+
+    with pytest.raises(ValueError, match="Truncated command buffer"):
+        list(decode_command_buffer(command_buffer))
+
+
+def test_get_method_name():
+    assert get_method_name(SUBCHANNEL_ID_COMPUTE, NVB06F_WFI) == "NVB06F_WFI"
+    assert get_method_name(SUBCHANNEL_ID_DMA, NVB0B5_OFFSET_IN_UPPER) == "NVB0B5_OFFSET_IN_UPPER"
+    assert get_method_name(SUBCHANNEL_ID_3D, 0x1234) == "UNKNOWN_0x1234"
@@ -0,0 +1,282 @@
+from command_buffer import CommandBuffer, DecodeCommand, MAX_COMMAND_ARGUMENT_COUNT
+from maxwell.compute_engine import *
+
+import os
+import pytest
+import typing
+
+MEMORY_SIZE = 0x40000
+
+
+@pytest.fixture
+def memory(channel):
+    memory = channel.create_gpu_memory(MEMORY_SIZE)
+
+    yield memory
+
+    memory.close()
+
+
+def _run(channel, command_buffer: CommandBuffer) -> None:
+    submitted = channel.submit_command(command_buffer)
+    submitted.wait()
+    submitted.close()
+
+
+@pytest.mark.parametrize(
+    "size",
+    [
+        1,
+        100,
+        16380,
+        16384,
+        20000,
+        MAX_COMMAND_ARGUMENT_COUNT * 4,
+        MAX_COMMAND_ARGUMENT_COUNT * 4 + 1,
+        0x8000,
+        70001,
+    ],
+)
+def test_memcpy_inline_host_to_device(channel, simulator, memory, size):
+    data = os.urandom(size)
+    offset = 0x100
+
+    command_buffer = CommandBuffer()
+    memcpy_inline_host_to_device(command_buffer, memory.gpu_address + offset, data)
+    _run(channel, command_buffer)
+
+    assert memory[offset : offset + size] == data
+    assert memory[offset + size : offset + size + 1] == b"\0"
+    assert simulator.statistics.inline_bytes == size
+
+
+def test_memcpy_inline_host_to_device_header_counts():
+    command_buffer = CommandBuffer()
+    memcpy_inline_host_to_device(command_buffer, 0x100000, bytes(0x10000))
+
+    words = memoryview(command_buffer.buffer).cast("I")
+    index = 0
+    inline_data_count = 0
+
+    while index < len(words):
+        (method, _, argument, _) = DecodeCommand(words[index])
+
+        if method == NVB1C0_LOAD_INLINE_DATA:
+            inline_data_count += 1
+            assert argument <= MAX_COMMAND_ARGUMENT_COUNT
+
+        index += 1 + argument
+
+    assert inline_data_count == 3
+
+
+@pytest.mark.parametrize("job_count", [1, 63, 64, 70, 200])
+def test_execute_jobs(channel, simulator, memory, job_count):
+    template = QmdTemplate(create_qmdv0107())
+    jobs = [template.create_dispatch((index + 1, 1, 1)) for index in range(job_count)]
+
+    command_buffer = CommandBuffer()
+    execute_jobs(command_buffer, memory.gpu_address, jobs)
+    _run(channel, command_buffer)
+
+    assert len(simulator.dispatches) == job_count
+
+    for (index, (qmd_address, qmd)) in enumerate(simulator.dispatches):
+        assert qmd_address == memory.gpu_address + index * QMD_SIZE
+        assert bytes(qmd) == bytes(jobs[index])
+
+
+def test_launch_jobs_from_reused_arena(channel, simulator, memory):
+    template = QmdTemplate(create_qmdv0107())
+
+    # The second pass overwrites the QMDs of the first one while they are still cached.
+    for width in [1, 100]:
+        jobs = [template.create_dispatch((width + index, 1, 1)) for index in range(3)]
+        jobs_address = write_jobs(memory, 0, jobs)
+
+        command_buffer = CommandBuffer()
+        launch_jobs(command_buffer, jobs_address, len(jobs))
+        _run(channel, command_buffer)
+
+        assert [bytes(qmd) for (_, qmd) in simulator.dispatches[-3:]] == [
+            bytes(job) for job in jobs
+        ]
+
+
+def _get_dispatch_raster_size(qmd: bytes) -> typing.Tuple[int, int, int]:
+    job = qmdv0107.from_buffer_copy(qmd)
+
+    return (job.cta_raster_width, job.cta_raster_height, job.cta_raster_depth)
+
+
+def test_resident_qmd_indirect_raster_size(channel, simulator, memory):
+    job = create_qmdv0107()
+    job.cta_raster_width = 1
+    job.cta_raster_height = 1
+    job.cta_raster_depth = 1
+
+    resident_qmd = ResidentQmd(memory, 0, job)
+    records_offset = 0x1000
+    memory.write(
+        records_offset, pack_cta_raster_size(7, 3, 2) + pack_cta_raster_size(40, 5, 1)
+    )
+
+    command_buffer = CommandBuffer()
+    resident_qmd.launch(command_buffer)
+    _run(channel, command_buffer)
+
+    # The QMD is cached by now, the updates must be fetched again for every launch.
+    for (index, expected) in enumerate([(7, 3, 2), (40, 5, 1)]):
+        command_buffer = CommandBuffer()
+        resident_qmd.set_cta_raster_size_indirect(
+            command_buffer, memory.gpu_address + records_offset + index * 8
+        )
+        resident_qmd.launch(command_buffer)
+        _run(channel, command_buffer)
+
+        assert _get_dispatch_raster_size(simulator.dispatches[-1][1]) == expected
+
+    command_buffer = CommandBuffer()
+    resident_qmd.set_cta_raster_size(command_buffer, 9)
+    resident_qmd.launch(command_buffer)
+    resident_qmd.launch(command_buffer)
+    _run(channel, command_buffer)
+
+    assert [_get_dispatch_raster_size(qmd) for (_, qmd) in simulator.dispatches] == [
+        (1, 1, 1),
+        (7, 3, 2),
+        (40, 5, 1),
+        (9, 1, 1),
+        (9, 1, 1),
+    ]
+
+
+def test_resident_qmd_indirect_launch_waits_for_the_copy(memory):
+    from maxwell.command_buffer_decoder import decode_command_buffer
+
+    resident_qmd = ResidentQmd(memory, 0, create_qmdv0107())
+
+    command_buffer = CommandBuffer()
+    resident_qmd.set_cta_raster_size_indirect(command_buffer, memory.gpu_address + 0x1000)
+    resident_qmd.launch(command_buffer)
+
+    names = [command.method_name for command in decode_command_buffer(command_buffer)]
+
+    # Copy, release of the copy engine, host acquire then launch.
+    assert names.index("NVB0B5_SET_SEMAPHORE_A") > names.index("NVB0B5_OFFSET_IN_UPPER")
+    assert names.index("NVB06F_SEMAPHOREA") > names.index("NVB0B5_SET_SEMAPHORE_A")
+    assert names.index("NVB1C0_SEND_PCAS_A") > names.index("NVB06F_SEMAPHOREA")
+    assert "NVB06F_WFI" not in names
+
+
+def _create_fence(signaled: bool):
+    from nvgpu import SyncFence
+
+    (read_fd, write_fd) = os.pipe()
+
+    if signaled:
+        os.write(write_fd, b"\0")
+
+    return (SyncFence(read_fd), write_fd)
+
+
+def _count_methods(command_buffer: CommandBuffer, expected_method: int) -> int:
+    from command_buffer import COMMAND_SUBMISSION_MODE_INLINE
+
+    words = memoryview(command_buffer.buffer).cast("I")
+    index = 0
+    count = 0
+
+    while index < len(words):
+        (method, _, argument, submission_mode) = DecodeCommand(words[index])
+
+        if method == expected_method:
+            count += 1
+
+        index += 1 if submission_mode == COMMAND_SUBMISSION_MODE_INLINE else 1 + argument
+
+    return count
+
+
+@pytest.fixture
+def constant_buffer_ring(channel):
+    ring = ConstantBufferRing(channel.create_gpu_memory(0x1000))
+
+    yield ring
+
+    ring.in_flight.clear()
+    ring.close()
+
+
+def test_constant_buffer_ring_attach_fence_records_pushed_range(constant_buffer_ring):
+    ring = constant_buffer_ring
+    command_buffer = CommandBuffer()
+
+    for _ in range(3):
+        ring.push(command_buffer, bytes(0x80))
+
+    (fence, write_fd) = _create_fence(False)
+    ring.attach_fence(fence)
+
+    assert list(ring.in_flight) == [(0, 0x300, fence)]
+
+    # Nothing pushed since, there is nothing for a new fence to protect.
+    (other_fence, other_write_fd) = _create_fence(False)
+    ring.attach_fence(other_fence)
+
+    assert list(ring.in_flight) == [(0, 0x300, fence)]
+
+    for write_fd in [write_fd, other_write_fd]:
+        os.write(write_fd, b"\0")
+        os.close(write_fd)
+
+
+def test_constant_buffer_ring_fence_without_slices_does_not_fill_the_ring(constant_buffer_ring):
+    ring = constant_buffer_ring
+    command_buffer = CommandBuffer()
+
+    for _ in range(ring.size // ring.ALIGNMENT):
+        ring.push(command_buffer, bytes(0x10))
+
+    (signaled_fence, signaled_write_fd) = _create_fence(True)
+    ring.attach_fence(signaled_fence)
+
+    (pending_fence, pending_write_fd) = _create_fence(False)
+    ring.attach_fence(pending_fence)
+
+    # Only the signaled fence covers slices, the ring must be free without waiting.
+    assert ring.try_allocate(0x100) == 0
+
+    for write_fd in [signaled_write_fd, pending_write_fd]:
+        os.write(write_fd, b"\0")
+        os.close(write_fd)
+
+
+def test_constant_buffer_ring_invalidates_once_per_pass(constant_buffer_ring):
+    ring = constant_buffer_ring
+    write_fds = list()
+    slices_per_pass = ring.size // ring.ALIGNMENT
+
+    command_buffer = CommandBuffer()
+
+    for _ in range(slices_per_pass):
+        ring.push(command_buffer, bytes(0x100))
+
+    # The first pass only uses fresh memory.
+    assert _count_methods(command_buffer, NVB1C0_INVALIDATE_SHADER_CACHES_NO_WFI) == 0
+
+    for pass_index in range(3):
+        command_buffer = CommandBuffer()
+
+        for _ in range(slices_per_pass):
+            # One submission per slice, every one of them already done.
+            (fence, write_fd) = _create_fence(True)
+            ring.attach_fence(fence)
+            write_fds.append(write_fd)
+
+            ring.push(command_buffer, bytes(0x100))
+
+        assert _count_methods(command_buffer, NVB1C0_INVALIDATE_SHADER_CACHES_NO_WFI) == 1
+
+    for write_fd in write_fds:
+        os.close(write_fd)
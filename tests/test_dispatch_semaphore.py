@@ -0,0 +1,184 @@
+from array import array
+from command_buffer import CommandBuffer
+from maxwell.compute_engine import QmdTemplate, create_qmdv0107, execute_job, execute_jobs
+from maxwell.dispatch_semaphore import *
+from maxwell.dispatch_semaphore import _POLL_MAX_INTERVAL
+
+import maxwell.dispatch_semaphore
+import pytest
+import threading
+import time
+
+
+@pytest.fixture
+def pool(channel):
+    memory = channel.create_gpu_memory(0x1000)
+    memory[0 : memory.gpu_memory_size] = bytes(memory.gpu_memory_size)
+
+    yield DispatchSemaphorePool(memory)
+
+    memory.close()
+
+
+def _run(channel, command_buffer: CommandBuffer) -> None:
+    submitted = channel.submit_command(command_buffer)
+    submitted.wait()
+    submitted.close()
+
+
+def _release(pool: DispatchSemaphorePool, semaphore: DispatchSemaphore, payload: int) -> None:
+    pool.memory[semaphore.offset : semaphore.offset + 4] = array("I", [payload]).tobytes()
+
+
+def test_slots_are_recycled_with_new_payloads(pool):
+    first = pool.allocate()
+    second = pool.allocate()
+
+    assert first.offset != second.offset
+    assert second.payload > first.payload
+
+    offset = first.offset
+    first.close()
+    first.close()
+
+    assert first.pool is None
+    assert pool.free_offsets.count(offset) == 1
+
+    third = pool.allocate()
+
+    assert third.offset == offset
+    assert third.payload > second.payload
+
+    for semaphore in [second, third]:
+        semaphore.close()
+
+
+def test_stale_payload_is_skipped(pool):
+    semaphore = pool.allocate()
+    _release(pool, semaphore, semaphore.payload)
+    semaphore.close()
+
+    # The slot still holds the release of its previous user, make it match the next payload.
+    _release(pool, semaphore, pool.next_payload)
+    stale_payload = pool.next_payload
+
+    recycled = pool.allocate()
+
+    assert recycled.offset == semaphore.offset
+    assert recycled.payload == stale_payload + 1
+    assert not recycled.is_signaled
+
+    recycled.close()
+
+
+def test_payload_wraps_around_without_zero(pool):
+    pool.next_payload = 0xFFFFFFFF
+
+    first = pool.allocate()
+    second = pool.allocate()
+
+    assert first.payload == 0xFFFFFFFF
+    assert second.payload == 1
+
+    # Fresh slots are zeroed, a zero payload would read as already released.
+    pool.next_payload = 0
+    third = pool.allocate()
+
+    assert third.payload == 1
+
+    for semaphore in [first, second, third]:
+        semaphore.close()
+
+
+def test_pool_exhaustion(pool):
+    slot_count = pool.memory.gpu_memory_size // pool.SLOT_SIZE
+    semaphores = [pool.allocate() for _ in range(slot_count)]
+
+    assert len({semaphore.offset for semaphore in semaphores}) == len(semaphores)
+
+    with pytest.raises(Exception, match="exhausted"):
+        pool.allocate()
+
+    semaphores.pop().close()
+    pool.allocate().close()
+
+    for semaphore in semaphores:
+        semaphore.close()
+
+
+def test_wait_timeout(pool):
+    semaphore = pool.allocate()
+
+    start = time.monotonic()
+
+    assert not semaphore.wait(0.01)
+    assert time.monotonic() - start >= 0.01
+    assert not semaphore.wait(0)
+
+    semaphore.close()
+
+
+def test_wait_backs_off(pool, monkeypatch):
+    semaphore = pool.allocate()
+    intervals = list()
+
+    def sleep(interval: float) -> None:
+        intervals.append(interval)
+
+        # Release after the back off reached its maximum interval for a while.
+        if intervals.count(_POLL_MAX_INTERVAL) == 3:
+            _release(pool, semaphore, semaphore.payload)
+
+    monkeypatch.setattr(maxwell.dispatch_semaphore.time, "sleep", sleep)
+
+    assert semaphore.wait()
+    assert intervals == sorted(intervals)
+    assert intervals[0] < _POLL_MAX_INTERVAL
+    assert all(
+        current == min(previous * 2, _POLL_MAX_INTERVAL)
+        for (previous, current) in zip(intervals, intervals[1:])
+    )
+
+    semaphore.close()
+
+
+def test_wait_returns_once_released(pool):
+    semaphore = pool.allocate()
+    releaser = threading.Timer(0.005, _release, (pool, semaphore, semaphore.payload))
+    releaser.start()
+
+    try:
+        assert semaphore.wait(5)
+        assert semaphore.is_signaled
+    finally:
+        releaser.join()
+
+    semaphore.close()
+
+
+def test_dispatch_releases_semaphores(channel, pool):
+    job = create_qmdv0107()
+    first = pool.bind(job, 0)
+    second = pool.bind(job, 1)
+
+    template = QmdTemplate(create_qmdv0107())
+    qmd = template.create()
+    template.set_cta_raster_size(qmd, 1)
+    third = pool.bind_dispatch(template, qmd)
+
+    memory = channel.create_gpu_memory(0x1000)
+
+    try:
+        command_buffer = CommandBuffer()
+        execute_job(command_buffer, memory.gpu_address, bytearray(job))
+
+        assert not first.is_signaled
+
+        execute_jobs(command_buffer, memory.gpu_address + 0x100, [qmd])
+        _run(channel, command_buffer)
+    finally:
+        memory.close()
+
+    for semaphore in [first, second, third]:
+        assert semaphore.wait(0)
+        semaphore.close()
@@ -0,0 +1,191 @@
+from command_buffer import CommandBuffer
+from maxwell.dma_copy_engine import *
+from maxwell.dma_copy_engine import _plan_fill
+
+import os
+import pytest
+import random
+
+MEMORY_SIZE = 12 << 20
+
+
+@pytest.fixture
+def memories(channel):
+    source = channel.create_gpu_memory(MEMORY_SIZE)
+    destination = channel.create_gpu_memory(MEMORY_SIZE)
+    data = os.urandom(MEMORY_SIZE)
+    source[0:MEMORY_SIZE] = data
+
+    yield (source, destination, data)
+
+    source.close()
+    destination.close()
+
+
+def _run(channel, command_buffer: CommandBuffer) -> None:
+    submitted = channel.submit_command(command_buffer)
+    submitted.wait()
+    submitted.close()
+
+
+@pytest.mark.parametrize(
+    ("size", "expected"),
+    [
+        (0, []),
+        (1, [(1, 1)]),
+        (MAX_LINEAR_COPY_SIZE, [(MAX_LINEAR_COPY_SIZE, 1)]),
+        (MAX_LINEAR_COPY_SIZE + 1, [(COPY_LINE_LENGTH, 2)]),
+        (MAX_LINEAR_COPY_SIZE + 2, [(COPY_LINE_LENGTH, 2), (1, 1)]),
+        ((5 << 20) + 3, [(COPY_LINE_LENGTH, 2), ((1 << 20) + 3, 1)]),
+        # A whole number of lines needs a single launch.
+        (1 << 30, [(COPY_LINE_LENGTH, 512)]),
+        ((1 << 30) + 0x1000, [(COPY_LINE_LENGTH, 512), (0x1000, 1)]),
+    ],
+)
+def test_plan_linear_copy(size, expected):
+    assert plan_linear_copy(size) == expected
+
+
+@pytest.mark.parametrize("size", [1 << 32, (5 << 30) + 7, (1 << 34) - 1])
+def test_plan_linear_copy_line_count_limit(size):
+    launches = plan_linear_copy(size)
+
+    assert sum(line_length * line_count for (line_length, line_count) in launches) == size
+
+    for (line_length, line_count) in launches:
+        assert line_count <= MAX_COPY_LINE_COUNT
+        assert line_count == 1 or line_length == COPY_LINE_LENGTH
+        assert line_count > 1 or line_length <= MAX_LINEAR_COPY_SIZE
+
+
+@pytest.mark.parametrize(
+    "size",
+    [1, 100, MAX_LINEAR_COPY_SIZE, MAX_LINEAR_COPY_SIZE + 1, MAX_LINEAR_COPY_SIZE + 2, 10 << 20],
+)
+def test_memcpy_device_to_device(channel, simulator, memories, size):
+    (source, destination, data) = memories
+
+    # Unaligned addresses on both sides.
+    command_buffer = CommandBuffer()
+    memcpy_device_to_device(
+        command_buffer, destination.gpu_address + 1, source.gpu_address + 2, size
+    )
+    _run(channel, command_buffer)
+
+    assert destination[1 : 1 + size] == data[2 : 2 + size]
+    assert destination[0:1] == b"\0"
+    assert destination[1 + size : 2 + size] == b"\0"
+    assert simulator.statistics.dma_count == len(plan_linear_copy(size))
+
+
+@pytest.mark.parametrize(
+    "pattern",
+    [
+        b"\xab",
+        b"\x01\x02",
+        b"\x01\x02\x03\x04",
+        bytes(range(8)),
+        bytes(range(16)),
+        bytes([1, 1, 1, 1, 2, 2, 2, 2, 3, 3, 3, 3, 1, 1, 1, 1]),
+    ],
+)
+@pytest.mark.parametrize(
+    ("offset", "size"),
+    [(0, 16), (3, 1), (5, 37), (16, 5 << 20), (7, (4 << 20) + 13)],
+)
+def test_memset_device(channel, memories, pattern, offset, size):
+    (_, destination, _) = memories
+    destination[0:MEMORY_SIZE] = bytes(MEMORY_SIZE)
+
+    command_buffer = CommandBuffer()
+    memset_device(command_buffer, destination.gpu_address + offset, size, pattern)
+    _run(channel, command_buffer)
+
+    expected = (pattern * (size // len(pattern) + 1))[:size]
+
+    assert destination[offset : offset + size] == expected
+    assert destination[offset + size : offset + size + 1] == b"\0"
+    assert offset == 0 or destination[offset - 1 : offset] == b"\0"
+
+
+def test_plan_fill_launches():
+    # Two distinct components fit the two constants, a multi-line body and 4 bytes tail pieces.
+    launches = _plan_fill(0x1000, (5 << 20) + 6, b"\x01\x02\x03\x04\x05\x06\x07\x08")
+
+    assert [(launch.line_count, launch.pitch) for launch in launches] == [
+        (2, COPY_LINE_LENGTH),
+        (1, 1 << 20),
+        (1, 4),
+        (1, 2),
+    ]
+    assert launches[0].line_length == COPY_LINE_LENGTH // FILL_ELEMENT_SIZE
+    assert launches[2].address == 0x1000 + (5 << 20)
+
+    # Four distinct components need two passes over the body.
+    assert len(_plan_fill(0, 0x100, bytes(range(16)))) == 2
+
+
+def test_plan_copy_list_coalesces():
+    copies = [(0x10000 + index * 0x100, 0x80000 + index * 0x40, 0x40) for index in range(16)]
+    # Contiguous in both source and destination, merged into a single line.
+    copies += [(0x40000 + index * 0x10, 0x90000 + index * 0x10, 0x10) for index in range(8)]
+
+    launches = plan_copy_list(reversed(copies))
+
+    assert len(launches) == 2
+    assert (launches[0].line_count, launches[0].pitch_in, launches[0].pitch_out) == (
+        16,
+        0x40,
+        0x100,
+    )
+    assert (launches[1].line_length, launches[1].line_count) == (0x80, 1)
+
+
+def test_memcpy_device_to_device_list(channel, simulator, memories):
+    (source, destination, data) = memories
+    destination[0:MEMORY_SIZE] = bytes(MEMORY_SIZE)
+    generator = random.Random(1)
+
+    # Strided rows, contiguous chunks, random pieces and one copy needing multiple launches.
+    copies = [
+        (destination.gpu_address + index * 0x100, source.gpu_address + 0x1000 + index * 100, 64)
+        for index in range(150)
+    ]
+    copies += [
+        (destination.gpu_address + 0x10000 + index * 32, source.gpu_address + 0x20000 + index * 32, 32)
+        for index in range(49)
+    ]
+    offset = 0x30000
+
+    for _ in range(50):
+        size = generator.randint(1, 300)
+        copies.append(
+            (
+                destination.gpu_address + offset,
+                source.gpu_address + generator.randint(0, 0x100000),
+                size,
+            )
+        )
+        offset += size + generator.randint(0, 10)
+
+    copies.append(
+        (destination.gpu_address + 0x100000, source.gpu_address + 0x100000, (5 << 20) + 1)
+    )
+    generator.shuffle(copies)
+
+    assert len(copies) == 250
+
+    launches = plan_copy_list(copies)
+
+    command_buffer = CommandBuffer()
+    memcpy_device_to_device_list(command_buffer, copies)
+    _run(channel, command_buffer)
+
+    for (dest_address, src_address, size) in copies:
+        dest_offset = dest_address - destination.gpu_address
+        src_offset = src_address - source.gpu_address
+
+        assert destination[dest_offset : dest_offset + size] == data[src_offset : src_offset + size]
+
+    assert simulator.statistics.dma_count == len(launches)
+    assert len(launches) < 60
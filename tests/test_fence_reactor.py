@@ -0,0 +1,82 @@
+from fence_reactor import FenceReactor
+from nvgpu import SubmittedCommandBuffer, SyncFence
+
+import os
+import pytest
+
+
+@pytest.fixture
+def reactor():
+    reactor = FenceReactor()
+
+    yield reactor
+
+    reactor.close()
+
+
+def _create_fence():
+    (read_fd, write_fd) = os.pipe()
+
+    return (SyncFence(read_fd), write_fd)
+
+
+def test_callbacks_run_once_signaled(reactor):
+    (fence, write_fd) = _create_fence()
+    signaled = list()
+
+    reactor.register(fence, signaled.append)
+    reactor.register(fence, signaled.append)
+
+    assert reactor.poll(0) == 0
+    assert reactor.pending_count == 1
+
+    os.write(write_fd, b"\0")
+
+    assert reactor.wait_all(1000)
+    assert signaled == [fence, fence]
+    assert fence.is_signaled
+
+    fence.close()
+    os.close(write_fd)
+
+
+def test_closed_fence_fails_its_future(reactor):
+    (fence, write_fd) = _create_fence()
+    future = reactor.watch(SubmittedCommandBuffer(None, fence))
+
+    # Closed elsewhere while registered.
+    os.write(write_fd, b"\0")
+    fence.close()
+
+    assert reactor.poll(0) == 0
+    assert reactor.pending_count == 0
+    assert isinstance(future.exception(0), Exception)
+
+    os.close(write_fd)
+
+
+def test_reused_fd_is_not_merged_with_a_closed_fence(reactor):
+    (old_fence, old_write_fd) = _create_fence()
+    old_future = reactor.watch(SubmittedCommandBuffer(None, old_fence))
+
+    os.write(old_write_fd, b"\0")
+    old_fd = old_fence.fd
+    old_fence.close()
+    os.close(old_write_fd)
+
+    # The next fds get reused by a new fence.
+    (new_fence, new_write_fd) = _create_fence()
+    assert new_fence.fd == old_fd
+
+    new_future = reactor.watch(SubmittedCommandBuffer(None, new_fence))
+
+    assert old_future.exception(0) is not None
+    assert not new_future.done()
+    assert reactor.pending_count == 1
+
+    os.write(new_write_fd, b"\0")
+
+    assert reactor.wait_all(1000)
+    assert new_future.result(0).fence is new_fence
+
+    os.close(new_write_fd)
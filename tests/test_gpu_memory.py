@@ -0,0 +1,98 @@
+from command_buffer import CommandBuffer
+from ctypes import addressof, c_char
+from maxwell.compute_engine import upload_constant_buffer
+from maxwell.dma_copy_engine import memcpy_device_to_device
+from nvgpu import NVMAP_CACHE_OP_WB
+
+import nvgpu
+import os
+import pytest
+
+MEMORY_SIZE = 0x4000
+
+
+@pytest.fixture
+def memory(channel):
+    memory = channel.create_gpu_memory(MEMORY_SIZE)
+    memory[0:MEMORY_SIZE] = bytes(MEMORY_SIZE)
+
+    yield memory
+
+    memory.close()
+
+
+def _run(channel, command_buffer: CommandBuffer) -> None:
+    submitted = channel.submit_command(command_buffer)
+    submitted.wait()
+    submitted.close()
+
+
+def _get_mapping_address(memory) -> int:
+    mapping_start = c_char.from_buffer(memory.mmap_instance)
+    address = addressof(mapping_start)
+    del mapping_start
+
+    return address
+
+
+def _read_from_gpu(channel, memory, offset: int, size: int) -> bytes:
+    # Go through the copy engine so the bytes are the ones seen by the GPU.
+    destination = MEMORY_SIZE // 2
+
+    command_buffer = CommandBuffer()
+    memcpy_device_to_device(
+        command_buffer,
+        memory.gpu_address + destination,
+        memory.gpu_address + offset,
+        size,
+    )
+    _run(channel, command_buffer)
+
+    return memory[destination : destination + size]
+
+
+@pytest.mark.parametrize(("offset", "size"), [(0, 4), (0x104, 0x3C), (0x1000, 0x800)])
+def test_write_flushes_written_range(channel, memory, offset, size):
+    emulator = nvgpu.get_ioctl_backend()
+    data = os.urandom(size)
+    emulator.cache_operations.clear()
+
+    memory.write(offset, data)
+
+    assert memory[0:offset] == bytes(offset)
+    assert memory[offset : offset + size] == data
+    assert memory[offset + size : MEMORY_SIZE // 2] == bytes(MEMORY_SIZE // 2 - offset - size)
+    assert emulator.cache_operations == [
+        (
+            memory.nvmap_handle,
+            _get_mapping_address(memory) + offset,
+            size,
+            NVMAP_CACHE_OP_WB,
+        )
+    ]
+    assert _read_from_gpu(channel, memory, offset, size) == data
+
+
+def test_upload_constant_buffer(channel, memory):
+    emulator = nvgpu.get_ioctl_backend()
+    data = os.urandom(0x140)
+    emulator.cache_operations.clear()
+
+    command_buffer = CommandBuffer()
+    address = upload_constant_buffer(command_buffer, memory, 0x200, data)
+
+    assert address == memory.gpu_address + 0x200
+    assert emulator.cache_operations == [
+        (
+            memory.nvmap_handle,
+            _get_mapping_address(memory) + 0x200,
+            len(data),
+            NVMAP_CACHE_OP_WB,
+        )
+    ]
+
+    # The cache invalidation is the only pushbuffer work.
+    _run(channel, command_buffer)
+
+    assert memory[0x200 : 0x200 + len(data)] == data
+    assert _read_from_gpu(channel, memory, 0x200, len(data)) == data
@@ -0,0 +1,63 @@
+from gpu_memory_allocator import GpuMemoryAllocator
+
+import pytest
+
+
+@pytest.fixture
+def allocator(channel):
+    allocator = GpuMemoryAllocator(channel, block_size=0x10000)
+
+    yield allocator
+
+    allocator.close()
+
+
+@pytest.mark.parametrize("size", [0x20, 0x800, 0x1000, 0x4000, 0x20000])
+def test_allocate_free_balances(allocator, size):
+    views = [allocator.allocate(size) for _ in range(8)]
+
+    assert allocator.get_statistics().allocation_count == 8
+
+    for view in views:
+        view.close()
+
+    statistics = allocator.get_statistics()
+
+    assert statistics.allocation_count == 0
+    assert statistics.requested_size == 0
+    assert statistics.used_size == 0
+
+
+def test_view_close_twice_is_noop(allocator):
+    view = allocator.allocate(0x100)
+    view.close()
+    view.close()
+
+    assert allocator.get_statistics().allocation_count == 0
+
+
+@pytest.mark.parametrize("size", [0x20, 0x800, 0x2000, 0x20000])
+def test_double_free_asserts(allocator, size):
+    view = allocator.allocate(size)
+    allocator.free(view)
+
+    with pytest.raises(AssertionError):
+        allocator.free(view)
+
+
+@pytest.mark.parametrize("size", [0x100, 0x2000])
+def test_double_free_of_a_copied_view_asserts(allocator, size):
+    from gpu_memory_allocator import GpuMemoryView
+
+    view = allocator.allocate(size)
+    copy = GpuMemoryView(
+        view.memory, view.offset, view.user_size, view.gpu_memory_size, allocator
+    )
+    view.close()
+
+    # The allocator itself must catch it, before the free lists get corrupted.
+    with pytest.raises(AssertionError):
+        allocator.free(copy)
+
+    other = allocator.allocate(size)
+    assert other.gpu_address == view.gpu_address
@@ -0,0 +1,31 @@
+from maxwell.gpu_profiler import GpuClockCorrelation
+
+import time
+
+
+class _FakeGpuCtrl(object):
+    """GPU clock running 1 ms behind the monotonic clock, CPU counter values are garbage"""
+
+    def __init__(self) -> None:
+        self.counts = list()
+
+    def get_cpu_time_correlation_info(self, count: int, source_id: int):
+        self.counts.append(count)
+
+        return [(0xDEADBEEF, time.monotonic_ns() - 1000000)] * count
+
+
+def test_clock_correlation_brackets_a_single_sample():
+    ctrl = _FakeGpuCtrl()
+    correlation = GpuClockCorrelation.measure(ctrl, round_count=4)
+
+    assert ctrl.counts == [1] * 4
+    assert abs(correlation.gpu_to_cpu_offset - 1000000) <= correlation.uncertainty
+    assert correlation.to_cpu_time(0) == correlation.gpu_to_cpu_offset
+
+
+def test_clock_correlation_with_the_emulator(channel):
+    correlation = GpuClockCorrelation.measure(channel.nvhost_gpu_ctrl)
+
+    # The emulated GPU timestamps are the monotonic clock.
+    assert abs(correlation.gpu_to_cpu_offset) <= correlation.uncertainty
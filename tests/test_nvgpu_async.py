@@ -0,0 +1,75 @@
+from command_buffer import CommandBuffer, InlineCommand
+from maxwell.hw.channel_gpfifo import NVB06F_NON_STALL_INTERRUPT
+from nvgpu import SyncFence, TegraGpuChannel
+from nvgpu_async import AsyncTegraGpuChannel
+
+import asyncio
+import os
+import pytest
+
+
+def _create_command_buffer(word_count: int) -> CommandBuffer:
+    command_buffer = CommandBuffer()
+
+    for _ in range(word_count):
+        command_buffer.write_u32(InlineCommand(NVB06F_NON_STALL_INTERRUPT, 0, 0))
+
+    return command_buffer
+
+
+def test_submit_waits_for_ring_space_on_the_loop(simulator):
+    channel = TegraGpuChannel(command_buffer_ring_size=0x1000)
+    ring = channel.command_buffer_ring
+
+    # Occupy most of the ring with a region whose fence only signals later.
+    (read_fd, write_fd) = os.pipe()
+    pending_fence = SyncFence(read_fd)
+    ring.commit(ring.try_allocate(0xE00), 0xE00, pending_fence)
+
+    async def run():
+        async_channel = AsyncTegraGpuChannel(channel)
+        loop = asyncio.get_running_loop()
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+
+            while True:
+                ticks += 1
+                await asyncio.sleep(0.001)
+
+        ticker_task = asyncio.ensure_future(ticker())
+        loop.call_later(0.05, os.write, write_fd, b"\0")
+
+        submitted = await async_channel.submit(_create_command_buffer(0x100))
+
+        ticker_task.cancel()
+        async_channel.close()
+
+        return (submitted, ticks)
+
+    (submitted, ticks) = asyncio.run(run())
+
+    assert pending_fence.is_signaled
+    assert submitted.fence.wait(0)
+    # The loop kept running while the ring was full.
+    assert ticks > 1
+
+    submitted.close()
+    os.close(write_fd)
+    channel.close()
+
+
+def test_submit_raises_on_ring_full_without_fence(simulator):
+    channel = TegraGpuChannel(command_buffer_ring_size=0x1000)
+    ring = channel.command_buffer_ring
+    ring.commit(ring.try_allocate(0xE00), 0xE00, None)
+
+    async def run():
+        await AsyncTegraGpuChannel(channel).submit(_create_command_buffer(0x100))
+
+    with pytest.raises(Exception, match="without fence"):
+        asyncio.run(run())
+
+    ring.in_flight.clear()
+    channel.close()
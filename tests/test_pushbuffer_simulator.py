@@ -0,0 +1,354 @@
+from array import array
+from command_buffer import *
+from maxwell.hw.channel_gpfifo import *
+from maxwell.hw.compute_b import *
+from maxwell.hw.compute_b_qmd import *
+from maxwell.hw.dma_copy_a import *
+from maxwell.compute_engine import create_qmdv0107, launch_jobs
+
+import os
+import pytest
+
+MEMORY_SIZE = 0x10000
+
+
+@pytest.fixture
+def memory(channel):
+    memory = channel.create_gpu_memory(MEMORY_SIZE)
+    memory[0:MEMORY_SIZE] = bytes(MEMORY_SIZE)
+
+    yield memory
+
+    memory.close()
+
+
+def _run(channel, command_buffer: CommandBuffer) -> None:
+    submitted = channel.submit_command(command_buffer)
+    submitted.wait()
+    submitted.close()
+
+
+def _gob_offset(x: int, y: int) -> int:
+    # Byte offset inside a single 64x8 GOB, made of 16x2 sectors.
+    return ((x % 64) // 32) * 256 + ((y % 8) // 2) * 64 + ((x % 32) // 16) * 32 + (y % 2) * 16 + x % 16
+
+
+def _write_inline_transfer(
+    command_buffer: CommandBuffer,
+    subchannel: int,
+    address: int,
+    line_length: int,
+    line_count: int,
+    data: bytes,
+    pitch: int = 0,
+    is_pitch: bool = True,
+) -> None:
+    command_buffer.write_method(
+        NVB1C0_LINE_LENGTH_IN,
+        subchannel,
+        [line_length, line_count, address >> 32, address & 0xFFFFFFFF, pitch],
+    )
+    command_buffer.write_method(
+        NVB1C0_LAUNCH_DMA,
+        subchannel,
+        [
+            NVB1C0_LAUNCH_DMA_DST_MEMORY_LAYOUT(
+                NVB1C0_LAUNCH_DMA_DST_MEMORY_LAYOUT_PITCH
+                if is_pitch
+                else NVB1C0_LAUNCH_DMA_DST_MEMORY_LAYOUT_BLOCKLINEAR
+            )
+        ],
+    )
+
+    padded = data + bytes(-len(data) % 4)
+
+    command_buffer.write_u32(
+        NonIncrCommand(NVB1C0_LOAD_INLINE_DATA, subchannel, len(padded) // 4)
+    )
+    command_buffer.write_bytes(padded)
+
+
+@pytest.mark.parametrize("subchannel", [SUBCHANNEL_ID_COMPUTE, SUBCHANNEL_ID_I2M])
+def test_inline_to_memory_pitch(channel, memory, subchannel):
+    data = bytes(range(1, 25))
+
+    command_buffer = CommandBuffer()
+    _write_inline_transfer(command_buffer, subchannel, memory.gpu_address + 0x100, 8, 3, data, 0x20)
+    _run(channel, command_buffer)
+
+    for line in range(3):
+        offset = 0x100 + line * 0x20
+
+        assert memory[offset : offset + 8] == data[line * 8 : line * 8 + 8]
+        assert memory[offset + 8 : offset + 0x20] == bytes(0x18)
+
+
+def test_inline_to_memory_block_linear(channel, memory):
+    # One GOB, every byte holds its linear index.
+    data = bytes(range(256)) * 2
+
+    command_buffer = CommandBuffer()
+    command_buffer.write_method(
+        NVB1C0_SET_DST_BLOCK_SIZE, SUBCHANNEL_ID_COMPUTE, [0, 64, 8, 1, 0, 0, 0]
+    )
+    _write_inline_transfer(
+        command_buffer, SUBCHANNEL_ID_COMPUTE, memory.gpu_address, 64, 8, data, is_pitch=False
+    )
+    _run(channel, command_buffer)
+
+    gob = memory[0:512]
+
+    for (x, y) in [(0, 0), (15, 0), (16, 0), (0, 1), (0, 2), (32, 0), (47, 5), (63, 7)]:
+        assert gob[_gob_offset(x, y)] == data[y * 64 + x]
+
+    assert _gob_offset(16, 0) == 32 and _gob_offset(0, 1) == 16 and _gob_offset(32, 0) == 256
+
+
+def _write_copy(
+    command_buffer: CommandBuffer,
+    dest_address: int,
+    src_address: int,
+    line_length: int,
+    line_count: int,
+    pitch_in: int,
+    pitch_out: int,
+    launch_flags: int = 0,
+    src_is_pitch: bool = True,
+    dst_is_pitch: bool = True,
+) -> None:
+    command_buffer.write_method(
+        NVB0B5_OFFSET_IN_UPPER,
+        SUBCHANNEL_ID_DMA,
+        [
+            src_address >> 32,
+            src_address & 0xFFFFFFFF,
+            dest_address >> 32,
+            dest_address & 0xFFFFFFFF,
+            pitch_in,
+            pitch_out,
+            line_length,
+            line_count,
+        ],
+    )
+    command_buffer.write_method(
+        NVB0B5_LAUNCH_DMA,
+        SUBCHANNEL_ID_DMA,
+        [
+            NVB0B5_LAUNCH_DMA_DATA_TRANSFER_TYPE(NVB0B5_LAUNCH_DMA_DATA_TRANSFER_TYPE_NON_PIPELINED)
+            | NVB0B5_LAUNCH_DMA_MULTI_LINE_ENABLE(NVB0B5_LAUNCH_DMA_MULTI_LINE_ENABLE_TRUE)
+            | NVB0B5_LAUNCH_DMA_SRC_MEMORY_LAYOUT(
+                NVB0B5_LAUNCH_DMA_SRC_MEMORY_LAYOUT_PITCH
+                if src_is_pitch
+                else NVB0B5_LAUNCH_DMA_SRC_MEMORY_LAYOUT_BLOCKLINEAR
+            )
+            | NVB0B5_LAUNCH_DMA_DST_MEMORY_LAYOUT(
+                NVB0B5_LAUNCH_DMA_DST_MEMORY_LAYOUT_PITCH
+                if dst_is_pitch
+                else NVB0B5_LAUNCH_DMA_DST_MEMORY_LAYOUT_BLOCKLINEAR
+            )
+            | launch_flags
+        ],
+    )
+
+
+def test_copy_engine_pitch(channel, memory, simulator):
+    source = os.urandom(0x200)
+    memory[0:0x200] = source
+
+    command_buffer = CommandBuffer()
+    _write_copy(command_buffer, memory.gpu_address + 0x1000, memory.gpu_address, 0x10, 4, 0x30, 0x50)
+    _run(channel, command_buffer)
+
+    for line in range(4):
+        offset = 0x1000 + line * 0x50
+
+        assert memory[offset : offset + 0x10] == source[line * 0x30 : line * 0x30 + 0x10]
+        assert memory[offset + 0x10 : offset + 0x50] == bytes(0x40)
+
+    assert simulator.statistics.dma_bytes == 0x40
+
+
+def test_copy_engine_pitch_to_block_linear_and_back(channel, memory):
+    source = bytes(range(256)) * 2
+    memory[0:512] = source
+
+    command_buffer = CommandBuffer()
+    # One GOB wide and high destination, no origin.
+    command_buffer.write_method(
+        NVB0B5_SET_DST_BLOCK_SIZE, SUBCHANNEL_ID_DMA, [0, 64, 8, 1, 0, 0]
+    )
+    command_buffer.write_method(
+        NVB0B5_SET_SRC_BLOCK_SIZE, SUBCHANNEL_ID_DMA, [0, 64, 8, 1, 0, 0]
+    )
+    _write_copy(command_buffer, memory.gpu_address + 0x1000, memory.gpu_address, 64, 8, 64, 0, dst_is_pitch=False)
+    _write_copy(command_buffer, memory.gpu_address + 0x2000, memory.gpu_address + 0x1000, 64, 8, 0, 64, src_is_pitch=False)
+    _run(channel, command_buffer)
+
+    gob = memory[0x1000:0x1200]
+
+    for (x, y) in [(0, 0), (16, 0), (0, 1), (33, 2), (63, 7)]:
+        assert gob[_gob_offset(x, y)] == source[y * 64 + x]
+
+    assert memory[0x2000:0x2200] == source
+
+
+def test_copy_engine_remap(channel, memory):
+    # Two 4 bytes components per source element.
+    source = array("I", [0x11111111, 0x22222222, 0x33333333, 0x44444444])
+    memory[0:16] = source.tobytes()
+    memory[0x1000:0x1018] = bytes([0xEE]) * 0x18
+
+    command_buffer = CommandBuffer()
+    command_buffer.write_method(
+        NVB0B5_SET_REMAP_CONST_A,
+        SUBCHANNEL_ID_DMA,
+        [
+            0xAAAAAAAA,
+            0xBBBBBBBB,
+            NVB0B5_SET_REMAP_COMPONENTS_DST_X(NVB0B5_SET_REMAP_COMPONENTS_DST_X_SRC_Y)
+            | NVB0B5_SET_REMAP_COMPONENTS_DST_Y(NVB0B5_SET_REMAP_COMPONENTS_DST_Y_CONST_A)
+            | NVB0B5_SET_REMAP_COMPONENTS_DST_Z(NVB0B5_SET_REMAP_COMPONENTS_DST_Z_NO_WRITE)
+            | NVB0B5_SET_REMAP_COMPONENTS_COMPONENT_SIZE(NVB0B5_SET_REMAP_COMPONENTS_COMPONENT_SIZE_FOUR)
+            | NVB0B5_SET_REMAP_COMPONENTS_NUM_SRC_COMPONENTS(NVB0B5_SET_REMAP_COMPONENTS_NUM_SRC_COMPONENTS_TWO)
+            | NVB0B5_SET_REMAP_COMPONENTS_NUM_DST_COMPONENTS(NVB0B5_SET_REMAP_COMPONENTS_NUM_DST_COMPONENTS_THREE),
+        ],
+    )
+    # Line length is in elements with remapping.
+    _write_copy(
+        command_buffer,
+        memory.gpu_address + 0x1000,
+        memory.gpu_address,
+        2,
+        1,
+        8,
+        12,
+        NVB0B5_LAUNCH_DMA_REMAP_ENABLE(NVB0B5_LAUNCH_DMA_REMAP_ENABLE_TRUE),
+    )
+    _run(channel, command_buffer)
+
+    assert list(array("I", memory[0x1000:0x1018])) == [
+        0x22222222,
+        0xAAAAAAAA,
+        0xEEEEEEEE,
+        0x44444444,
+        0xAAAAAAAA,
+        0xEEEEEEEE,
+    ]
+
+
+@pytest.mark.parametrize(
+    ("semaphore_type", "expected_size"),
+    [
+        (NVB0B5_LAUNCH_DMA_SEMAPHORE_TYPE_RELEASE_ONE_WORD_SEMAPHORE, 4),
+        (NVB0B5_LAUNCH_DMA_SEMAPHORE_TYPE_RELEASE_FOUR_WORD_SEMAPHORE, 16),
+    ],
+)
+def test_copy_engine_semaphore(channel, memory, semaphore_type, expected_size):
+    memory[0x100:0x120] = bytes([0xFF]) * 0x20
+
+    command_buffer = CommandBuffer()
+    command_buffer.write_method(
+        NVB0B5_SET_SEMAPHORE_A,
+        SUBCHANNEL_ID_DMA,
+        [memory.gpu_address >> 32, (memory.gpu_address + 0x100) & 0xFFFFFFFF, 0x12345678],
+    )
+    command_buffer.write_method(
+        NVB0B5_LAUNCH_DMA,
+        SUBCHANNEL_ID_DMA,
+        [
+            NVB0B5_LAUNCH_DMA_DATA_TRANSFER_TYPE(NVB0B5_LAUNCH_DMA_DATA_TRANSFER_TYPE_NONE)
+            | NVB0B5_LAUNCH_DMA_SEMAPHORE_TYPE(semaphore_type)
+        ],
+    )
+    _run(channel, command_buffer)
+
+    words = array("I", memory[0x100:0x120])
+
+    assert words[0] == 0x12345678
+    assert memory[0x100 + expected_size : 0x120] == bytes([0xFF]) * (0x20 - expected_size)
+
+    if expected_size == 16:
+        assert words[1] == 0
+        assert words[2] | words[3] << 32 != 0
+
+
+def test_compute_report_semaphore(channel, memory):
+    address = memory.gpu_address + 0x200
+
+    command_buffer = CommandBuffer()
+    command_buffer.write_method(
+        NVB1C0_SET_REPORT_SEMAPHORE_A,
+        SUBCHANNEL_ID_COMPUTE,
+        [
+            address >> 32,
+            address & 0xFFFFFFFF,
+            0xCAFE,
+            NVB1C0_SET_REPORT_SEMAPHORE_D_OPERATION(NVB1C0_SET_REPORT_SEMAPHORE_D_OPERATION_RELEASE)
+            | NVB1C0_SET_REPORT_SEMAPHORE_D_STRUCTURE_SIZE(
+                NVB1C0_SET_REPORT_SEMAPHORE_D_STRUCTURE_SIZE_ONE_WORD
+            ),
+        ],
+    )
+    _run(channel, command_buffer)
+
+    assert array("I", memory[0x200:0x208]).tolist() == [0xCAFE, 0]
+
+
+def test_qmd_release_reduction(channel, memory, simulator):
+    address = memory.gpu_address + 0x300
+    memory[0x300:0x304] = array("I", [10]).tobytes()
+
+    job = create_qmdv0107()
+    job.semaphore_release_enable0 = NVB1C0_QMDV01_07_SEMAPHORE_RELEASE_ENABLE0_TRUE
+    job.release0_address_lower = address & 0xFFFFFFFF
+    job.release0_address_upper = address >> 32
+    job.release0_payload = 5
+    job.release0_reduction_enable = NVB1C0_QMDV01_07_RELEASE0_REDUCTION_ENABLE_TRUE
+    job.release0_reduction_op = NVB1C0_QMDV01_07_RELEASE0_REDUCTION_OP_RED_ADD
+    memory[0x1000:0x1100] = bytes(job)
+
+    command_buffer = CommandBuffer()
+    launch_jobs(command_buffer, memory.gpu_address + 0x1000, 2)
+    _run(channel, command_buffer)
+
+    assert len(simulator.dispatches) == 2
+    assert array("I", memory[0x300:0x304])[0] == 15
+
+
+def _write_host_semaphore(
+    command_buffer: CommandBuffer, address: int, payload: int, operation: int
+) -> None:
+    command_buffer.write_method(
+        NVB06F_SEMAPHOREA,
+        SUBCHANNEL_ID_COMPUTE,
+        [
+            NVB06F_SEMAPHOREA_OFFSET_UPPER(address >> 32),
+            NVB06F_SEMAPHOREB_OFFSET_LOWER((address & 0xFFFFFFFF) >> 2),
+            payload,
+            NVB06F_SEMAPHORED_OPERATION(operation)
+            | NVB06F_SEMAPHORED_RELEASE_SIZE(NVB06F_SEMAPHORED_RELEASE_SIZE_4BYTE),
+        ],
+    )
+
+
+def test_host_semaphore_release_and_acquire(channel, memory):
+    address = memory.gpu_address + 0x400
+
+    command_buffer = CommandBuffer()
+    _write_host_semaphore(command_buffer, address, 5, NVB06F_SEMAPHORED_OPERATION_RELEASE)
+    _write_host_semaphore(command_buffer, address, 5, NVB06F_SEMAPHORED_OPERATION_ACQUIRE)
+    _write_host_semaphore(command_buffer, address, 3, NVB06F_SEMAPHORED_OPERATION_ACQ_GEQ)
+    _run(channel, command_buffer)
+
+    assert array("I", memory[0x400:0x408]).tolist() == [5, 0]
+
+
+@pytest.mark.parametrize(
+    "operation", [NVB06F_SEMAPHORED_OPERATION_ACQUIRE, NVB06F_SEMAPHORED_OPERATION_ACQ_GEQ]
+)
+def test_host_semaphore_acquire_never_released(channel, memory, operation):
+    command_buffer = CommandBuffer()
+    _write_host_semaphore(command_buffer, memory.gpu_address + 0x400, 1, operation)
+
+    with pytest.raises(Exception, match="never completes"):
+        _run(channel, command_buffer)
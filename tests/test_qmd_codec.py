@@ -0,0 +1,141 @@
+from array import array
+from maxwell.qmd_codec import *
+
+import numpy as np
+import pytest
+import random
+import typing
+
+CODECS = [QMDV0006_CODEC, QMDV0107_CODEC]
+
+
+def _random_values(codec: QmdCodec, seed: int) -> typing.Dict[str, int]:
+    generator = random.Random(seed)
+
+    return {
+        name: generator.getrandbits(size) for (name, (_, size)) in codec.fields.items()
+    }
+
+
+def _create_reference(codec: QmdCodec, values: typing.Dict[str, int]) -> bytes:
+    job = codec.qmd_type()
+
+    for (name, value) in values.items():
+        setattr(job, name, value)
+
+    return bytes(job)
+
+
+@pytest.mark.parametrize("codec", CODECS)
+def test_validate(codec):
+    codec.validate()
+    codec.validate_structure()
+
+    assert set(codec.fields) == {name for (name, _, _) in codec.qmd_type._fields_}
+
+
+def test_validate_rejects_overlap():
+    with pytest.raises(Exception):
+        QmdCodec(qmdv0107, {"a": (0, 8), "b": (4, 8)}).validate()
+
+    with pytest.raises(Exception):
+        QmdCodec(qmdv0107, {"a": (QMD_SIZE_IN_BITS - 4, 8)}).validate()
+
+
+@pytest.mark.parametrize("codec", CODECS)
+@pytest.mark.parametrize("seed", range(4))
+def test_pack_matches_structure(codec, seed):
+    values = _random_values(codec, seed)
+    expected = _create_reference(codec, values)
+
+    assert bytes(codec.pack(values)) == expected
+    assert codec.unpack(expected) == values
+
+
+@pytest.mark.parametrize("codec", CODECS)
+def test_pack_keeps_base(codec):
+    base = _create_reference(codec, _random_values(codec, 10))
+    values = _random_values(codec, 11)
+    names = list(values)[::3]
+    changed = {name: values[name] for name in names}
+
+    expected = codec.qmd_type.from_buffer_copy(base)
+
+    for (name, value) in changed.items():
+        setattr(expected, name, value)
+
+    assert bytes(codec.pack(changed, base)) == bytes(expected)
+
+
+@pytest.mark.parametrize("codec", CODECS)
+@pytest.mark.parametrize("seed", range(4))
+def test_compiled_packer_matches_structure(codec, seed):
+    values = _random_values(codec, seed)
+    names = list(values)
+    random.Random(seed).shuffle(names)
+
+    # Start from garbage to check that every touched bit is overwritten.
+    base = _create_reference(codec, _random_values(codec, seed + 100))
+    words = array("I", base)
+    codec.compile_packer(names)(words, *(values[name] for name in names))
+
+    assert words.tobytes() == _create_reference(codec, values)
+    assert codec.compile_unpacker(names)(words) == tuple(values[name] for name in names)
+
+
+@pytest.mark.parametrize("codec", CODECS)
+def test_compiled_packer_subset(codec):
+    base = _create_reference(codec, _random_values(codec, 20))
+    values = _random_values(codec, 21)
+    names = list(values)[1::4]
+
+    words = array("I", base)
+    codec.compile_packer(names)(words, *(values[name] for name in names))
+
+    expected = codec.qmd_type.from_buffer_copy(base)
+
+    for name in names:
+        setattr(expected, name, values[name])
+
+    assert words.tobytes() == bytes(expected)
+
+
+@pytest.mark.parametrize("codec", CODECS)
+def test_pack_batch_matches_structure(codec):
+    count = 5
+    rows = [_random_values(codec, seed) for seed in range(count)]
+    columns = {
+        name: np.array([row[name] for row in rows], dtype=np.uint64)
+        for name in codec.fields
+    }
+
+    packed = codec.pack_batch(columns)
+
+    assert packed.shape == (count, QMD_SIZE_IN_WORDS)
+
+    for (index, row) in enumerate(rows):
+        assert packed[index].tobytes() == _create_reference(codec, row)
+
+    unpacked = codec.unpack_batch(packed.tobytes())
+
+    for name in codec.fields:
+        assert unpacked[name].tolist() == columns[name].tolist()
+
+
+@pytest.mark.parametrize("codec", CODECS)
+def test_pack_batch_broadcasts_scalars(codec):
+    base_values = _random_values(codec, 30)
+    base = _create_reference(codec, base_values)
+    (first, second) = list(codec.fields)[:2]
+    first_size = codec.fields[first][1]
+
+    packed = codec.pack_batch(
+        {first: np.arange(3) & ((1 << first_size) - 1), second: 0}, base=base
+    )
+
+    for index in range(3):
+        expected = codec.qmd_type.from_buffer_copy(base)
+        setattr(expected, first, index & ((1 << first_size) - 1))
+        setattr(expected, second, 0)
+
+        assert packed[index].tobytes() == bytes(expected)
@@ -0,0 +1,189 @@
+from command_buffer import CommandBuffer, DecodeCommand
+from maxwell.hw.compute_b import NVB1C0_INVALIDATE_SHADER_CACHES
+from maxwell.shader_program_region import *
+
+import os
+import pytest
+
+PROGRAM_SIZE = 0x400
+
+
+@pytest.fixture
+def region(channel):
+    memory = channel.create_gpu_memory(0x1000)
+
+    yield ShaderProgramRegion(memory)
+
+    memory.close()
+
+
+def _create_fence(signaled: bool):
+    (read_fd, write_fd) = os.pipe()
+
+    if signaled:
+        os.write(write_fd, b"\0")
+
+    return (SyncFence(read_fd), write_fd)
+
+
+def _count_invalidates(command_buffer: CommandBuffer) -> int:
+    words = memoryview(command_buffer.buffer).cast("I")
+
+    return sum(
+        1 for word in words if DecodeCommand(word)[0] == NVB1C0_INVALIDATE_SHADER_CACHES
+    )
+
+
+def _create_code(index: int, size: int = PROGRAM_SIZE) -> bytes:
+    return bytes([index + 1]) * size
+
+
+def _submit(region: ShaderProgramRegion) -> int:
+    (fence, write_fd) = _create_fence(True)
+    region.attach_fence(fence)
+
+    return write_fd
+
+
+def test_identical_code_is_uploaded_once(region):
+    command_buffer = CommandBuffer()
+
+    first = region.upload(command_buffer, _create_code(0))
+    second = region.upload(command_buffer, _create_code(1))
+
+    assert region.upload(command_buffer, _create_code(0)) == first
+    assert region.upload(command_buffer, bytearray(_create_code(1))) == second
+    assert first != second
+    assert len(region.programs) == 2
+    assert region.memory[first : first + PROGRAM_SIZE] == _create_code(0)
+    assert region.memory[second : second + PROGRAM_SIZE] == _create_code(1)
+
+
+def test_one_instruction_cache_invalidate_per_submission(region):
+    command_buffer = CommandBuffer()
+
+    region.upload(command_buffer, _create_code(0))
+    region.upload(command_buffer, _create_code(1))
+    region.upload(command_buffer, _create_code(0))
+
+    assert _count_invalidates(command_buffer) == 1
+
+    # Resident code doesn't need one, new code in the next submission does.
+    write_fds = [_submit(region)]
+    command_buffer = CommandBuffer()
+    region.upload(command_buffer, _create_code(1))
+
+    assert _count_invalidates(command_buffer) == 0
+
+    region.upload(command_buffer, _create_code(2))
+
+    assert _count_invalidates(command_buffer) == 1
+
+    # Another command buffer of the same submission gets its own.
+    other_command_buffer = CommandBuffer()
+    region.upload(other_command_buffer, _create_code(3))
+
+    assert _count_invalidates(other_command_buffer) == 1
+
+    write_fds.append(_submit(region))
+
+    for write_fd in write_fds:
+        os.close(write_fd)
+
+
+def test_least_recently_used_program_is_evicted(region):
+    slot_count = region.memory.gpu_memory_size // PROGRAM_SIZE
+    command_buffer = CommandBuffer()
+
+    offsets = [
+        region.upload(command_buffer, _create_code(index)) for index in range(slot_count)
+    ]
+
+    # Touch the first program, the second one becomes the least recently used.
+    region.upload(command_buffer, _create_code(0))
+    write_fd = _submit(region)
+
+    command_buffer = CommandBuffer()
+
+    assert region.upload(command_buffer, _create_code(slot_count)) == offsets[1]
+    assert region.memory[offsets[1] : offsets[1] + PROGRAM_SIZE] == _create_code(slot_count)
+    assert region.upload(command_buffer, _create_code(0)) == offsets[0]
+    assert len(region.programs) == slot_count
+
+    os.close(write_fd)
+
+
+def test_freed_ranges_are_coalesced_and_reused_first_fit(region):
+    slot_count = region.memory.gpu_memory_size // PROGRAM_SIZE
+
+    assert slot_count >= 4
+
+    command_buffer = CommandBuffer()
+
+    for index in range(slot_count):
+        region.upload(command_buffer, _create_code(index))
+
+    write_fd = _submit(region)
+
+    # Keep the last programs alive, the next upload needs the two oldest adjacent slots.
+    command_buffer = CommandBuffer()
+
+    for index in range(2, slot_count):
+        region.upload(command_buffer, _create_code(index))
+
+    assert region.upload(command_buffer, _create_code(slot_count, PROGRAM_SIZE * 2)) == 0
+    assert region.free_ranges == []
+
+    for write_fd in [write_fd, _submit(region)]:
+        os.close(write_fd)
+
+
+def test_free_ranges_coalesce(region):
+    size = region.memory.gpu_memory_size
+
+    assert region._allocate(size) == 0
+
+    region._free(0, PROGRAM_SIZE)
+    region._free(PROGRAM_SIZE * 2, PROGRAM_SIZE)
+
+    assert region.free_ranges == [(0, PROGRAM_SIZE), (PROGRAM_SIZE * 2, PROGRAM_SIZE)]
+
+    # A request too big for the first range skips it.
+    assert region._allocate(PROGRAM_SIZE * 2) is None
+    assert region._allocate(0x100) == 0
+
+    region._free(PROGRAM_SIZE, PROGRAM_SIZE)
+    region._free(0, 0x100)
+
+    assert region.free_ranges == [(0, PROGRAM_SIZE * 3)]
+    assert region._allocate(PROGRAM_SIZE * 2) == 0
+    assert region.free_ranges == [(PROGRAM_SIZE * 2, PROGRAM_SIZE)]
+
+
+def test_pending_programs_are_not_evicted(region):
+    slot_count = region.memory.gpu_memory_size // PROGRAM_SIZE
+    command_buffer = CommandBuffer()
+
+    for index in range(slot_count):
+        region.upload(command_buffer, _create_code(index))
+
+    with pytest.raises(Exception, match="unsubmitted"):
+        region.upload(command_buffer, _create_code(slot_count))
+
+
+def test_eviction_waits_for_the_program_fence(region):
+    slot_count = region.memory.gpu_memory_size // PROGRAM_SIZE
+    command_buffer = CommandBuffer()
+
+    for index in range(slot_count):
+        region.upload(command_buffer, _create_code(index))
+
+    (fence, write_fd) = _create_fence(False)
+    region.attach_fence(fence)
+
+    os.write(write_fd, b"\0")
+    region.upload(CommandBuffer(), _create_code(slot_count))
+
+    assert fence.is_signaled
+
+    os.close(write_fd)
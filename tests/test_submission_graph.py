@@ -0,0 +1,99 @@
+from command_buffer import CommandBuffer, InlineCommand
+from maxwell.hw.channel_gpfifo import NVB06F_NON_STALL_INTERRUPT
+from nvgpu import TegraGpuChannel
+from submission_graph import SubmissionGraph
+
+import pytest
+
+
+def _create_command_buffer(word_count: int) -> CommandBuffer:
+    command_buffer = CommandBuffer()
+
+    for _ in range(word_count):
+        command_buffer.write_u32(InlineCommand(NVB06F_NON_STALL_INTERRUPT, 0, 0))
+
+    return command_buffer
+
+
+@pytest.fixture
+def small_ring_channel(simulator):
+    channel = TegraGpuChannel(command_buffer_ring_size=0x1000)
+
+    yield channel
+
+    channel.close()
+
+
+def test_dependencies_are_all_submitted(channel):
+    graph = SubmissionGraph()
+    first = graph.add(_create_command_buffer(4))
+    second = graph.add(_create_command_buffer(4), [first])
+    graph.add(_create_command_buffer(4), [first, second], signal=True)
+
+    submitted = graph.submit(channel)
+
+    assert len(submitted) == 3
+
+    for submitted_command_buffer in submitted:
+        assert submitted_command_buffer.wait()
+
+    graph.close()
+
+
+def test_unfenced_batches_do_not_exhaust_the_ring(small_ring_channel):
+    external = small_ring_channel.submit_command(_create_command_buffer(1))
+    external.wait()
+
+    # Every external wait splits the graph in a batch submitted without fence.
+    graph = SubmissionGraph()
+
+    for _ in range(32):
+        graph.add(_create_command_buffer(0x80), external_waits=[external])
+
+    submitted = graph.submit(small_ring_channel)
+
+    for submitted_command_buffer in submitted:
+        assert submitted_command_buffer.wait()
+
+    # Some of the splits needed a fence to keep going.
+    assert len(set(id(item.fence) for item in submitted)) > 1
+
+    graph.close()
+    external.close()
+
+
+def test_wait_for_idle_is_a_separate_entry(channel, simulator):
+    graph = SubmissionGraph()
+    first = graph.add(_create_command_buffer(4))
+    second_command_buffer = _create_command_buffer(4)
+    graph.add(second_command_buffer, [first])
+
+    entry_count = simulator.statistics.entry_count
+    submitted = graph.submit(channel)
+
+    for submitted_command_buffer in submitted:
+        assert submitted_command_buffer.wait()
+
+    # Both nodes and the WFI between them, the command buffer of the node isn't copied.
+    assert simulator.statistics.entry_count - entry_count == 3
+    assert len(second_command_buffer) == 16
+
+    graph.close()
+
+
+def test_dedicated_wait_for_idle_memory_is_released(small_ring_channel):
+    # Too big for the ring, the whole batch (the WFI included) goes to dedicated memory.
+    graph = SubmissionGraph()
+    first = graph.add(_create_command_buffer(4))
+    graph.add(_create_command_buffer(0x800), [first])
+    submitted = graph.submit(small_ring_channel)
+
+    assert submitted[1].gpu_memory is not None
+    assert len(graph.internal_memories) == 1
+
+    graph.close()
+
+    assert len(graph.internal_memories) == 0
+
+    for submitted_command_buffer in submitted:
+        submitted_command_buffer.close()